@@ -0,0 +1,150 @@
+"""Índice de assessores por aba: opções do filtro e linhas de cada assessor."""
+import numpy as np
+import pandas as pd
+
+from columns import find_column, normalize
+
+
+class AdvisorIndex:
+    """Linhas de cada assessor em uma aba, calculadas uma única vez.
+
+    ``options`` são os nomes em ordem alfabética e ``names`` na ordem em que
+    aparecem na aba (sem vazios). ``rows(nome)`` devolve as linhas do assessor
+    sem varrer a coluna: os nomes são comparados normalizados
+    (``columns.normalize``), então 'João ' e 'joao' são o mesmo assessor.
+    ``groups()`` dá as posições de todos, pelo nome normalizado, na ordem de
+    ``names``.
+    """
+
+    def __init__(self, df, column):
+        self.df = df
+        self.column = column
+        self.names = []
+        self._positions = {}
+        if column is None:
+            self.options = []
+            return
+        groups = {}
+        for pos, value in enumerate(df[column].tolist()):
+            if not isinstance(value, str) and pd.isna(value):
+                continue
+            name = str(value).strip()
+            if not name:
+                continue
+            key = normalize(name)
+            if key not in groups:
+                groups[key] = []
+                self.names.append(name)
+            groups[key].append(pos)
+        self._positions = {key: np.array(pos, dtype=np.intp) for key, pos in groups.items()}
+        self.options = sorted(self.names)
+
+    def groups(self):
+        """Nome normalizado -> posições das linhas do assessor (não alterar)"""
+        return self._positions
+
+    def positions(self, name):
+        return self._positions.get(normalize(str(name).strip()), np.array([], dtype=np.intp))
+
+    def rows(self, name):
+        """Linhas do assessor (DataFrame vazio se não existir)"""
+        return self.df.iloc[self.positions(name)]
+
+
+def build_advisor_index(df, terms='Assessor'):
+    """``AdvisorIndex`` da aba, usando a primeira coluna que contém ``terms``"""
+    return AdvisorIndex(df, find_column(df, terms))
+
+
+def prepare_captacao(df):
+    """Aba 'captação liq' sem as linhas vazias do começo e com nomes de coluna limpos"""
+    df = df.rename(columns=str.strip)
+    return df[df.iloc[:, 0].notna()].reset_index(drop=True)
+
+
+def build_captacao_index(df):
+    """``AdvisorIndex`` sobre a aba 'captação liq' já preparada (``index.df``)"""
+    return build_advisor_index(prepare_captacao(df), 'Assessor')
+
+
+# Abas que entram na tabela única de assessores (aba -> termo da coluna do
+# assessor); a primeira é a lista de referência dos nomes
+FACT_SHEETS = {
+    'assessores': 'Assessores',
+    'captação liq': 'Assessor',
+    'Pipeline - Assessor': 'Assessor',
+    'missões': 'Assessor',
+    'missões 2.0': 'Assessor',
+    'Hot Money': 'Assessor',
+    'consórcios': 'Assessor',
+    'seguros': 'Assessor',
+    'advisor - geral': 'Assessor',
+}
+
+
+class AdvisorFacts:
+    """Uma linha por assessor com os números de todas as abas.
+
+    ``table`` é indexada pelo nome normalizado; a coluna 'Assessor' traz o
+    nome como aparece na planilha e as demais são '<aba> · <coluna>' (somas
+    das colunas numéricas) e '<aba> · linhas'. ``unmatched`` lista os nomes
+    que aparecem em alguma aba mas não na aba de referência.
+    """
+
+    def __init__(self, table, unmatched, sheets):
+        self.table = table
+        self.unmatched = unmatched
+        self.sheets = sheets
+
+    def row(self, name):
+        """Números do assessor (Series vazia se não existir)"""
+        key = normalize(str(name).strip())
+        if key not in self.table.index:
+            return pd.Series(dtype=object)
+        return self.table.loc[key]
+
+
+def _sheet_facts(sheet, index):
+    df = index.df
+    keys = np.full(len(df), None, dtype=object)
+    for key, pos in index.groups().items():
+        keys[pos] = key
+    numeric = [c for c in df.columns
+               if c != index.column
+               and pd.api.types.is_numeric_dtype(df[c].dtype)
+               and not pd.api.types.is_bool_dtype(df[c].dtype)]
+    grouped = df[numeric].groupby(keys, sort=False).sum(min_count=1)
+    grouped.columns = [f'{sheet} · {c}' for c in numeric]
+    grouped[f'{sheet} · linhas'] = pd.Series(keys).value_counts()
+    return grouped
+
+
+def build_advisor_facts(sheets):
+    """Monta a ``AdvisorFacts`` de um ``ingest.LazyWorkbook`` (lê as abas da lista)"""
+    frames, names, unmatched, used = [], {}, [], []
+    reference = None
+    for sheet, term in FACT_SHEETS.items():
+        if sheet not in sheets:
+            continue
+        if sheet == 'captação liq':
+            index = sheets.derived(sheet, build_captacao_index)
+        else:
+            index = sheets.derived(sheet, build_advisor_index, term)
+        if index.column is None:
+            continue
+        used.append(sheet)
+        keys = {normalize(name): name for name in index.names}
+        if reference is None:
+            reference = set(keys)
+        else:
+            unmatched += [{'aba': sheet, 'assessor': name} for key, name in keys.items() if key not in reference]
+        for key, name in keys.items():
+            names.setdefault(key, name)
+        frames.append(_sheet_facts(sheet, index))
+
+    if not frames:
+        return AdvisorFacts(pd.DataFrame(columns=['Assessor']), unmatched, used)
+    table = pd.concat(frames, axis=1, sort=False)
+    table.insert(0, 'Assessor', [names[key] for key in table.index])
+    table.index.name = 'chave'
+    return AdvisorFacts(table, unmatched, used)
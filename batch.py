@@ -0,0 +1,115 @@
+"""Calcula os indicadores de uma pasta de planilhas, sem Streamlit.
+
+Uso (relatório noturno de vários escritórios)::
+
+    python batch.py planilhas/ -o kpis.json
+    python batch.py planilhas/ -o kpis.parquet --workers 8
+    python batch.py --cache planilhas/ -o kpis.json  # com o cache em disco do dashboard
+
+Cada arquivo é lido em um processo do pool; a saída tem uma linha por
+arquivo com os indicadores de ``metrics.compute_kpis`` (ou a mensagem de
+erro, se o arquivo não pôde ser lido).
+"""
+import argparse
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from ingest import LazyWorkbook
+from metrics import compute_kpis
+from workbook_cache import CACHE_DIR, DiskCache
+
+
+def process_file(path, cache_dir=None):
+    """Indicadores de um arquivo, num dict (roda dentro do processo do pool)"""
+    start = time.perf_counter()
+    row = {'arquivo': os.path.basename(path)}
+    try:
+        cache = DiskCache(cache_dir) if cache_dir else None
+        sheets = LazyWorkbook(path, cache=cache)
+        row.update(compute_kpis(sheets))
+        row['abas_com_erro'] = dict(sheets.errors)
+        row['erro'] = None
+    except Exception as e:
+        row['erro'] = str(e)
+    row['segundos'] = round(time.perf_counter() - start, 3)
+    return row
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def _missing(value):
+    return value is None or (isinstance(value, float) and np.isnan(value))
+
+
+def _is_number(value):
+    return isinstance(value, (int, float, np.number)) and not isinstance(value, (bool, np.bool_))
+
+
+def _fixed_type(values):
+    """Coluna com um tipo só para o Parquet: número (float) ou texto.
+
+    O mesmo indicador pode vir número num arquivo e texto em outro (ex.:
+    'pace' preenchido à mão); aí a coluna inteira vira texto. Listas e dicts
+    viram texto JSON.
+    """
+    present = [v for v in values if not _missing(v)]
+    if all(_is_number(v) for v in present):
+        return pd.to_numeric(values).astype(float)
+    if all(isinstance(v, (bool, np.bool_)) for v in present):
+        return values.astype('boolean')
+    texts = [None if _missing(v)
+             else json.dumps(v, ensure_ascii=False, default=_json_default) if isinstance(v, (list, dict))
+             else str(v)
+             for v in values]
+    return pd.Series(texts, index=values.index, dtype='str')
+
+
+def write_output(rows, output):
+    if output.endswith('.parquet'):
+        df = pd.DataFrame(rows)
+        for col in df.columns:
+            df[col] = _fixed_type(df[col])
+        df.to_parquet(output, index=False)
+    else:
+        with open(output, 'w', encoding='utf-8') as fh:
+            json.dump(rows, fh, ensure_ascii=False, indent=2, default=_json_default)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Indicadores de todas as planilhas de uma pasta")
+    parser.add_argument('pasta', help="pasta com os arquivos .xlsx/.xls")
+    parser.add_argument('-o', '--output', default='kpis.json', help="arquivo de saída (.json ou .parquet)")
+    parser.add_argument('--pattern', default='*.xls*', help="padrão dos arquivos (padrão: *.xls*)")
+    parser.add_argument('--workers', type=int, default=None, help="processos em paralelo (padrão: nº de CPUs)")
+    parser.add_argument('--cache', action='store_true', help="usa o cache em disco do dashboard")
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help="pasta do cache em disco (padrão: a do dashboard)")
+    args = parser.parse_args(argv)
+
+    paths = sorted(p for p in glob.glob(os.path.join(args.pasta, args.pattern))
+                   if not os.path.basename(p).startswith('~$'))
+    if not paths:
+        parser.error(f"nenhum arquivo '{args.pattern}' em {args.pasta}")
+
+    cache_dir = args.cache_dir if args.cache else None
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        rows = list(pool.map(process_file, paths, [cache_dir] * len(paths)))
+    write_output(rows, args.output)
+
+    falhas = sum(1 for row in rows if row['erro'])
+    print(f"{len(rows)} arquivo(s), {falhas} com erro, em {time.perf_counter() - start:.1f} s -> {args.output}")
+    return 1 if falhas else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,178 @@
+"""Benchmark do dashboard com planilha sintética (generate_workbook.py).
+
+Uso: python benchmarks/bench_app.py [--advisors 30] [--rows N] [--repeat 10]
+                                    [--tolerance 1.0] [--update-baseline]
+
+Mede a leitura (o que o load_excel faz, com e sem cache em disco), o
+display_data_table, o find_column e a renderização completa de cada aba
+pelo AppTest do Streamlit. Compara o menor tempo de cada medida com
+benchmarks/baseline.json e termina com erro se alguma passar do baseline
+mais a tolerância (1.0 = duas vezes mais lenta; a renderização pelo AppTest
+varia bastante entre execuções; cada medida repete até somar ``MIN_TOTAL``).
+O baseline vale para a máquina em que foi gravado: ``--update-baseline``
+grava as medidas atuais como novo baseline.
+"""
+import argparse
+import ast
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from generate_workbook import generate_workbook  # noqa: E402
+
+DASH = os.path.join(ROOT, 'dash.py')
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+TABS = ["Visão Geral", "Consórcios", "Seguros", "Advisor", "Time Comercial",
+        "Comercial - Pipeline", "Captação Liq", "Campanha - Hot Money", "Histórico"]
+FIND_TERMS = ['Assessor', 'Assessores', 'Objetivo Cap Liq', 'Captação Líquida', 'Cap x Objetivo',
+              'Ativações', 'Habilitações', 'Posição', 'Range', 'não existe']
+
+
+# Medidas rápidas repetem até somar pelo menos isto, em segundos: o mínimo
+# de 10 execuções de 1 ms ainda varia muito
+MIN_TOTAL = 0.5
+
+
+def timed(fn, repeat):
+    """Menor tempo de ``repeat`` execuções (ou mais, até ``MIN_TOTAL``), em segundos"""
+    times = []
+    while len(times) < repeat or sum(times) < MIN_TOTAL:
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def dash_functions(*names):
+    """Funções do dash.py sem rodar o script (só os imports e as definições)"""
+    tree = ast.parse(open(DASH, encoding='utf-8').read())
+    body = [node for node in tree.body
+            if isinstance(node, (ast.Import, ast.ImportFrom))
+            or (isinstance(node, ast.FunctionDef) and node.name in names)]
+    namespace = {}
+    exec(compile(ast.Module(body=body, type_ignores=[]), DASH, 'exec'), namespace)
+    return [namespace[name] for name in names]
+
+
+def bench_library(data, repeat):
+    from columns import find_column
+    from ingest import LazyWorkbook
+    from workbook_cache import DiskCache
+
+    results = {}
+
+    def load(cache=None):
+        sheets = LazyWorkbook(data, cache=cache)
+        for name in sheets:
+            sheets[name]
+        return sheets
+
+    results['load_excel (sem cache)'] = timed(load, repeat)
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = DiskCache(tmp)
+        load(cache)
+        results['load_excel (cache em disco)'] = timed(lambda: load(cache), repeat)
+
+    sheets = load()
+    display_data_table = dash_functions('display_data_table', 'safe_get_columns', 'table_page',
+                                        'percent_column', 'count_column')[0]
+    for sheet in ['Pipeline - Assessor', 'captação liq', 'consórcios']:
+        df = sheets[sheet]
+        results[f'display_data_table ({sheet})'] = timed(
+            lambda: display_data_table(df, sheet, df.columns.tolist(), max_rows=len(df)), repeat)
+
+    df = sheets['captação liq']
+    frames = [df[df.columns[:i]] for i in range(1, len(df.columns) + 1)]
+    results['find_column (10 termos x 8 conjuntos)'] = timed(
+        lambda: [find_column(frame, term) for frame in frames for term in FIND_TERMS], repeat)
+    return results
+
+
+def bench_tabs(data, repeat):
+    from streamlit.delta_generator import DeltaGenerator
+    from streamlit.testing.v1 import AppTest
+
+    # O upload vira o arquivo gerado (sem nome: o hash do Streamlit usa só o conteúdo)
+    DeltaGenerator.file_uploader = lambda self, *args, **kwargs: io.BytesIO(data)
+    results = {}
+    at = AppTest.from_file(DASH, default_timeout=600)
+    at.run()
+    for tab in TABS:
+        at.session_state['aba_ativa'] = tab
+        at.run()  # primeira vez na aba: lê as abas da planilha que ela usa
+        if at.exception:
+            raise RuntimeError(f"{tab}: {at.exception[0].value}")
+        results[f'aba {tab}'] = timed(at.run, repeat)
+    return results
+
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    for name, seconds in results.items():
+        base = baseline.get(name)
+        if base is None:
+            status = 'novo'
+        else:
+            ratio = seconds / base if base else float('inf')
+            status = f'{ratio:5.2f}x'
+            if ratio > 1 + tolerance:
+                status += '  REGRESSÃO'
+                regressions.append(name)
+        print(f"{name:45s} {seconds * 1000:10.2f} ms  {status}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark do dashboard")
+    parser.add_argument('--advisors', type=int, default=30)
+    parser.add_argument('--rows', type=int, default=None)
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--tolerance', type=float, default=1.0)
+    parser.add_argument('--baseline', default=BASELINE)
+    parser.add_argument('--update-baseline', action='store_true')
+    parser.add_argument('--skip-tabs', action='store_true', help="não roda o AppTest")
+    args = parser.parse_args(argv)
+
+    params = {'advisors': args.advisors, 'rows': args.rows}
+    with tempfile.TemporaryDirectory() as tmp:
+        # Cache em disco e histórico do dashboard isolados dos de verdade
+        os.environ['DASHVERTIQ_CACHE_DIR'] = os.path.join(tmp, 'cache')
+        os.environ['DASHVERTIQ_HISTORY'] = os.path.join(tmp, 'historico.sqlite')
+        path = os.path.join(tmp, 'bench.xlsx')
+        generate_workbook(path, args.advisors, args.rows)
+        data = open(path, 'rb').read()
+        results = bench_library(data, args.repeat)
+        if not args.skip_tabs:
+            results.update(bench_tabs(data, args.repeat))
+
+    if args.update_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as fh:
+            json.dump({'params': params, 'results': results}, fh, ensure_ascii=False, indent=2)
+        compare(results, {}, args.tolerance)
+        print(f"baseline gravado em {args.baseline}")
+        return 0
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as fh:
+            saved = json.load(fh)
+        if saved.get('params') == params:
+            baseline = saved['results']
+        else:
+            print(f"baseline gravado com outros parâmetros ({saved.get('params')}); só mostrando as medidas")
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"{len(regressions)} medida(s) acima do baseline + {args.tolerance:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,59 @@
+"""Benchmark: format_currency célula a célula (.apply) x format_currency_series.
+
+Uso: python benchmarks/bench_currency.py [--rows 100000] [--repeat 5]
+
+Que as duas versões dão o mesmo texto é conferido em tests/test_formatting.py.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from formatting import format_currency, format_currency_series  # noqa: E402
+
+
+def make_columns(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    valores = rng.normal(0, 1e6, rows)
+    com_nan = valores.copy()
+    com_nan[rng.random(rows) < 0.1] = np.nan
+    misto = pd.Series(np.round(valores, 2), dtype=object)
+    misto[rng.random(rows) < 0.05] = ''
+    misto[rng.random(rows) < 0.05] = '-'
+    return {
+        'float64': pd.Series(valores),
+        'float64 com NaN': pd.Series(com_nan),
+        'int64': pd.Series(rng.integers(-10 ** 9, 10 ** 9, rows)),
+        'object (números, \'\' e \'-\')': misto,
+    }
+
+
+def best_of(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'coluna':32s} {'apply (s)':>10s} {'vetorizado (s)':>15s} {'ganho':>7s}")
+    for name, col in make_columns(args.rows).items():
+        t_apply = best_of(lambda: col.apply(format_currency), args.repeat)
+        t_vec = best_of(lambda: format_currency_series(col), args.repeat)
+        print(f"{name:32s} {t_apply:10.4f} {t_vec:15.4f} {t_apply / t_vec:6.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""Gera uma planilha sintética com as mesmas abas e colunas que o dash.py espera.
+
+Uso: python benchmarks/generate_workbook.py saida.xlsx [--advisors 30] [--rows 90] [--seed 0]
+
+``--advisors`` é o número de assessores (uma linha por assessor nas abas por
+assessor) e ``--rows`` o número de linhas da aba 'Pipeline - Assessor'
+(padrão: 3 por assessor). Inclui o bloco 'Produto' da 'visão geral' e a
+linha de totais da 'captação liq'.
+"""
+import argparse
+import random
+
+import openpyxl
+
+PRODUCTS = ['RV', 'RF', 'COE', 'Fundos', 'Câmbio', 'Seguros', 'Consórcios', 'Internacional']
+
+
+def _brl(value):
+    # Como a planilha real guarda alguns valores: texto 'R$ 1.234,56'
+    text = f"{value:,.2f}".replace(',', '_').replace('.', ',').replace('_', '.')
+    return f"R$ {text}"
+
+
+def generate_workbook(path, advisors=30, rows=None, seed=0):
+    """Escreve a planilha em ``path``; retorna os nomes dos assessores"""
+    rng = random.Random(seed)
+    rows = advisors * 3 if rows is None else rows
+    names = [f"Assessor {i:03d}" for i in range(advisors)]
+    wb = openpyxl.Workbook(write_only=True)
+
+    ws = wb.create_sheet('visão geral')
+    ws.append(['Resumo', 'Valor', None])
+    ws.append(['Forecast', 575980.5, None])
+    ws.append(['Realizado de 12/01 até 16/01', 120000, None])
+    ws.append(['Meta dia útil', 0.114, None])
+    ws.append(['Meta', 500000, None])
+    ws.append([None, None, None])
+    ws.append(['Produto', 'Realizado', 'Meta'])
+    for product in PRODUCTS:
+        ws.append([product, rng.randint(0, 90000), 100000])
+    ws.append(['Total', '-', 'R$ -   '])
+
+    ws = wb.create_sheet('assessores')
+    ws.append(['Assessores', 'Total', 'Forecast', 'Pace', 'Núcleo'])
+    for name in names:
+        ws.append([name, rng.randint(-1000, 50000), _brl(rng.randint(0, 99999)), rng.random(), rng.choice(['SP', 'RJ'])])
+
+    layouts = [
+        ('consórcios', ['Assessor', 'Reuniões realizadas', 'Convertidos', 'Pipeline', 'Vendido', 'Receita Atual', 'Objetivo', 'Receita Projetada']),
+        ('seguros', ['Assessor', 'Reuniões realizadas', 'Convertidos', 'Whole life', 'Vida', 'Plano Saude', 'Receita Do Mês', 'Receita Acumulada']),
+        ('advisor - geral', ['Assessor', 'Reuniões realizadas', 'Convertidos', 'Produto', 'Valor Venda', 'Pipeline', 'Vendido', 'Receita Atual', 'Objetivo', 'Receita Projetada']),
+    ]
+    for sheet, cols in layouts:
+        ws = wb.create_sheet(sheet)
+        ws.append(cols)
+        has_product = 'Produto' in cols
+        for name in names:
+            row = [name, rng.randint(0, 20), rng.randint(0, 20)]
+            if has_product:
+                row.append(rng.choice(PRODUCTS))
+            row += [rng.randint(0, 9999) for _ in cols[len(row):]]
+            ws.append(row)
+
+    for sheet in ['COE - Ouro', 'PE - Prata']:
+        ws = wb.create_sheet(sheet)
+        ws.append(['Ativo', 'Valor', None])
+        ws.append(['X', 100, None])
+        ws.append([None, None, None])
+        ws.append(['Y', 200, None])
+
+    for sheet, extra in [('missões', ['Elegivel RV', 'Elegivel Internacional', 'Elegivel COE', 'Premiação máxima']),
+                         ('missões 2.0', ['Elegivel RV', 'Elegivel Fundos', 'Elegivel PJ', 'Prem Max'])]:
+        ws = wb.create_sheet(sheet)
+        ws.append(['Assessor', 'Status', 'Cod Matriz', 'Nome Matriz', 'Núcleo'] + extra)
+        for name in names:
+            ws.append([name, rng.choice(['Ativo', 'Inativo']), rng.randint(1, 9), 'Matriz', 'SP']
+                      + [rng.randint(0, 3) for _ in extra[:-1]] + [26000])
+
+    ws = wb.create_sheet('banco master')
+    ws.append(['Assessores', 'Volume FGC', 'Volume Convertido'])
+    for name in names:
+        ws.append([name, rng.randint(0, 10**6), rng.randint(0, 10**6)])
+
+    ws = wb.create_sheet('SDR')
+    ws.append(['SDRS', 'Agendadas', 'Realizadas', 'Convertidas'])
+    for sdr in ['Ana', 'Bia']:
+        ws.append([sdr, rng.randint(0, 9), rng.randint(0, 9), rng.randint(0, 9)])
+
+    ws = wb.create_sheet('SDR - Semanal')
+    ws.append(['SDR', 'Dez', 'S1', 'S2', 'S3', 'S4'])
+    for sdr in ['Ana', 'Bia']:
+        ws.append([sdr] + [rng.randint(0, 9) for _ in range(5)])
+
+    ws = wb.create_sheet('Pipeline - Assessor')
+    ws.append(['Assessor', 'Cliente', 'Pipeline', 'Valor'])
+    for i in range(rows):
+        ws.append([rng.choice(names), f"Cliente {i}", rng.choice(PRODUCTS), rng.randint(0, 99999)])
+
+    ws = wb.create_sheet('captação liq')
+    ws.append(['Assessor', 'Posição', 'Range', 'Objetivo Cap Liq', 'Captação Líquida', 'Cap x Objetivo', 'Ativações', 'Habilitações'])
+    total_obj = total_cap = 0
+    for name in names:
+        cap = rng.randint(-500000, 2000000)
+        total_obj += 1000000
+        total_cap += cap
+        ws.append([name, rng.randint(0, 5 * 10**7), '0 - 5 MM', _brl(1000000), cap, cap / 1000000, rng.randint(0, 5), rng.randint(0, 5)])
+    ws.append([None] * 8)
+    # Linha de totais: assessor em branco (só um espaço, como na planilha real)
+    ws.append([' ', None, None, _brl(total_obj), total_cap, total_cap / max(total_obj, 1), None, None])
+
+    ws = wb.create_sheet('Hot Money')
+    ws.append(['Assessor', 'Posição', 'Obj. Cap. Liq', 'Meta Campanha (70%)', 'Cap Liq', 'Necessário para Campanha'])
+    for name in names:
+        cap = rng.randint(-100000, 1000000)
+        ws.append([name, rng.randint(1, advisors), 1000000, 700000, cap, max(700000 - cap, 0)])
+
+    wb.save(path)
+    return names
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('saida')
+    parser.add_argument('--advisors', type=int, default=30)
+    parser.add_argument('--rows', type=int, default=None, help="linhas da aba 'Pipeline - Assessor'")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    generate_workbook(args.saida, args.advisors, args.rows, args.seed)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""Figuras do Plotly da Visão Geral (sem dependência do Streamlit).
+
+As funções recebem o ``ingest.LazyWorkbook`` e as opções do gráfico; o
+dashboard as chama por ``sheets.derived_workbook(build, *opções)``, então
+cada figura é montada uma vez por arquivo e por combinação de opções e
+reaproveitada por todas as sessões. O ``st.plotly_chart`` ainda serializa a
+figura a cada execução (o Streamlit não aceita um spec já pronto); o que se
+poupa é a montagem.
+"""
+import pandas as pd
+import plotly.graph_objects as go
+
+from columns import find_column
+from formatting import format_currency_series
+from metrics import build_overview
+
+PIE_COLORS = ["#0008FF", '#FFC600', "#FF001E9A", "#09FF008C", '#FF9600', "#00FF1E9D", '#B8860B', "#2045DA"]
+OTHERS_LABEL = 'Outros'
+# Coluna que ``top_n`` marca como True na linha 'Outros' (o rótulo não basta:
+# pode haver assessor com nome parecido)
+OTHERS_COLUMN = '_outros'
+# Altura de cada barra do gráfico de assessores, em pixels
+BAR_HEIGHT = 35
+
+
+def top_n(df, label, value, n):
+    """As ``n`` linhas de maior ``value``; as demais somadas em uma linha 'Outros'.
+
+    ``n`` None devolve todas. A ordem é crescente (a maior fica no topo do
+    gráfico de barras horizontais) e 'Outros', se houver, vem primeiro, com
+    ``OTHERS_COLUMN`` True.
+    """
+    df = df.sort_values(by=value, ascending=False).assign(**{OTHERS_COLUMN: False})
+    if n is not None and len(df) > n:
+        rest = df.iloc[n:]
+        others = pd.DataFrame({label: [f'{OTHERS_LABEL} ({len(rest)})'], value: [rest[value].sum()],
+                               OTHERS_COLUMN: [True]})
+        df = pd.concat([df.iloc[:n][[label, value, OTHERS_COLUMN]], others], ignore_index=True)
+    return df.iloc[::-1]
+
+
+def product_pie(sheets):
+    """Pizza da receita por produto (bloco 'Produto' da 'visão geral'); None sem o bloco"""
+    products = sheets.derived('visão geral', build_overview).products
+    if products is None:
+        return None
+    df_pizza = products[products['Realizado'] > 0]
+    fig = go.Figure(data=[go.Pie(
+        labels=df_pizza['Produto'],
+        values=df_pizza['Realizado'],
+        marker=dict(colors=PIE_COLORS, line=dict(color='#0d0d0d', width=2)),
+        textposition='inside',
+        textfont=dict(color='#000000', size=12, weight='bold'),
+        hovertemplate='<b>%{label}</b><br>%{value:,.2f}<br>%{percent}<extra></extra>'
+    )])
+    fig.update_layout(
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#FFD700', size=12),
+        height=500,
+        showlegend=True,
+        legend=dict(orientation="h", yanchor="bottom", y=-0.2, xanchor="center", x=0.5),
+        margin=dict(t=20, b=100, l=20, r=20)
+    )
+    return fig
+
+
+def advisor_revenue_bar(sheets, n=None):
+    """Barras da receita por assessor (aba 'assessores', quem tem receita > 0).
+
+    Com ``n``, só os ``n`` maiores e uma barra 'Outros' com o resto. None se
+    faltar a aba ou as colunas.
+    """
+    if 'assessores' not in sheets:
+        return None
+    df = sheets['assessores']
+    col_ass = find_column(df, 'Assessores')
+    col_tot = find_column(df, 'Total')
+    if not col_ass or not col_tot:
+        return None
+    df = pd.DataFrame({col_ass: df[col_ass], col_tot: pd.to_numeric(df[col_tot], errors='coerce').fillna(0)})
+    df = top_n(df[df[col_tot] > 0], col_ass, col_tot, n)
+
+    fig = go.Figure(go.Bar(
+        x=df[col_tot],
+        y=df[col_ass],
+        orientation='h',
+        # Dourado; a barra 'Outros' em cinza
+        marker=dict(color=['#808080' if o else '#FFD700' for o in df[OTHERS_COLUMN]] if n is not None else '#FFD700'),
+        text=format_currency_series(df[col_tot]),
+        textposition='auto',
+        hovertemplate='<b>%{y}</b> Receita: %{x:,.2f}<extra></extra>'
+    ))
+    fig.update_layout(
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#FFD700'),
+        margin=dict(t=20, b=20, l=20, r=20),
+        xaxis=dict(showgrid=False, showticklabels=False),
+        yaxis=dict(showgrid=False),
+        height=max(400, len(df) * BAR_HEIGHT)
+    )
+    return fig
@@ -0,0 +1,96 @@
+"""Busca de colunas pelo nome, com índice montado uma vez por conjunto de colunas.
+
+Os nomes são normalizados (maiúsculas, acentos e espaços repetidos não
+importam: 'Consórcio' encontra 'consorcio'). A busca devolve a mesma coluna
+que a varredura antiga devolveria: a primeira, na ordem do DataFrame, cujo
+nome contém o termo.
+"""
+import re
+import unicodedata
+from bisect import bisect_right
+from functools import lru_cache
+
+# Separador que não aparece em nomes de coluna normalizados
+_SEP = '\x00'
+
+
+def normalize(text):
+    """Minúsculas, sem acentos e com espaços repetidos reduzidos a um"""
+    text = unicodedata.normalize('NFKD', str(text).casefold())
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch))
+    return re.sub(r'\s+', ' ', text).replace(_SEP, '')
+
+
+class ColumnIndex:
+    """Índice dos nomes de coluna de um DataFrame.
+
+    Os nomes normalizados ficam concatenados em um único texto; a primeira
+    ocorrência do termo nesse texto já é a primeira coluna que o contém.
+    As respostas de ``find`` são memorizadas por termo.
+    """
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        names = [normalize(c) for c in self.columns]
+        self._exact = {}
+        for pos, name in enumerate(names):
+            self._exact.setdefault(name, pos)
+        # _text = SEP nome0 SEP nome1 SEP ...; _starts[i] = início de nome i
+        self._starts = []
+        parts, offset = [], 0
+        for name in names:
+            parts.append(_SEP + name)
+            self._starts.append(offset + 1)
+            offset += len(name) + 1
+        self._text = ''.join(parts) + _SEP
+        self._found = {}
+
+    def _column_at(self, offset):
+        return self.columns[bisect_right(self._starts, offset) - 1]
+
+    def exact(self, term):
+        """Coluna cujo nome é igual ao termo (normalizado), ou None"""
+        pos = self._exact.get(normalize(term))
+        return None if pos is None else self.columns[pos]
+
+    def prefix(self, term):
+        """Primeira coluna cujo nome começa com o termo, ou None"""
+        offset = self._text.find(_SEP + normalize(term))
+        return None if offset < 0 else self._column_at(offset + 1)
+
+    def find(self, term):
+        """Primeira coluna cujo nome contém o termo, ou None"""
+        try:
+            return self._found[term]
+        except KeyError:
+            pass
+        needle = normalize(term)
+        offset = self._text.find(needle)
+        column = None if offset < 0 or not self.columns else self._column_at(offset if needle else 1)
+        self._found[term] = column
+        return column
+
+    def find_first(self, search_terms):
+        """Como ``find``, tentando cada termo na ordem dada"""
+        if isinstance(search_terms, str):
+            search_terms = [search_terms]
+        for term in search_terms:
+            column = self.find(term)
+            if column is not None:
+                return column
+        return None
+
+
+@lru_cache(maxsize=256)
+def _index_for(columns):
+    return ColumnIndex(columns)
+
+
+def column_index(df):
+    """Índice das colunas de ``df``; DataFrames com as mesmas colunas o compartilham"""
+    return _index_for(tuple(df.columns))
+
+
+def find_column(df, search_terms):
+    """Primeira coluna de ``df`` que contém algum dos termos (na ordem dos termos)"""
+    return column_index(df).find_first(search_terms)
@@ -1,1133 +1,981 @@
-
-import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-from datetime import datetime
-from io import BytesIO
-import openpyxl
-
-
-# Configuração da página
-st.set_page_config(
-    page_title="Dashboard Financeiro - Vértiq",
-    page_icon="📊",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-st.markdown("""
-<style>
-    * {
-        margin: 0;
-        padding: 0;
-        box-sizing: border-box;
-    }
-
-    /* ===== FUNDO PRINCIPAL ===== */
-    [data-testid="stAppViewContainer"] {
-        background-color: #0d0d0d !important;
-        background-image: none !important;
-    }
-
-    [data-testid="stSidebar"] {
-        background-color: #0d0d0d !important;
-        background-image: none !important;
-    }
-
-    /* ===== SIDEBAR CONTENT ===== */
-    [data-testid="stSidebarContent"] {
-        background-color: #0d0d0d !important;
-    }
-
-    [data-testid="stSidebar"] label,
-    [data-testid="stSidebar"] p,
-    [data-testid="stSidebar"] span,
-    [data-testid="stSidebar"] div {
-        color: #FFD700 !important;
-    }
-
-    /* ===== HEADINGS - TUDO AMARELO ===== */
-    h1, h2, h3, h4, h5, h6 {
-        color: #FFD700 !important;
-    }
-
-    /* ===== TEXTO GERAL ===== */
-    body, p, span, div {
-        color: #E0E0E0 !important;
-    }
-
-    hr {
-        border-color: rgba(255, 215, 0, 0.3) !important;
-    }
-
-    /* ===== METRIC CONTAINER - CARDS PRINCIPAIS (Receita, Forecast, Pace, %, Meta) ===== */
-    [data-testid="metric-container"] {
-        /* MUDANÇA PRINCIPAL: Fundo cinza chumbo sólido e visível */
-        background-color: #2b2b2b !important; 
-        
-        /* Gradiente sutil para dar acabamento premium */
-        background-image: linear-gradient(135deg, #383838 0%, #2b2b2b 100%) !important;
-        
-        padding: 20px !important;
-        border-radius: 12px !important;
-        
-        /* Borda dourada para definir o limite do card */
-        border: 1px solid rgba(255, 215, 0, 0.3) !important;
-        
-        /* Sombra forte para destacar do fundo preto */
-        box-shadow: 0 6px 15px rgba(0, 0, 0, 0.7) !important;
-        
-        /* Garantir que a cor do texto herde corretamente */
-        color: #E0E0E0 !important;
-    }
-
-    [data-testid="metric-container"]:hover {
-        /* Efeito visual ao passar o mouse */
-        border-color: rgba(255, 215, 0, 0.8) !important;
-        box-shadow: 0 8px 25px rgba(0, 0, 0, 0.9) !important;
-        transform: translateY(-2px) !important;
-        background-color: #333333 !important;
-    }
-
-    /* Ajuste forçado para o título do card dentro do container */
-    [data-testid="metric-container"] > div:nth-child(1) {
-        font-size: 14px !important;
-        color: #FFD700 !important; /* Dourado */
-        font-weight: 600 !important;
-    }
-
-    /* Ajuste forçado para o valor do card */
-    [data-testid="metric-container"] > div:nth-child(2) {
-        color: #FFFFFF !important; /* Branco puro para contraste */
-    }
-
-    /* ===== DATAFRAME & TABLE ===== */
-    [data-testid="stDataFrame"],
-    [data-testid="stTable"] {
-        background-color: #1a1a1a !important;
-        color: #E0E0E0 !important;
-    }
-
-    /* ===== BUTTONS ===== */
-    .stButton > button {
-        background: linear-gradient(135deg, #FFD700 0%, #B8860B 100%) !important;
-        color: #0d0d0d !important;
-        border: none !important;
-        padding: 0.6rem 2rem !important;
-        border-radius: 50px !important;
-        font-weight: 700 !important;
-        text-transform: uppercase !important;
-        letter-spacing: 1px !important;
-        transition: all 0.3s ease !important;
-        box-shadow: 0 4px 15px rgba(255, 215, 0, 0.2) !important;
-        width: 100% !important;
-    }
-
-    .stButton > button:hover {
-        transform: translateY(-2px) !important;
-        box-shadow: 0 6px 20px rgba(255, 215, 0, 0.4) !important;
-        color: #000 !important;
-    }
-
-    /* ===== TABS ===== */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 15px !important;
-        background-color: transparent !important;
-    }
-
-    .stTabs [data-baseweb="tab"] {
-        background-color: #1a1a1a !important;
-        color: #FFD700 !important;
-        border: 1px solid rgba(255, 215, 0, 0.3) !important;
-        border-radius: 8px 8px 0 0 !important;
-        padding: 10px 25px !important;
-        font-weight: 600 !important;
-    }
-
-    .stTabs [aria-selected="true"] {
-        background-color: #FFD700 !important;
-        color: #0d0d0d !important;
-        border: 1px solid #FFD700 !important;
-    }
-
-    /* ===== INFO CARDS (Missões) ===== */
-    .info-card {
-        background: linear-gradient(135deg, #0d0d0d 0%, #1a1a1a 100%) !important;
-        padding: 20px !important;
-        border-radius: 12px !important;
-        border: 1px solid rgba(255, 215, 0, 0.5) !important;
-        margin-bottom: 20px !important;
-        color: #E0E0E0 !important;
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.8) !important;
-        backdrop-filter: blur(10px) !important;
-    }
-
-    .info-card h3 {
-        color: #FFD700 !important;
-        margin-bottom: 15px !important;
-        border-bottom: 1px solid rgba(255, 215, 0, 0.3) !important;
-        padding-bottom: 10px !important;
-    }
-
-    .info-card ul {
-        list-style-type: none !important;
-        padding-left: 0 !important;
-    }
-
-    .info-card li {
-        margin-bottom: 10px !important;
-        padding-left: 20px !important;
-        position: relative !important;
-    }
-
-    /* ===== OBJETIVO CARD ===== */
-    .objetivo-card-dark {
-        background: linear-gradient(135deg, #1a3050 0%, #0d1f35 100%) !important;
-        padding: 25px !important;
-        border-radius: 12px !important;
-        color: white !important;
-        text-align: center !important;
-        margin-top: 30px !important;
-        border: 1px solid rgba(255, 215, 0, 0.4) !important;
-        box-shadow: 0 4px 15px rgba(0, 0, 0, 0.8) !important;
-        backdrop-filter: blur(10px) !important;
-    }
-
-    .objetivo-card-dark h3 {
-        color: #FFD700 !important;
-        margin-bottom: 15px !important;
-    }
-
-    /* ===== PROGRESS BAR ===== */
-    .progress-bar {
-        background: rgba(255, 255, 255, 0.1) !important;
-        height: 8px !important;
-        border-radius: 4px !important;
-        margin-top: 10px !important;
-        overflow: hidden !important;
-        border: 1px solid rgba(255, 215, 0, 0.2) !important;
-    }
-
-    .progress-fill {
-        height: 100% !important;
-        background: linear-gradient(90deg, #4a9dd4 0%, #2a7db3 100%) !important;
-        border-radius: 4px !important;
-        box-shadow: 0 0 10px rgba(74, 157, 212, 0.5) !important;
-    }
-
-    /* ===== RANGE CARDS ===== */
-    .range-card {
-        background: linear-gradient(135deg, #1a3050 0%, #0d1f35 100%) !important;
-        padding: 15px !important;
-        border-radius: 10px !important;
-        color: white !important;
-        margin: 5px 0 !important;
-        border-left: 4px solid rgba(255, 215, 0, 0.5) !important;
-        box-shadow: 0 2px 8px rgba(0, 0, 0, 0.8) !important;
-        backdrop-filter: blur(5px) !important;
-    }
-
-    .range-title {
-        font-weight: bold !important;
-        font-size: 14px !important;
-        margin-bottom: 5px !important;
-        color: #FFD700 !important;
-    }
-
-    .range-classification {
-        font-size: 12px !important;
-        opacity: 0.9 !important;
-        margin-bottom: 8px !important;
-        font-weight: 500 !important;
-        color: #E0E0E0 !important;
-    }
-
-    .range-info {
-        display: flex !important;
-        justify-content: space-between !important;
-        font-size: 12px !important;
-        color: #E0E0E0 !important;
-    }
-
-    /* ===== CONTAINER PARA CARDS ALINHADOS ===== */
-    .metrics-container {
-        display: grid !important;
-        grid-template-columns: repeat(auto-fit, minmax(280px, 1fr)) !important;
-        gap: 20px !important;
-        margin-bottom: 30px !important;
-        width: 100% !important;
-    }
-
-    /* ===== CARDS PRINCIPAIS ===== */
-    .metric-card {
-        background: linear-gradient(135deg, #0d0d0d 0%, #1a1a1a 100%) !important;
-        padding: 25px !important;
-        border-radius: 12px !important;
-        border: 1px solid rgba(255, 215, 0, 0.5) !important;
-        box-shadow: 0 4px 15px rgba(0, 0, 0, 0.8) !important;
-        color: #E0E0E0 !important;
-        backdrop-filter: blur(15px) !important;
-        transition: all 0.3s ease !important;
-    }
-
-    .metric-card-title {
-        font-size: 13px !important;
-        color: #FFD700 !important;
-        font-weight: 600 !important;
-        margin-bottom: 12px !important;
-        text-transform: uppercase !important;
-        letter-spacing: 0.5px !important;
-        opacity: 0.9 !important;
-    }
-
-    .metric-card-value {
-        font-size: 28px !important;
-        font-weight: 700 !important;
-        color: #E0E0E0 !important;
-        line-height: 1.3 !important;
-        margin-bottom: 5px !important;
-    }
-
-    .metric-card:hover {
-        border-color: rgba(255, 215, 0, 0.8) !important;
-        box-shadow: 0 6px 20px rgba(255, 215, 0, 0.2) !important;
-        transform: translateY(-2px) !important;
-    }
-
-    /* ===== CARDS SECUNDÁRIOS ===== */
-    .secondary-metrics-container {
-        display: grid !important;
-        grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)) !important;
-        gap: 20px !important;
-        margin-top: 20px !important;
-    }
-
-    .secondary-metric-card {
-        background: linear-gradient(135deg, #1a3050 0%, #0d1f35 100%) !important;
-        padding: 20px !important;
-        border-radius: 12px !important;
-        border: 1px solid rgba(255, 215, 0, 0.4) !important;
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.8) !important;
-        backdrop-filter: blur(10px) !important;
-        transition: all 0.3s ease !important;
-    }
-
-    .secondary-metric-card-title {
-        font-size: 12px !important;
-        color: #FFD700 !important;
-        font-weight: 600 !important;
-        margin-bottom: 10px !important;
-        text-transform: uppercase !important;
-        opacity: 0.9 !important;
-    }
-
-    .secondary-metric-card-value {
-        font-size: 26px !important;
-        font-weight: 700 !important;
-        color: #E0E0E0 !important;
-    }
-
-    .secondary-metric-card:hover {
-        border-color: rgba(255, 215, 0, 0.6) !important;
-        box-shadow: 0 5px 15px rgba(255, 215, 0, 0.15) !important;
-        transition: all 0.3s ease !important;
-    }
-
-    /* ===== RESPONSIVO PARA MOBILE ===== */
-    @media (max-width: 768px) {
-        [data-testid="metric-container"] > div:nth-child(2) {
-            font-size: 20px !important;
-        }
-
-        .metric-card-value {
-            font-size: 20px !important;
-        }
-
-        .secondary-metric-card-value {
-            font-size: 18px !important;
-        }
-
-        .metrics-container {
-            grid-template-columns: 1fr !important;
-        }
-    }
-
-    /* ===== RESPONSIVO PARA TABLET ===== */
-    @media (max-width: 1024px) {
-        .metrics-container {
-            grid-template-columns: repeat(2, 1fr) !important;
-        }
-    }
-</style>
-""", unsafe_allow_html=True)
-
-
-def format_currency(val):
-    """Formata valores para o padrão R$ 1.234,56"""
-    try:
-        if pd.isna(val) or val == '':
-            return "R$ 0,00"
-        return f"R$ {float(val):,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
-    except:
-        return str(val)
-
-st.markdown("# 📊 Dashboard Financeiro")
-
-st.sidebar.markdown("## 📋 Menu")
-
-uploaded_file = st.sidebar.file_uploader(
-    "📁 Carregar arquivo Excel",
-    type=["xlsx", "xls"],
-    help="Selecione seu arquivo consorcios.xlsx"
-)
-
-@st.cache_data
-def load_excel(file):
-    try:
-        xls = pd.ExcelFile(file)
-        sheets = {}
-        for sheet in xls.sheet_names:
-            try:
-                df = pd.read_excel(file, sheet_name=sheet)
-                df.columns = df.columns.str.strip()
-                sheets[sheet] = df
-            except Exception as e:
-                st.warning(f"⚠️ Erro ao carregar sheet '{sheet}': {str(e)}")
-                continue
-        return sheets if sheets else None
-    except Exception as e:
-        st.error(f"❌ Erro ao carregar arquivo: {str(e)}")
-        return None
-
-def find_column(df, search_terms):
-    if isinstance(search_terms, str):
-        search_terms = [search_terms]
-    for term in search_terms:
-        matching_cols = [c for c in df.columns if str(term).lower() in str(c).lower()]
-        if matching_cols:
-            return matching_cols[0]
-    return None
-
-def safe_filter_by_column(df, column_name):
-    try:
-        col = find_column(df, column_name)
-        if col is None:
-            return None
-        return df[(df[col].notna()) & (df[col] != '')]
-    except Exception as e:
-        st.error(f"❌ Erro ao filtrar por {column_name}: {str(e)}")
-        return None
-
-def safe_get_columns(df, column_names):
-    existing_columns = []
-    for col in column_names:
-        found_col = find_column(df, col)
-        if found_col and found_col not in existing_columns:
-            existing_columns.append(found_col)
-    return existing_columns
-
-# Função que formata os numeros em strings
-def display_data_table(df, title, column_names, max_rows=15):
-    try:
-        if df is None or df.empty:
-            st.info(f"ℹ️ Nenhum dado disponível para {title}")
-            return
-        valid_columns = safe_get_columns(df, column_names)
-        if not valid_columns:
-            st.warning(f"⚠️ Nenhuma das colunas esperadas encontrada em {title}")
-            return
-        
-        df_filtered = df[valid_columns].copy()
-        df_filtered = df_filtered.dropna(how='all').head(max_rows)
-        
-        # COLUNAS QUE DEVEM SER FORMATADAS COMO R$
-        money_keywords = ['receita', 'vendido', 'objetivo', 'valor', 'parcela', 'realizado', 'meta', 'pipeline', 'whole life','pj 2', 'internacional', 'plano saude', 'câmbio', 'fundos', 'resultado', 'consorcios', 'seguros', 'maxima', 'prem', 'coe', 'pj2', 'rv', 'rf', 'objetivo', 'consórcio', 'total', 'Forecast', 'Volume','Cap Liq', 'necessário para campanha', 'obj. cap. liq', 'obj. cap', 'cap liq', 'consorcio', 'valor venda']
-
-        
-        # COLUNAS QUE DEVEM FICAR COMO NÚMEROS (NÃO MOEDA)
-        number_keywords = ['convertidos', 'reuniões', 'boletas ', 'elegivel' ]
-        
-        for col in df_filtered.columns:
-            col_lower = col.lower().strip()
-            
-            # Prioridade: Se é número puro, deixa como número
-            if any(key in col_lower for key in number_keywords):
-                try:
-                    df_filtered[col] = pd.to_numeric(
-                        df_filtered[col].astype(str).str.replace('R$', '').str.strip(), 
-                        errors='coerce'
-                    ).fillna(0).astype(int)  # Converte para int para ficar 0, 2, 1 (sem decimais)
-                except:
-                    pass
-            
-            # Se é coluna de dinheiro e possivel valor financeir, formata como R$
-            elif any(key in col_lower for key in money_keywords):
-                try:
-                    df_filtered[col] = pd.to_numeric(
-                        df_filtered[col].astype(str).str.replace('R$', '').str.replace('-', '0').str.strip(), 
-                        errors='coerce'
-                    ).fillna(0).apply(format_currency)
-                except:
-                    pass
-        
-        if df_filtered.empty:
-            st.info(f"ℹ️ Nenhum dado encontrado para {title}")
-            return
-        st.dataframe(df_filtered, use_container_width=True, hide_index=True)
-    except Exception as e:
-        st.error(f"❌ Erro inesperado em {title}: {str(e)}")
-
-
-sheets = None
-if uploaded_file:
-    sheets = load_excel(uploaded_file)
-    if sheets:
-        st.sidebar.success(f"✅ Arquivo carregado com sucesso!")
-    else:
-        st.sidebar.error("❌ Erro ao carregar arquivo")
-else:
-    st.sidebar.info("📌 Faça upload do arquivo Excel para começar.")
-
-st.sidebar.markdown("---")
-
-tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = st.tabs(["Visão Geral", "Consórcios", "Seguros", "Advisor", "Time Comercial", "Comercial - Pipeline", "Captação Liq", 'Campanha - Hot Money'])
-
-with tab1:
-    st.markdown("## 📈 Visão Geral")
-    st.markdown("---")
-    
-    if sheets and 'visão geral' in sheets:
-        df_vg = sheets['visão geral']
-        
-        try:
-            produto_row_idx = df_vg[df_vg.iloc[:, 0] == 'Produto'].index
-            if not produto_row_idx.empty:
-                idx = produto_row_idx[0]
-                df_prod = df_vg.iloc[idx+1:idx+12, 0:3].copy()
-                df_prod.columns = ['Produto', 'Realizado', 'Meta']
-                df_prod = df_prod.dropna(subset=['Produto'])
-                
-                for col in ['Realizado', 'Meta']:
-                    df_prod[col] = pd.to_numeric(df_prod[col].replace('-', 0).replace('R$ -   ', 0), errors='coerce').fillna(0)
-                
-                total_realizado = df_prod['Realizado'].sum()
-
-                # Pega o valor (que internamente é 0.57598050)
-                forecast_rows = df_vg[df_vg.iloc[:, 0].astype(str).str.contains('Forecast', case=False, na=False)]
-                forecast_val = forecast_rows.iloc[-1, 1] if not forecast_rows.empty else 0
-
-                # Converte para número real (575980.50)
-                forecast_val = float(forecast_val)
-
-
-                # Realizado do período (12/01 a 16/01)
-                periodo_row = df_vg[df_vg.iloc[:, 0].astype(str).str.contains('Realizado de 12/01 até 16/01', case=False, na=False)]
-                realizado_periodo = periodo_row.iloc[0, 1] if not periodo_row.empty else 0
-                
-            
-                # Média diaria realizada (semana/7)
-                media_dia = float(realizado_periodo) / 7 if realizado_periodo else 0
-                
-                # Média semanal por dias uteis
-                meta_dia_row = df_vg[df_vg.iloc[:, 0].astype(str).str.contains('Meta dia útil', case=False, na=False)]
-                meta_dia_util = meta_dia_row.iloc[0, 1] if not meta_dia_row.empty else '114%'
-                
-                # Meta do mês
-                meta_rows = df_vg[df_vg.iloc[:, 0].astype(str).str.contains('Meta', case=False, na=False)]
-                meta_total = pd.to_numeric(meta_rows.iloc[1, 1], errors='coerce') if len(meta_rows) > 1 else 500000
-                
-                # Porcetagem da meta total atingida no mês
-                percent_meta = (total_realizado / meta_total * 100) if meta_total > 0 else 0
-
-                # Primeiros 4 cards
-                # Visão Gera
-# PRIMEIRO ROW - 3 cards principais (centralizado)
-                m1, m2, m3 = st.columns(3, gap="medium")
-
-                with m1:
-                    st.metric("Receita Total Realizada", format_currency(total_realizado))
-                    
-                with m2:
-                    st.metric("Forecast", format_currency(forecast_val))
-                    
-                with m3:
-                    st.metric("Pace", format_currency(meta_dia_util))
-
-                st.markdown("<br>", unsafe_allow_html=True)
-
-                # SEGUNDO ROW - 2 cards (melhor proporção)
-                c1, c2 = st.columns(2, gap="medium")
-
-                with c1:
-                    st.metric("% da Meta Atingida", f"{percent_meta:.1f}%")
-                    
-                with c2:
-                    st.metric("Meta Total", format_currency(meta_total))
-
-                
-                st.markdown("---")
-                
-                st.subheader("🎯 Concentração de Receita por Produto")
-                df_pizza = df_prod[df_prod['Realizado'] > 0]
-                
-                fig_pie = go.Figure(data=[go.Pie(
-                    labels=df_pizza['Produto'],
-                    values=df_pizza['Realizado'],
-                    marker=dict(colors=["#0008FF", '#FFC600', "#FF001E9A", "#09FF008C", '#FF9600', "#00FF1E9D", '#B8860B', "#2045DA"],
-                               line=dict(color='#0d0d0d', width=2)),
-                    textposition='inside',
-                    textfont=dict(color='#000000', size=12, weight='bold'),
-                    hovertemplate='<b>%{label}</b><br>%{value:,.2f}<br>%{percent}<extra></extra>'
-                )])
-                fig_pie.update_layout(
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    font=dict(color='#FFD700', size=12),
-                    height=500,
-                    showlegend=True,
-                    legend=dict(orientation="h", yanchor="bottom", y=-0.2, xanchor="center", x=0.5),
-                    margin=dict(t=20, b=100, l=20, r=20)
-                )
-                st.plotly_chart(fig_pie, use_container_width=True)
-                
-                st.markdown("---")
-                st.subheader("👤 Receita por Assessor")
-                
-                if 'assessores' in sheets:
-                    df_ass_rec = sheets['assessores'].copy()
-                    # Encontrar colunas de Assessor e Total
-                    col_ass = find_column(df_ass_rec, 'Assessores')
-                    col_tot = find_column(df_ass_rec, 'Total')
-                    
-                    if col_ass and col_tot:
-                        # Limpar dados para garantir que são números
-                        df_ass_rec[col_tot] = pd.to_numeric(df_ass_rec[col_tot], errors='coerce').fillna(0)
-                        
-                        # Filtrar quem tem receita > 0 e ordenar do maior para o menor
-                        df_ass_rec = df_ass_rec[df_ass_rec[col_tot] > 0].sort_values(by=col_tot, ascending=True)
-                        
-                        fig_bar = go.Figure(go.Bar(
-                            x=df_ass_rec[col_tot],
-                            y=df_ass_rec[col_ass],
-                            orientation='h',
-                            marker=dict(color='#FFD700'), # Cor dourada fixa
-                            text=df_ass_rec[col_tot].apply(format_currency), # Valor formatado na barra
-                            textposition='auto',
-                            hovertemplate='<b>%{y}</b> Receita: %{x:,.2f}<extra></extra>'
-                        ))
-                        
-                        fig_bar.update_layout(
-                            paper_bgcolor='rgba(0,0,0,0)',
-                            plot_bgcolor='rgba(0,0,0,0)',
-                            font=dict(color='#FFD700'),
-                            margin=dict(t=20, b=20, l=20, r=20),
-                            xaxis=dict(showgrid=False, showticklabels=False),
-                            yaxis=dict(showgrid=False),
-                            height=max(400, len(df_ass_rec) * 35) # Ajusta altura conforme nº de assessores
-                        )
-                        st.plotly_chart(fig_bar, use_container_width=True)
-
-                st.markdown("---")
-                
-                
-                df_prod_display = df_prod.copy()
-                df_prod_display['Realizado'] = df_prod_display['Realizado'].apply(format_currency)
-                df_prod_display['Meta'] = df_prod_display['Meta'].apply(format_currency)
-                st.dataframe(df_prod_display, use_container_width=True, hide_index=True)
-                
-            else:
-                st.warning("⚠️ Estrutura da aba 'visão geral' não reconhecida.")
-        except Exception as e:
-            st.error(f"❌ Erro ao processar aba Visão Geral: {str(e)}")
-            
-    elif sheets:
-        st.info("💡 Aba 'visão geral' não encontrada no arquivo.")
-    else:
-        st.info("💡 Carregue um arquivo para ver os dados.")
-
-with tab2:
-    st.markdown("## 🏢 Consórcios")
-    st.markdown("---")
-    if sheets and 'consórcios' in sheets:
-        df = sheets['consórcios']
-        st.subheader("👥 Dados por Assessor")
-        df_assessores = safe_filter_by_column(df, 'Assessor')
-        display_data_table(df_assessores, "Assessores Consórcios", ['Assessor', 'Reuniões realizadas', 'Convertidos'])
-        
-        st.markdown("---")
-        st.subheader("📊 Pipeline de Vendas")
-        df_pipeline = safe_filter_by_column(df, 'Pipeline')
-        display_data_table(df_pipeline, "Pipeline Consórcios", ['Pipeline', 'Vendido', 'Receita Atual', 'Objetivo', 'Receita Projetada'])
-    else:
-        st.warning("⚠️ Sheet 'consórcios' não encontrada.")
-
-with tab3:
-    st.markdown("## 🛡️ Seguros")
-    st.markdown("---")
-    if sheets and 'seguros' in sheets:
-        df = sheets['seguros']
-        st.subheader("👥 Dados por Assessor")
-        df_assessores = safe_filter_by_column(df, 'Assessor')
-        display_data_table(df_assessores, "Assessores Seguros", ['Assessor', 'Reuniões realizadas', 'Convertidos'])
-        
-        st.markdown("---")
-        st.subheader("📊 Pipeline de Seguros")
-        display_data_table(df, "Pipeline Seguros", ['Whole life', 'Vida', 'Plano Saude', 'Receita Do Mês', 'Receita Acumulada'])
-    else:
-        st.warning("⚠️ Sheet 'seguros' não encontrada.")
-
-with tab4:
-    st.markdown("## 💼 Advisor")
-    st.markdown("---")
-    st.markdown("---")
-
-    if sheets:
-        if 'advisor - geral' in sheets:
-            df = sheets['advisor - geral']
-            st.subheader("📋 Advisor - Geral")
-            df_geral = safe_filter_by_column(df, 'Assessor')
-            display_data_table(df_geral, "Advisor Geral", ['Assessor', 'Reuniões realizadas', 'Convertidos', 'Produto', 'Valor Venda'])
-            
-            st.markdown("---")
-            st.subheader("📊 Pipeline Advisor")
-            df_pipeline = safe_filter_by_column(df, 'Pipeline')
-            display_data_table(df_pipeline, "Pipeline Advisor", ['Pipeline', 'Vendido', 'Receita Atual', 'Objetivo', 'Receita Projetada'])
-        
-        if 'COE - Ouro' in sheets:
-            st.markdown("---")
-            st.subheader("🏆 COE - Ouro")
-            df_ouro = sheets['COE - Ouro'].dropna(axis=1, how='all').dropna(how='all')
-            display_data_table(df_ouro, "COE Ouro", df_ouro.columns.tolist())
-        
-        if 'PE - Prata' in sheets:
-            st.markdown("---")
-            st.subheader("🥈 PE - Prata")
-            df_prata = sheets['PE - Prata'].dropna(axis=1, how='all').dropna(how='all')
-            display_data_table(df_prata, "PE Prata", df_prata.columns.tolist())
-
-
-    else:
-        st.warning("⚠️ Nenhum arquivo carregado.")
-
-    col_m1, col_m2 = st.columns(2)
-    
-    with col_m1:
-        st.markdown("""
-        <div class="info-card">
-            <h3> Missões 1.0</h3>
-            <ul>
-                <li><b>Renda Variável:</b> Vol. mín. R$ 250k (Corretagem Bovespa)</li>
-                <li><b>Internacional:</b> Remessa mín. USD 30k (Conta Global)</li>
-                <li><b>COE:</b> Alocar mín. R$ 100k (Prateleira Janeiro)</li>
-                <li style="color: #FFD700;"><b>Premiação:</b> Até R$ 26.000,00 adicionais</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-        
-    with col_m2:
-        st.markdown("""
-        <div class="info-card">
-            <h3> Missão 2.0</h3>
-            <ul>
-                <li><b>Renda Fixa:</b> Vol. R$ 200k (Prêmio R$ 1k) | R$ 300k (Prêmio R$ 2k)</li>
-                <li><b>Fundos Fechados:</b> R$ 300k Balcão / 400k Listados (Prêmio R$ 1k)</li>
-                <li><b>Conta PJ:</b> Aporte 350k-500k (Prêmio R$ 1k) | > 600k (Prêmio R$ 2k)</li>
-                <li style="color: #FFD700;"><b>Vencimento RF:</b> A partir de Jan/2029</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-
-    st.markdown("---")
-
-    if 'missões' in sheets:
-        df = sheets['missões']
-        st.subheader("Missões 1.0")
-        df_missoes1 = safe_filter_by_column(df, 'Assessor')
-        display_data_table(df_missoes1, "Missões", ['Assessor', 'Status', 'Cod Matriz', 'Nome Matriz', 'Núcleo', 'Elegivel RV', 'Elegivel Internacional', 'Elegivel COE', 'Premiação máxima'])
-            
-    st.markdown("---")
-
-    if 'missões 2.0' in sheets:
-        df = sheets['missões 2.0']
-        st.subheader("Missões 2.0")
-        df_missoes2 = safe_filter_by_column(df, 'Assessor')
-        display_data_table(df_missoes2, "Missões 2.0", ['Assessor', 'Status', 'Cod Matriz', 'Nome Matriz', 'Núcleo', 'Elegivel RV', 'Elegivel Fundos', 'Elegivel PJ', 'Prem Max'])
-            
-    st.markdown("---")
-
-    if 'banco master' in sheets:
-        df = sheets['banco master']
-        st.subheader("Banco Master")
-        df_master = safe_filter_by_column(df, 'Assessores')
-        display_data_table(df_master, "Banco Master", ['Assessore', 'Volume FGC', 'Volume Convertido'])
-
-with tab5:
-
-    # 1. Verificar se a aba existe (usando uma busca mais flexível para o nome da aba)
-    assessor_sheet_name = next((s for s in sheets.keys() if s.lower().strip() == 'assessores'), None)
-    
-    if assessor_sheet_name:
-        df_assessor_raw = sheets[assessor_sheet_name]
-        st.markdown("## 👥 Análise por Assessor")
-        st.markdown("---")
-        
-        # 2. Encontrar a coluna do Assessor (flexível)
-        assessor_col = find_column(df_assessor_raw, 'Assessores')
-        
-        if assessor_col:
-            # 3. Criar a lista para o filtro
-            lista_assessores = ["Todos"] + sorted([str(x) for x in df_assessor_raw[assessor_col].unique() if x])
-            assessor_selecionado = st.selectbox("🔍 Selecione um Assessor para filtrar:", lista_assessores, key="filter_assessor_tab5")
-            
-            # 4. Filtrar os dados
-            if assessor_selecionado != "Todos":
-                df_exibir = df_assessor_raw[df_assessor_raw[assessor_col] == assessor_selecionado]
-                st.subheader(f"📊 Resultados Detalhados: {assessor_selecionado}")
-            else:
-                df_exibir = df_assessor_raw
-                st.subheader("Visão Geral - Todos os Assessores")
-
-            df_formatado = df_exibir.copy()
-            
-            # Identifica a coluna de Forecast (ajuste o nome se na planilha for diferente)
-                        # Identifica as colunas de Forecast e Pace
-            col_forecast = next((c for c in df_formatado.columns if 'forecast' in c.lower()), None)
-            col_pace = next((c for c in df_formatado.columns if 'pace' in c.lower()), None)
-            
-            if col_forecast:
-                df_formatado[col_forecast] = pd.to_numeric(
-                df_formatado[col_forecast].astype(str).str.replace('R$', '').str.replace('-', '0').str.strip(), 
-                    errors='coerce'
-                 ).fillna(0).apply(format_currency)
-
-            if col_pace:
-                # Converte para numérico e formata como porcentagem (com 1 casa decimal)
-                df_formatado[col_pace] = pd.to_numeric(df_formatado[col_pace], errors='coerce')
-                df_formatado[col_pace] = df_formatado[col_pace].apply(lambda x: f"{x:.1%}" if pd.notnull(x) else "-")
-
-
-            # Agora passamos o df_formatado para a sua função
-            display_data_table(df_formatado, "Tabela_Assessores", df_formatado.columns.tolist())
-            
-        else:
-            st.warning("⚠️ Não encontramos uma coluna chamada 'Assessor' na aba de dados.")
-            st.info("Colunas disponíveis: " + ", ".join(df_assessor_raw.columns))
-    else:
-        st.error("❌ A aba 'assessor' não foi encontrada no arquivo carregado.")
-        st.info(f"Abas disponíveis: {', '.join(sheets.keys())}")
-
-    st.markdown("## 💼 SDR")
-
-    # Primeira tabela - SDR (aba "SDR")
-    if 'SDR' in sheets:
-        df_sdr_raw = sheets['SDR']
-        st.subheader("SDR - Parcial da Semana")
-        # Na sua planilha, a coluna na aba 'SDR' chama-se 'SDRS'
-        col_name = 'SDRS' if 'SDRS' in df_sdr_raw.columns else 'SDR'
-        df_sdr = df_sdr_raw[df_sdr_raw[col_name].notna() & (df_sdr_raw[col_name] != '')].copy()
-        cols_to_show = [col_name, 'Agendadas', 'Realizadas', 'Convertidas']
-        display_data_table(df_sdr, "SDR_Semanal", cols_to_show)
-        
-        st.divider()
-
-    # Segunda tabela - SDRS (aba "SDR - Semanal")
-    if 'SDR - Semanal' in sheets:
-        df_sdrs_raw = sheets['SDR - Semanal']
-        st.subheader("SDR - Convertidos no Mês (Janeiro)")
-        # Na sua planilha, a coluna na aba 'SDR - Semanal' chama-se 'SDR'
-        col_name = 'SDR' if 'SDR' in df_sdrs_raw.columns else 'SDRS'
-        df_sdrs = df_sdrs_raw[df_sdrs_raw[col_name].notna() & (df_sdrs_raw[col_name] != '')].copy()
-        cols_to_show = [col_name, 'Dez', 'S1', 'S2', 'S3', 'S4']
-        display_data_table(df_sdrs, "SDR_Mensal", cols_to_show)
-
-
-
-with tab6:
-    st.markdown("## 🚀 Assessores - Pipeline")
-    st.markdown("---")
-    if sheets and 'Pipeline - Assessor' in sheets:
-        df_pipe_assessor = sheets['Pipeline - Assessor']
-        assessor_col2 = find_column(df_pipe_assessor, 'Assessor')
-        if assessor_col2:
-            lista_assessores2 = ["Todos"] + sorted(df_pipe_assessor[assessor_col2].unique().tolist())
-            assessor_selecionado_pipe = st.selectbox("🔍 Selecione um Assessor para análise detalhada:", lista_assessores2)
-            
-            if assessor_selecionado_pipe != "Todos":
-                df_filtrado2 = df_pipe_assessor[df_pipe_assessor[assessor_col2] == assessor_selecionado_pipe]
-                st.subheader(f"📊 Resultados: {assessor_selecionado_pipe}")
-                display_data_table(df_filtrado2, "assessor", df_filtrado2.columns.tolist())
-            else:
-                st.subheader("Visão Geral - Todos os Assessores")
-                display_data_table(df_pipe_assessor, "assessor", df_pipe_assessor.columns.tolist())
-with tab7:
-    st.markdown("## 💰 Captação Líquida")
-    st.markdown("---")
-    
-    if sheets and 'captação liq' in sheets:
-        df_captacao = sheets['captação liq'].copy()
-        df_captacao.columns = df_captacao.columns.str.strip()
-        
-        # Remove linhas vazias no início
-        df_captacao = df_captacao[df_captacao.iloc[:, 0].notna()].reset_index(drop=True)
-        
-        try:
-            # SEÇÃO 1: RANGES E OBJETIVOS COM CLASSIFICAÇÃO
-                        # SEÇÃO 1: RANGES E OBJETIVOS (VALORES FIXOS)
-            st.subheader("📊 Ranges de Captação Líquida e Objetivos")
-            
-            # Definindo os dados fixos para os cards
-            ranges_fixos = [
-                {"titulo": "0 - 5 MM", "classificacao": "Sales Hunter", "objetivo": 1000000.0},
-                {"titulo": "10 - 40 MM", "classificacao": "AAI Pleno", "objetivo": 1500000.0},
-                {"titulo": "Acima de 40 MM", "classificacao": "AAI Senior", "objetivo": 2000000.0}
-            ]
-            
-            cols = st.columns(3)
-            for idx, item in enumerate(ranges_fixos):
-                with cols[idx]:
-                    st.markdown(f"""
-                    <div class="range-card">
-                        <div class="range-title">{item['titulo']}</div>
-                        <div class="range-classification">{item['classificacao']}</div>
-                        <div class="range-info">
-                            <span>Objetivo:</span>
-                            <span style="font-weight: bold;">{format_currency(item['objetivo'])}</span>
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
-
-            
-            st.markdown("---")
-            
-            # SEÇÃO 2: FILTRO E TABELA
-            st.subheader("📋 Tabela de Captação por Assessor")
-            
-            # Encontra colunas reais na planilha
-            col_assessor = find_column(df_captacao, 'Assessor')
-            col_posicao = find_column(df_captacao, 'Posição')
-            col_range = find_column(df_captacao, 'Range')
-            col_obj = find_column(df_captacao, ['Objetivo Cap Liq'])
-            col_capt_liq = find_column(df_captacao, ['Captação Líquida'])
-            col_cap_obj = find_column(df_captacao, ['Cap x Objetivo'])
-            col_ativacoes = find_column(df_captacao, 'Ativações')
-            col_habilitacoes = find_column(df_captacao, 'Habilitações')
-            
-            colunas_encontradas = [col_assessor, col_obj, col_capt_liq, col_cap_obj, col_ativacoes, col_habilitacoes]
-            colunas_encontradas = [c for c in colunas_encontradas if c is not None]
-            
-            # Remove a linha de totais
-            df_display = df_captacao[df_captacao[col_assessor].notna()].copy()
-            df_display = df_display[~df_display[col_assessor].astype(str).str.strip().isin(['', 'nan'])].copy()
-            
-            # Remove última linha se for linha de totais
-            if len(df_display) > 0 and df_display.iloc[-1][col_assessor] == '':
-                df_display = df_display[:-1]
-            
-            # Filtro de assessores
-            assessores_list = df_display[col_assessor].unique().tolist()
-            assessores_list = ['Todos'] + [a for a in assessores_list if str(a).strip() != '']
-            
-            assessor_selecionado = st.selectbox(
-                "🔍 Filtrar por Assessor:",
-                assessores_list,
-                key="assessor_filter_captacao"
-            )
-            
-            # Aplica filtro
-            if assessor_selecionado != 'Todos':
-                df_display = df_display[df_display[col_assessor] == assessor_selecionado].copy()
-            
-            # Prepara dataframe para exibição
-            df_display_final = df_display[colunas_encontradas].copy()
-            
-            # Formata colunas
-            if col_obj:
-                # Remove R$, remove pontos de milhar e troca vírgula por ponto
-                df_display_final[col_obj] = df_display_final[col_obj].astype(str).str.replace('R$', '', regex=False).str.strip()
-                df_display_final[col_obj] = df_display_final[col_obj].apply(lambda x: x.replace('.', '').replace(',', '.') if ',' in x else x)
-                df_display_final[col_obj] = pd.to_numeric(df_display_final[col_obj], errors='coerce').fillna(0).apply(format_currency)
-
-            if col_capt_liq:
-                df_display_final[col_capt_liq] = df_display_final[col_capt_liq].astype(str).str.replace('R$', '', regex=False).str.strip()
-                df_display_final[col_capt_liq] = df_display_final[col_capt_liq].apply(lambda x: x.replace('.', '').replace(',', '.') if ',' in x else x)
-                df_display_final[col_capt_liq] = pd.to_numeric(df_display_final[col_capt_liq], errors='coerce').fillna(0).apply(format_currency)
-
-            
-            if col_cap_obj:
-                df_display_final[col_cap_obj] = df_display_final[col_cap_obj].apply(
-                    lambda x: f"{float(str(x).replace('%', '').strip())*100:.0f}%" if pd.notna(x) and str(x).strip() != '' else "0%"
-                )
-            
-            # Renomeia colunas
-            rename_dict = {
-                col_obj: 'Obj. Captação',
-                col_capt_liq: 'Captação Líquida',
-                col_cap_obj: 'Cap. x Obj.',
-                col_ativacoes: 'Ativações',
-                col_habilitacoes: 'Habilitações'
-            }
-            df_display_final = df_display_final.rename(columns=rename_dict)
-            
-            st.dataframe(df_display_final, use_container_width=True, hide_index=True)
-            
-            st.markdown("---")
-            
-            # SEÇÃO 3: CARD DE OBJETIVO TOTAL - PUXANDO DA PLANILHA
-            st.subheader("🎯 Resumo Geral da Captação")
-            
-            # Encontra a linha de totais (última linha preenchida)
-            df_totais = df_captacao.iloc[-2:].copy()
-            
-            # Pega valores da linha de totais
-            total_row = df_captacao[df_captacao[col_assessor].astype(str).str.strip().isin(['', 'nan', 'NaN'])].iloc[0] if len(df_captacao[df_captacao[col_assessor].astype(str).str.strip().isin(['', 'nan', 'NaN'])]) > 0 else df_captacao.iloc[-1]
-            
-            # Converte valores
-            objetivo_total = float(str(total_row['Objetivo Cap Liq']).replace("R$", "").replace(".", "").replace(",", ".")) if pd.notna(total_row['Objetivo Cap Liq']) else 16000000
-            captacao_total = float(str(total_row['Captação Líquida']).replace("R$", "").replace(".", "").replace(",", ".")) if pd.notna(total_row['Captação Líquida']) else 11314555
-            percentual_objetivo = float(str(total_row['Cap x Objetivo']).replace("%", "").strip()) if pd.notna(total_row['Cap x Objetivo']) else 71
-            
-            # Soma ativações e habilitações
-            ativacoes_total = pd.to_numeric(df_captacao[col_ativacoes], errors='coerce').sum()
-            habilitacoes_total = pd.to_numeric(df_captacao[col_habilitacoes], errors='coerce').sum()
-            
-            # Cards com cores mais escuras e menos chamativas
-            col1, col2, col3 = st.columns([1, 1, 1])
-            
-            with col1:
-                st.markdown(f"""
-                <div class="objetivo-card-dark">
-                    <div style="font-size: 14px; opacity: 0.95;">Objetivo Total</div>
-                    <div style="font-size: 32px; font-weight: bold; margin-top: 10px;">
-                        {format_currency(objetivo_total)}
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col2:
-                st.markdown(f"""
-                <div class="objetivo-card-dark">
-                    <div style="font-size: 14px; opacity: 0.95;">Captação Realizada</div>
-                    <div style="font-size: 32px; font-weight: bold; margin-top: 10px;">
-                        {format_currency(captacao_total)}
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col3:
-                st.markdown(f"""
-                <div class="objetivo-card-dark">
-                    <div style="font-size: 14px; opacity: 0.95;">% do Objetivo</div>
-                    <div style="font-size: 32px; font-weight: bold; margin-top: 10px;">
-                        {percentual_objetivo:.1f}%
-                    </div>
-                    <div class="progress-bar">
-                        <div class="progress-fill" style="width: {min(percentual_objetivo, 100)}%;"></div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            # Métricas adicionais
-            st.markdown("### 📈 Métricas Adicionais")
-            col_a, col_b, col_c, col_d = st.columns(4)
-            
-            with col_a:
-                st.metric("Total de Ativações", f"{int(ativacoes_total)}")
-            
-            with col_b:
-                st.metric("Total de Habilitações", f"{int(habilitacoes_total)}")
-            
-            with col_c:
-                assessores_positivos = len(df_captacao[
-                    pd.to_numeric(
-                        df_captacao[col_capt_liq].astype(str).str.replace('R$', '').str.replace('.', '').str.replace(',', '.'),
-                        errors='coerce'
-                    ) > 0
-                ])
-                st.metric("Assessores com Captação Positiva", f"{assessores_positivos}")
-            
-            with col_d:
-                # Calcula corretamente apenas com assessores válidos, sem incluir linhas vazias
-                assessores_validos = df_display[df_display[col_assessor].notna()].copy()
-                media_captacao = captacao_total / max(len(assessores_validos), 1)
-                st.metric("Média de Captação", format_currency(media_captacao))
-            
-            st.markdown("---")
-            st.markdown("*Dashboard atualizado dinamicamente a partir da planilha | Vértiq Investimentos*")
-            
-        except Exception as e:
-            st.error(f"❌ Erro ao processar dados de Captação Líquida: {str(e)}")
-    else:
-        st.warning("⚠️ Aba 'captação liq' não encontrada na planilha!")
-
-# ========== CAMPANHA HOT MONEY ==========
-with tab8:
-    st.markdown("## 🔥 Campanha Hot Money - Janeiro 2026")
-    st.markdown("---")
-    
-    # CARD EXPLICATIVO DA CAMPANHA (em cima da tabela)
-    with st.container(border=True):
-        col_info, col_meta = st.columns([2, 1], gap="medium")
-        
-        with col_info:
-            st.markdown("### O que é a Campanha?")
-            st.markdown("""
-            A "Hot Money" é uma **iniciativa interna** para fecharmos o mês de janeiro com uma **captação líquida mínima de R$ 13,3 milhões** no escritório.
-            
-            Considerando apenas os assessores ativos, precisamos buscar mais **R$ 4 milhões** para atingir o objetivo, 
-            assumindo que os assessores deficitários atinjam ao menos **70% da meta mensal**.
-            """)
-            
-        with col_meta:
-            st.markdown("### 🎯 Meta Principal")
-            st.metric("Captação Líquida", "R$ 13.300.000", "+R$ 4.000.000")
-    
-    # CARDS COM ELEGIBILIDADE E PRÊMIO
-    card1, card2, card3 = st.columns(3, gap="medium")
-    
-    with card1:
-        st.markdown("### Elegibilidade")
-        st.markdown("""
-        **Mínimo 70%** da meta mensal de captação líquida
-        """)
-    
-    with card2:
-        st.markdown("### Premiação")
-        st.markdown("""
-        **Almoço especial do time** (local a definir)
-        """)
-    
-    with card3:
-        st.markdown("### Participantes")
-        st.markdown("""
-        Todos os assessores que atingirem **70%+** da meta
-        """)
-    
-    st.markdown("---")
-    
-    # TABELA DOS DADOS (aqui entra sua tabela original)
-    if sheets and 'Hot Money' in sheets:
-        df_hot_money = sheets['Hot Money']
-        
-        display_data_table(
-            df_hot_money,
-            "Hot Money",
-            column_names=['Assessor', 'Posição', 'Obj. Cap. Liq','Meta Campanha (70%)','Cap Liq', 'Necessário para Campanha'],
-            max_rows=50
-        )
-    else:
-        st.info("📌 Carregue o arquivo Excel com a sheet 'Campanha - Hot Money'")
-
-
-
-st.markdown(
-    "<p style='text-align: center; color: #FFD700; font-size: 12px;'>Dashboard Financeiro © 2026 | Vértiq Digital</p>",
-    unsafe_allow_html=True)
-
-
-
-
-
-
-
-
-
+
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+from concurrent.futures import wait
+from datetime import datetime
+from io import BytesIO
+import os
+from pathlib import Path
+import openpyxl
+
+from advisors import build_advisor_facts, build_advisor_index, build_captacao_index
+from charts import advisor_revenue_bar, product_pie
+from columns import column_index, find_column
+from diagnostics import RunTimer, enabled_from_env, new_history, sheet_stats
+from export import FORMATS, ExportJobs
+from formatting import format_currency, format_currency_series
+from history import PERIODS, HistoryStore, trend
+from ingest import set_progress
+from metrics import CAPTACAO_RANGES, build_overview, captacao_kpis, overview_kpis
+from schema import COUNT, MONEY, PERCENT
+from snapshot import SNAPSHOT_PORT, SNAPSHOT_URL, SnapshotJobs, snapshot_url, start_server
+from tables import column_kind, display_values, paginate
+from theme import STYLE
+from watcher import WATCH_DIR, FolderWatcher
+from workbook_cache import DiskCache, WorkbookCache
+
+
+# Configuração da página
+st.set_page_config(
+    page_title="Dashboard Financeiro - Vértiq",
+    page_icon="📊",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Tempos desta execução (mostrados no modo diagnóstico)
+diag = RunTimer()
+
+st.markdown(STYLE, unsafe_allow_html=True)
+
+
+st.markdown("# 📊 Dashboard Financeiro")
+
+st.sidebar.markdown("## 📋 Menu")
+
+uploaded_file = st.sidebar.file_uploader(
+    "📁 Carregar arquivo Excel",
+    type=["xlsx", "xls"],
+    help="Selecione seu arquivo consorcios.xlsx"
+)
+
+# Modo diagnóstico: leitura, formatação, Plotly e tempo de cada aba
+diagnostico = st.sidebar.toggle("🩺 Modo diagnóstico", value=enabled_from_env(), key="diagnostico")
+
+@st.cache_resource
+def get_disk_cache():
+    return DiskCache()
+
+@st.cache_resource
+def get_workbook_cache():
+    # Uma entrada por conteúdo de arquivo, para todas as sessões, dentro do
+    # limite de memória (DASHVERTIQ_MEMORY_MB)
+    return WorkbookCache(disk_cache=get_disk_cache())
+
+@st.cache_resource
+def get_history():
+    return HistoryStore()
+
+@st.cache_resource
+def get_export_jobs():
+    # Relatórios gerados numa thread própria e guardados em disco (export.py)
+    return ExportJobs()
+
+@st.cache_resource
+def get_watcher():
+    # Modo pasta monitorada (DASHVERTIQ_WATCH_DIR): uma thread lê cada versão
+    # nova da planilha e a publica para todas as sessões
+    return FolderWatcher(WATCH_DIR, get_workbook_cache()).start()
+
+@st.cache_resource
+def get_snapshot_jobs():
+    # Versão estática de cada arquivo (snapshot.py); com DASHVERTIQ_SNAPSHOT_PORT
+    # o servidor das páginas sobe junto com o dashboard
+    jobs = SnapshotJobs()
+    if SNAPSHOT_PORT:
+        start_server(jobs.root, SNAPSHOT_PORT)
+    return jobs
+
+def load_excel(file):
+    """Retorna (sheets, 'hit'/'miss'); sheets é None se o arquivo não pôde ser lido"""
+    try:
+        sheets, status = get_workbook_cache().get(file)
+        return (sheets if len(sheets) else None), status
+    except Exception as e:
+        st.error(f"❌ Erro ao carregar arquivo: {str(e)}")
+        return None, 'erro'
+
+def safe_filter_by_column(df, column_name):
+    try:
+        col = find_column(df, column_name)
+        if col is None:
+            return None
+        return df[(df[col].notna()) & (df[col] != '')]
+    except Exception as e:
+        st.error(f"❌ Erro ao filtrar por {column_name}: {str(e)}")
+        return None
+
+def safe_get_columns(df, column_names):
+    index = column_index(df)
+    existing_columns = []
+    for col in column_names:
+        found_col = index.find(col)
+        if found_col and found_col not in existing_columns:
+            existing_columns.append(found_col)
+    return existing_columns
+
+# Tabelas com mais linhas que max_rows ganham ordenação e páginas; a ordem
+# usa os valores antes da formatação (tables.py)
+def table_page(df, title, max_rows):
+    if len(df) <= max_rows:
+        return df
+    sem_ordem = "(ordem da planilha)"
+    c1, c2, c3 = st.columns([2, 1, 1])
+    ordenar_por = c1.selectbox("Ordenar por", [sem_ordem] + df.columns.tolist(), key=f"{title}_ordem")
+    decrescente = c2.selectbox("Ordem", ["Maior primeiro", "Menor primeiro"], key=f"{title}_sentido",
+                               disabled=ordenar_por == sem_ordem) == "Maior primeiro"
+    paginas = -(-len(df) // max_rows)
+    pagina = c3.number_input(f"Página (de {paginas})", min_value=1, max_value=paginas, value=1, step=1, key=f"{title}_pagina")
+    df_page, total, _ = paginate(df, pagina, max_rows, None if ordenar_por == sem_ordem else ordenar_por,
+                                 ascending=not decrescente)
+    inicio = (pagina - 1) * max_rows
+    st.caption(f"Linhas {inicio + 1}–{inicio + len(df_page)} de {total}")
+    return df_page
+
+# Formato das colunas no navegador: contagens e porcentagens seguem numéricas
+# (menos dados enviados) e só a exibição é formatada. R$ vai como texto
+# 'R$ 1.234,56', igual aos cards: o formato "localized" do Streamlit usaria o
+# idioma do navegador
+def percent_column(col):
+    return st.column_config.NumberColumn(col, format="percent", step=0.001)
+
+def count_column(col):
+    return st.column_config.NumberColumn(col, format="%d")
+
+# Função que formata as colunas
+def display_data_table(df, title, column_names, max_rows=15):
+    try:
+        if df is None or df.empty:
+            st.info(f"ℹ️ Nenhum dado disponível para {title}")
+            return
+        valid_columns = safe_get_columns(df, column_names)
+        if not valid_columns:
+            st.warning(f"⚠️ Nenhuma das colunas esperadas encontrada em {title}")
+            return
+        
+        # Ordena e pagina com os valores originais; só a página é formatada.
+        # Sem .copy(): com Copy-on-Write, trocar uma coluna da página copia só
+        # aquela coluna, e a aba compartilhada entre as sessões não muda
+        df_filtered = table_page(df[valid_columns].dropna(how='all'), title, max_rows)
+        column_config = {}
+
+        # Tipo de cada coluna pelo nome (tables.py): contagem, porcentagem ou R$
+        for col in df_filtered.columns:
+            kind = column_kind(col, pd.api.types.is_numeric_dtype(df_filtered[col].dtype))
+            try:
+                if kind == COUNT:
+                    df_filtered[col] = display_values(df_filtered[col], COUNT)
+                    column_config[col] = count_column(col)
+                elif kind == PERCENT:
+                    column_config[col] = percent_column(col)
+                elif kind == MONEY:
+                    df_filtered[col] = format_currency_series(display_values(df_filtered[col], MONEY))
+            except:
+                pass
+        
+        if df_filtered.empty:
+            st.info(f"ℹ️ Nenhum dado encontrado para {title}")
+            return
+        st.dataframe(df_filtered, use_container_width=True, hide_index=True, column_config=column_config)
+    except Exception as e:
+        st.error(f"❌ Erro inesperado em {title}: {str(e)}")
+
+
+# Trechos com filtro: cada um é um fragmento, então mudar o filtro roda de novo
+# só o trecho, com o mesmo DataFrame já carregado (sem recarregar a página)
+# As opções e as linhas de cada assessor vêm de um índice montado uma vez por
+# arquivo (advisors.py)
+@st.fragment
+def filtro_assessores(index, sheets):
+    lista_assessores = ["Todos"] + index.options
+    assessor_selecionado = st.selectbox("🔍 Selecione um Assessor para filtrar:", lista_assessores, key="filter_assessor_tab5")
+
+    # 4. Filtrar os dados
+    if assessor_selecionado != "Todos":
+        df_exibir = index.rows(assessor_selecionado)
+        st.subheader(f"📊 Resultados Detalhados: {assessor_selecionado}")
+    else:
+        df_exibir = index.df
+        st.subheader("Visão Geral - Todos os Assessores")
+
+    # Forecast e Pace já chegam numéricos (schema.py); a display_data_table
+    # formata Forecast como R$ e Pace como porcentagem
+    display_data_table(df_exibir, "Tabela_Assessores", df_exibir.columns.tolist())
+
+    # Visão 360: a linha do assessor na tabela única (uma por arquivo) com todas as abas.
+    # Montar a tabela lê nove abas: só com o botão ligado (o corpo de um
+    # expander roda mesmo fechado)
+    if assessor_selecionado != "Todos":
+        if st.toggle("🧭 Visão 360 do assessor (todas as abas)", key="visao_360"):
+            with st.spinner("Lendo as abas dos assessores..."):
+                facts = sheets.derived_workbook(build_advisor_facts)
+            linha = facts.row(assessor_selecionado).drop('Assessor', errors='ignore').dropna()
+            if linha.empty:
+                st.info("ℹ️ Assessor não encontrado nas demais abas.")
+            else:
+                st.dataframe(
+                    pd.DataFrame({'Indicador': linha.index, 'Valor': linha.to_numpy(dtype=float)}),
+                    use_container_width=True, hide_index=True
+                )
+            if facts.unmatched:
+                st.caption(f"{len(facts.unmatched)} nome(s) em outras abas sem correspondência na aba 'assessores'")
+                st.dataframe(pd.DataFrame(facts.unmatched), use_container_width=True, hide_index=True)
+
+
+# Quantos assessores aparecem no gráfico de receita; os demais viram 'Outros'
+TOP_ASSESSORES = [5, 10, 15, 20, 30, 50, "Todos"]
+
+@st.fragment
+def grafico_receita_assessores(sheets):
+    top = st.select_slider("Assessores no gráfico", TOP_ASSESSORES, value=20, key="top_assessores")
+    # Uma figura por arquivo e por N, compartilhada entre as sessões (charts.py)
+    fig_bar = sheets.derived_workbook(advisor_revenue_bar, None if top == "Todos" else top)
+    if fig_bar is not None:
+        plotly_chart(fig_bar, use_container_width=True)
+
+
+@st.fragment
+def filtro_pipeline(index):
+    lista_assessores2 = ["Todos"] + index.options
+    assessor_selecionado_pipe = st.selectbox("🔍 Selecione um Assessor para análise detalhada:", lista_assessores2)
+
+    if assessor_selecionado_pipe != "Todos":
+        df_filtrado2 = index.rows(assessor_selecionado_pipe)
+        st.subheader(f"📊 Resultados: {assessor_selecionado_pipe}")
+        display_data_table(df_filtrado2, "assessor", df_filtrado2.columns.tolist())
+    else:
+        st.subheader("Visão Geral - Todos os Assessores")
+        display_data_table(index.df, "assessor", index.df.columns.tolist())
+
+
+@st.fragment
+def filtro_captacao(index):
+    df_captacao = index.df
+    try:
+        # SEÇÃO 2: FILTRO E TABELA
+        st.subheader("📋 Tabela de Captação por Assessor")
+
+        # Encontra colunas reais na planilha
+        col_assessor = find_column(df_captacao, 'Assessor')
+        col_posicao = find_column(df_captacao, 'Posição')
+        col_range = find_column(df_captacao, 'Range')
+        col_obj = find_column(df_captacao, ['Objetivo Cap Liq'])
+        col_capt_liq = find_column(df_captacao, ['Captação Líquida'])
+        col_cap_obj = find_column(df_captacao, ['Cap x Objetivo'])
+        col_ativacoes = find_column(df_captacao, 'Ativações')
+        col_habilitacoes = find_column(df_captacao, 'Habilitações')
+
+        colunas_encontradas = [col_assessor, col_obj, col_capt_liq, col_cap_obj, col_ativacoes, col_habilitacoes]
+        colunas_encontradas = [c for c in colunas_encontradas if c is not None]
+
+        # Remove a linha de totais
+        df_display = df_captacao[df_captacao[col_assessor].notna()]
+        df_display = df_display[~df_display[col_assessor].astype(str).str.strip().isin(['', 'nan'])]
+
+        # Remove última linha se for linha de totais
+        if len(df_display) > 0 and df_display.iloc[-1][col_assessor] == '':
+            df_display = df_display[:-1]
+
+        # Filtro de assessores (na ordem da planilha)
+        assessores_list = ['Todos'] + index.names
+
+        assessor_selecionado = st.selectbox(
+            "🔍 Filtrar por Assessor:",
+            assessores_list,
+            key="assessor_filter_captacao"
+        )
+
+        # Aplica filtro
+        if assessor_selecionado != 'Todos':
+            df_display = index.rows(assessor_selecionado)
+
+        # Prepara dataframe para exibição
+        df_display_final = df_display[colunas_encontradas]
+
+        # Formata colunas (já numéricas desde a leitura, ver schema.py)
+        if col_obj:
+            df_display_final[col_obj] = format_currency_series(df_display_final[col_obj].fillna(0))
+
+        if col_capt_liq:
+            df_display_final[col_capt_liq] = format_currency_series(df_display_final[col_capt_liq].fillna(0))
+
+
+        if col_cap_obj:
+            df_display_final[col_cap_obj] = df_display_final[col_cap_obj].apply(
+                lambda x: f"{x*100:.0f}%" if pd.notna(x) else "0%"
+            )
+
+        # Renomeia colunas
+        rename_dict = {
+            col_obj: 'Obj. Captação',
+            col_capt_liq: 'Captação Líquida',
+            col_cap_obj: 'Cap. x Obj.',
+            col_ativacoes: 'Ativações',
+            col_habilitacoes: 'Habilitações'
+        }
+        df_display_final = df_display_final.rename(columns=rename_dict)
+
+        st.dataframe(df_display_final, use_container_width=True, hide_index=True)
+
+        st.markdown("---")
+
+        # SEÇÃO 3: CARD DE OBJETIVO TOTAL - PUXANDO DA PLANILHA
+        st.subheader("🎯 Resumo Geral da Captação")
+
+        # Totais da planilha e somas calculados em metrics.py
+        kpis = captacao_kpis(index, None if assessor_selecionado == 'Todos' else assessor_selecionado)
+        objetivo_total = kpis['objetivo_total']
+        captacao_total = kpis['captacao_total']
+        percentual_objetivo = kpis['percentual_objetivo']
+        ativacoes_total = kpis['ativacoes_total']
+        habilitacoes_total = kpis['habilitacoes_total']
+
+        # Cards com cores mais escuras e menos chamativas
+        col1, col2, col3 = st.columns([1, 1, 1])
+
+        with col1:
+            st.markdown(f"""
+            <div class="objetivo-card-dark">
+                <div style="font-size: 14px; opacity: 0.95;">Objetivo Total</div>
+                <div style="font-size: 32px; font-weight: bold; margin-top: 10px;">
+                    {format_currency(objetivo_total)}
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+
+        with col2:
+            st.markdown(f"""
+            <div class="objetivo-card-dark">
+                <div style="font-size: 14px; opacity: 0.95;">Captação Realizada</div>
+                <div style="font-size: 32px; font-weight: bold; margin-top: 10px;">
+                    {format_currency(captacao_total)}
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+
+        with col3:
+            st.markdown(f"""
+            <div class="objetivo-card-dark">
+                <div style="font-size: 14px; opacity: 0.95;">% do Objetivo</div>
+                <div style="font-size: 32px; font-weight: bold; margin-top: 10px;">
+                    {percentual_objetivo:.1f}%
+                </div>
+                <div class="progress-bar">
+                    <div class="progress-fill" style="width: {min(percentual_objetivo, 100)}%;"></div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+
+        # Métricas adicionais
+        st.markdown("### 📈 Métricas Adicionais")
+        col_a, col_b, col_c, col_d = st.columns(4)
+
+        with col_a:
+            st.metric("Total de Ativações", f"{int(ativacoes_total)}")
+
+        with col_b:
+            st.metric("Total de Habilitações", f"{int(habilitacoes_total)}")
+
+        with col_c:
+            st.metric("Assessores com Captação Positiva", f"{kpis['assessores_positivos']}")
+
+        with col_d:
+            # Só assessores válidos, sem incluir linhas vazias
+            st.metric("Média de Captação", format_currency(kpis['media_captacao']))
+
+        st.markdown("---")
+        st.markdown("*Dashboard atualizado dinamicamente a partir da planilha | Vértiq Investimentos*")
+    except Exception as e:
+        st.error(f"❌ Erro ao processar dados de Captação Líquida: {str(e)}")
+
+
+if diagnostico:
+    format_currency = diag.wrap('formatação', format_currency)
+    format_currency_series = diag.wrap('formatação', format_currency_series)
+    plotly_chart = diag.wrap('plotly', st.plotly_chart)
+else:
+    plotly_chart = st.plotly_chart
+
+sheets = None
+nome_arquivo = None
+cache_status = '-'
+mensagem_arquivo = "✅ Arquivo carregado com sucesso!"
+status_arquivo = st.sidebar.empty()
+if uploaded_file:
+    sheets, cache_status = load_excel(uploaded_file)
+    nome_arquivo = getattr(uploaded_file, 'name', None)
+    if sheets:
+        status_arquivo.success(mensagem_arquivo)
+    else:
+        st.sidebar.error("❌ Erro ao carregar arquivo")
+elif WATCH_DIR:
+    # Sem upload: a última versão já lida da pasta monitorada (watcher.py)
+    watcher = get_watcher()
+    versao = watcher.current
+    if versao is not None:
+        sheets, cache_status = versao.sheets, 'pasta'
+        nome_arquivo = os.path.basename(versao.path)
+        mensagem_arquivo = (f"✅ {nome_arquivo} (pasta monitorada, versão de "
+                            f"{datetime.fromtimestamp(versao.mtime):%d/%m %H:%M})")
+        status_arquivo.success(mensagem_arquivo)
+    else:
+        st.sidebar.info(f"⏳ Aguardando planilha na pasta monitorada ({WATCH_DIR})")
+    if watcher.error:
+        st.sidebar.warning(f"⚠️ Erro ao ler a versão nova da pasta: {watcher.error}")
+else:
+    st.sidebar.info("📌 Faça upload do arquivo Excel para começar.")
+
+st.sidebar.markdown("---")
+
+def mostrar_progresso(aba, linhas, total):
+    # Aba sendo lida agora (a primeira vez que alguma aba precisa dela)
+    if total:
+        status_arquivo.progress(min(linhas / total, 1.0), text=f"📥 Lendo '{aba}': {linhas:,} de {total:,} linhas".replace(',', '.'))
+    else:
+        status_arquivo.info(f"📥 Lendo '{aba}': {linhas:,} linhas".replace(',', '.'))
+
+lidas_antes = set(sheets.parsed) if sheets else set()
+if sheets:
+    set_progress(mostrar_progresso)
+    # Cada arquivo novo entra no histórico, com a data do upload. A gravação
+    # lê três abas, então roda em segundo plano e não atrasa a aba aberta
+    gravacao = st.session_state.get('historico_gravacao')
+    if gravacao is None or gravacao[0] != sheets.digest:
+        gravacao = (sheets.digest, get_history().submit(sheets, arquivo=nome_arquivo))
+        st.session_state['historico_gravacao'] = gravacao
+    if gravacao[1].done() and gravacao[1].exception() is not None:
+        st.sidebar.warning(f"⚠️ Não foi possível gravar o histórico: {str(gravacao[1].exception())}")
+        # Tenta de novo na próxima execução
+        del st.session_state['historico_gravacao']
+    # Modo versão estática: uma página por arquivo, gerada em segundo plano,
+    # para quem só visualiza o dashboard
+    if SNAPSHOT_URL:
+        pagina = get_snapshot_jobs().publish(sheets, nome_arquivo or 'planilha')
+        if not pagina.done():
+            st.sidebar.caption("🌐 Gerando a versão estática...")
+        elif pagina.exception() is not None:
+            st.sidebar.warning(f"⚠️ Não foi possível gerar a versão estática: {str(pagina.exception())}")
+        else:
+            st.sidebar.markdown(f"🌐 [Versão estática (só leitura)]({snapshot_url(pagina.result())})")
+diag.start('tempo da aba')
+
+# Só a aba aberta é executada (e só as planilhas que ela usa são lidas)
+tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9 = st.tabs(["Visão Geral", "Consórcios", "Seguros", "Advisor", "Time Comercial", "Comercial - Pipeline", "Captação Liq", 'Campanha - Hot Money', "Histórico"], key="aba_ativa", on_change="rerun")
+
+with tab1:
+    if tab1.open:
+        st.markdown("## 📈 Visão Geral")
+        st.markdown("---")
+    
+        if sheets and 'visão geral' in sheets:
+            try:
+                # Rótulos e bloco de produtos indexados uma vez por arquivo
+                overview = sheets.derived('visão geral', build_overview)
+                if overview.missing:
+                    st.warning(f"⚠️ Rótulos não encontrados na aba 'visão geral': {', '.join(overview.missing)}")
+                if overview.duplicates:
+                    st.warning(f"⚠️ Rótulos repetidos na aba 'visão geral' (vale o primeiro): {', '.join(overview.duplicates)}")
+                if overview.products is not None:
+                    df_prod = overview.products
+                
+                    # Indicadores calculados em metrics.py (também usados pelo batch.py)
+                    kpis = overview_kpis(overview)
+                    total_realizado = kpis['receita_total_realizada']
+                    forecast_val = kpis['forecast']
+                    meta_dia_util = kpis['pace']
+                    meta_total = kpis['meta_total']
+                    percent_meta = kpis['percent_meta']
+
+                    # Primeiros 4 cards
+                    # Visão Gera
+    # PRIMEIRO ROW - 3 cards principais (centralizado)
+                    m1, m2, m3 = st.columns(3, gap="medium")
+
+                    with m1:
+                        st.metric("Receita Total Realizada", format_currency(total_realizado))
+                    
+                    with m2:
+                        st.metric("Forecast", format_currency(forecast_val) if forecast_val is not None else "-")
+                    
+                    with m3:
+                        st.metric("Pace", format_currency(meta_dia_util) if meta_dia_util is not None else "-")
+
+                    st.markdown("<br>", unsafe_allow_html=True)
+
+                    # SEGUNDO ROW - 2 cards (melhor proporção)
+                    c1, c2 = st.columns(2, gap="medium")
+
+                    with c1:
+                        st.metric("% da Meta Atingida", f"{percent_meta:.1f}%" if percent_meta is not None else "-")
+                    
+                    with c2:
+                        st.metric("Meta Total", format_currency(meta_total) if meta_total is not None else "-")
+
+                
+                    st.markdown("---")
+                
+                    st.subheader("🎯 Concentração de Receita por Produto")
+                    # Figura montada uma vez por arquivo (charts.py)
+                    fig_pie = sheets.derived_workbook(product_pie)
+                    plotly_chart(fig_pie, use_container_width=True)
+                
+                    st.markdown("---")
+                    st.subheader("👤 Receita por Assessor")
+                
+                    if 'assessores' in sheets:
+                        grafico_receita_assessores(sheets)
+
+                    st.markdown("---")
+                
+                
+                    df_prod_display = df_prod.assign(
+                        Realizado=format_currency_series(df_prod['Realizado']),
+                        Meta=format_currency_series(df_prod['Meta'])
+                    )
+                    st.dataframe(df_prod_display, use_container_width=True, hide_index=True)
+                
+                else:
+                    st.warning("⚠️ Estrutura da aba 'visão geral' não reconhecida.")
+            except Exception as e:
+                st.error(f"❌ Erro ao processar aba Visão Geral: {str(e)}")
+            
+        elif sheets:
+            st.info("💡 Aba 'visão geral' não encontrada no arquivo.")
+        else:
+            st.info("💡 Carregue um arquivo para ver os dados.")
+
+with tab2:
+    if tab2.open:
+        st.markdown("## 🏢 Consórcios")
+        st.markdown("---")
+        if sheets and 'consórcios' in sheets:
+            df = sheets['consórcios']
+            st.subheader("👥 Dados por Assessor")
+            df_assessores = safe_filter_by_column(df, 'Assessor')
+            display_data_table(df_assessores, "Assessores Consórcios", ['Assessor', 'Reuniões realizadas', 'Convertidos'])
+        
+            st.markdown("---")
+            st.subheader("📊 Pipeline de Vendas")
+            df_pipeline = safe_filter_by_column(df, 'Pipeline')
+            display_data_table(df_pipeline, "Pipeline Consórcios", ['Pipeline', 'Vendido', 'Receita Atual', 'Objetivo', 'Receita Projetada'])
+        else:
+            st.warning("⚠️ Sheet 'consórcios' não encontrada.")
+
+with tab3:
+    if tab3.open:
+        st.markdown("## 🛡️ Seguros")
+        st.markdown("---")
+        if sheets and 'seguros' in sheets:
+            df = sheets['seguros']
+            st.subheader("👥 Dados por Assessor")
+            df_assessores = safe_filter_by_column(df, 'Assessor')
+            display_data_table(df_assessores, "Assessores Seguros", ['Assessor', 'Reuniões realizadas', 'Convertidos'])
+        
+            st.markdown("---")
+            st.subheader("📊 Pipeline de Seguros")
+            display_data_table(df, "Pipeline Seguros", ['Whole life', 'Vida', 'Plano Saude', 'Receita Do Mês', 'Receita Acumulada'])
+        else:
+            st.warning("⚠️ Sheet 'seguros' não encontrada.")
+
+with tab4:
+    if tab4.open:
+        st.markdown("## 💼 Advisor")
+        st.markdown("---")
+        st.markdown("---")
+
+        if sheets:
+            if 'advisor - geral' in sheets:
+                df = sheets['advisor - geral']
+                st.subheader("📋 Advisor - Geral")
+                df_geral = safe_filter_by_column(df, 'Assessor')
+                display_data_table(df_geral, "Advisor Geral", ['Assessor', 'Reuniões realizadas', 'Convertidos', 'Produto', 'Valor Venda'])
+            
+                st.markdown("---")
+                st.subheader("📊 Pipeline Advisor")
+                df_pipeline = safe_filter_by_column(df, 'Pipeline')
+                display_data_table(df_pipeline, "Pipeline Advisor", ['Pipeline', 'Vendido', 'Receita Atual', 'Objetivo', 'Receita Projetada'])
+        
+            if 'COE - Ouro' in sheets:
+                st.markdown("---")
+                st.subheader("🏆 COE - Ouro")
+                df_ouro = sheets['COE - Ouro']  # linhas e colunas vazias já removidas na leitura
+                display_data_table(df_ouro, "COE Ouro", df_ouro.columns.tolist())
+        
+            if 'PE - Prata' in sheets:
+                st.markdown("---")
+                st.subheader("🥈 PE - Prata")
+                df_prata = sheets['PE - Prata']
+                display_data_table(df_prata, "PE Prata", df_prata.columns.tolist())
+
+
+        else:
+            st.warning("⚠️ Nenhum arquivo carregado.")
+
+        col_m1, col_m2 = st.columns(2)
+    
+        with col_m1:
+            st.markdown("""
+            <div class="info-card">
+                <h3> Missões 1.0</h3>
+                <ul>
+                    <li><b>Renda Variável:</b> Vol. mín. R$ 250k (Corretagem Bovespa)</li>
+                    <li><b>Internacional:</b> Remessa mín. USD 30k (Conta Global)</li>
+                    <li><b>COE:</b> Alocar mín. R$ 100k (Prateleira Janeiro)</li>
+                    <li style="color: #FFD700;"><b>Premiação:</b> Até R$ 26.000,00 adicionais</li>
+                </ul>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col_m2:
+            st.markdown("""
+            <div class="info-card">
+                <h3> Missão 2.0</h3>
+                <ul>
+                    <li><b>Renda Fixa:</b> Vol. R$ 200k (Prêmio R$ 1k) | R$ 300k (Prêmio R$ 2k)</li>
+                    <li><b>Fundos Fechados:</b> R$ 300k Balcão / 400k Listados (Prêmio R$ 1k)</li>
+                    <li><b>Conta PJ:</b> Aporte 350k-500k (Prêmio R$ 1k) | > 600k (Prêmio R$ 2k)</li>
+                    <li style="color: #FFD700;"><b>Vencimento RF:</b> A partir de Jan/2029</li>
+                </ul>
+            </div>
+            """, unsafe_allow_html=True)
+
+        st.markdown("---")
+
+        if 'missões' in sheets:
+            df = sheets['missões']
+            st.subheader("Missões 1.0")
+            df_missoes1 = safe_filter_by_column(df, 'Assessor')
+            display_data_table(df_missoes1, "Missões", ['Assessor', 'Status', 'Cod Matriz', 'Nome Matriz', 'Núcleo', 'Elegivel RV', 'Elegivel Internacional', 'Elegivel COE', 'Premiação máxima'])
+            
+        st.markdown("---")
+
+        if 'missões 2.0' in sheets:
+            df = sheets['missões 2.0']
+            st.subheader("Missões 2.0")
+            df_missoes2 = safe_filter_by_column(df, 'Assessor')
+            display_data_table(df_missoes2, "Missões 2.0", ['Assessor', 'Status', 'Cod Matriz', 'Nome Matriz', 'Núcleo', 'Elegivel RV', 'Elegivel Fundos', 'Elegivel PJ', 'Prem Max'])
+            
+        st.markdown("---")
+
+        if 'banco master' in sheets:
+            df = sheets['banco master']
+            st.subheader("Banco Master")
+            df_master = safe_filter_by_column(df, 'Assessores')
+            display_data_table(df_master, "Banco Master", ['Assessore', 'Volume FGC', 'Volume Convertido'])
+
+with tab5:
+    if tab5.open:
+
+        # 1. Verificar se a aba existe (usando uma busca mais flexível para o nome da aba)
+        assessor_sheet_name = next((s for s in sheets.keys() if s.lower().strip() == 'assessores'), None)
+    
+        if assessor_sheet_name:
+            df_assessor_raw = sheets[assessor_sheet_name]
+            st.markdown("## 👥 Análise por Assessor")
+            st.markdown("---")
+        
+            # 2. Encontrar a coluna do Assessor (flexível) e indexar seus nomes
+            index_assessores = sheets.derived(assessor_sheet_name, build_advisor_index, 'Assessores')
+        
+            if index_assessores.column:
+                # 3. Filtro e tabela rodam de novo sozinhos quando o assessor muda
+                filtro_assessores(index_assessores, sheets)
+            
+            else:
+                st.warning("⚠️ Não encontramos uma coluna chamada 'Assessor' na aba de dados.")
+                st.info("Colunas disponíveis: " + ", ".join(df_assessor_raw.columns))
+        else:
+            st.error("❌ A aba 'assessor' não foi encontrada no arquivo carregado.")
+            st.info(f"Abas disponíveis: {', '.join(sheets.keys())}")
+
+        st.markdown("## 💼 SDR")
+
+        # Primeira tabela - SDR (aba "SDR")
+        if 'SDR' in sheets:
+            df_sdr_raw = sheets['SDR']
+            st.subheader("SDR - Parcial da Semana")
+            # Na sua planilha, a coluna na aba 'SDR' chama-se 'SDRS'
+            col_name = 'SDRS' if 'SDRS' in df_sdr_raw.columns else 'SDR'
+            df_sdr = df_sdr_raw[df_sdr_raw[col_name].notna() & (df_sdr_raw[col_name] != '')]
+            cols_to_show = [col_name, 'Agendadas', 'Realizadas', 'Convertidas']
+            display_data_table(df_sdr, "SDR_Semanal", cols_to_show)
+        
+            st.divider()
+
+        # Segunda tabela - SDRS (aba "SDR - Semanal")
+        if 'SDR - Semanal' in sheets:
+            df_sdrs_raw = sheets['SDR - Semanal']
+            st.subheader("SDR - Convertidos no Mês (Janeiro)")
+            # Na sua planilha, a coluna na aba 'SDR - Semanal' chama-se 'SDR'
+            col_name = 'SDR' if 'SDR' in df_sdrs_raw.columns else 'SDRS'
+            df_sdrs = df_sdrs_raw[df_sdrs_raw[col_name].notna() & (df_sdrs_raw[col_name] != '')]
+            cols_to_show = [col_name, 'Dez', 'S1', 'S2', 'S3', 'S4']
+            display_data_table(df_sdrs, "SDR_Mensal", cols_to_show)
+
+
+
+with tab6:
+    if tab6.open:
+        st.markdown("## 🚀 Assessores - Pipeline")
+        st.markdown("---")
+        if sheets and 'Pipeline - Assessor' in sheets:
+            index_pipeline = sheets.derived('Pipeline - Assessor', build_advisor_index, 'Assessor')
+            if index_pipeline.column:
+                filtro_pipeline(index_pipeline)
+with tab7:
+    if tab7.open:
+        st.markdown("## 💰 Captação Líquida")
+        st.markdown("---")
+    
+        if sheets and 'captação liq' in sheets:
+            # Aba sem as linhas vazias do início, com o índice de assessores
+            index_captacao = sheets.derived('captação liq', build_captacao_index)
+        
+            try:
+                # SEÇÃO 1: RANGES E OBJETIVOS COM CLASSIFICAÇÃO
+                            # SEÇÃO 1: RANGES E OBJETIVOS (VALORES FIXOS)
+                st.subheader("📊 Ranges de Captação Líquida e Objetivos")
+            
+                # Dados fixos dos cards (metrics.py)
+                cols = st.columns(3)
+                for idx, item in enumerate(CAPTACAO_RANGES):
+                    with cols[idx]:
+                        st.markdown(f"""
+                        <div class="range-card">
+                            <div class="range-title">{item['titulo']}</div>
+                            <div class="range-classification">{item['classificacao']}</div>
+                            <div class="range-info">
+                                <span>Objetivo:</span>
+                                <span style="font-weight: bold;">{format_currency(item['objetivo'])}</span>
+                            </div>
+                        </div>
+                        """, unsafe_allow_html=True)
+
+            
+                st.markdown("---")
+            
+                # Filtro, tabela e resumo rodam de novo sozinhos quando o filtro muda
+                filtro_captacao(index_captacao)
+            
+            except Exception as e:
+                st.error(f"❌ Erro ao processar dados de Captação Líquida: {str(e)}")
+        else:
+            st.warning("⚠️ Aba 'captação liq' não encontrada na planilha!")
+
+# ========== CAMPANHA HOT MONEY ==========
+with tab8:
+    if tab8.open:
+        st.markdown("## 🔥 Campanha Hot Money - Janeiro 2026")
+        st.markdown("---")
+    
+        # CARD EXPLICATIVO DA CAMPANHA (em cima da tabela)
+        with st.container(border=True):
+            col_info, col_meta = st.columns([2, 1], gap="medium")
+        
+            with col_info:
+                st.markdown("### O que é a Campanha?")
+                st.markdown("""
+                A "Hot Money" é uma **iniciativa interna** para fecharmos o mês de janeiro com uma **captação líquida mínima de R$ 13,3 milhões** no escritório.
+            
+                Considerando apenas os assessores ativos, precisamos buscar mais **R$ 4 milhões** para atingir o objetivo, 
+                assumindo que os assessores deficitários atinjam ao menos **70% da meta mensal**.
+                """)
+            
+            with col_meta:
+                st.markdown("### 🎯 Meta Principal")
+                st.metric("Captação Líquida", "R$ 13.300.000", "+R$ 4.000.000")
+    
+        # CARDS COM ELEGIBILIDADE E PRÊMIO
+        card1, card2, card3 = st.columns(3, gap="medium")
+    
+        with card1:
+            st.markdown("### Elegibilidade")
+            st.markdown("""
+            **Mínimo 70%** da meta mensal de captação líquida
+            """)
+    
+        with card2:
+            st.markdown("### Premiação")
+            st.markdown("""
+            **Almoço especial do time** (local a definir)
+            """)
+    
+        with card3:
+            st.markdown("### Participantes")
+            st.markdown("""
+            Todos os assessores que atingirem **70%+** da meta
+            """)
+    
+        st.markdown("---")
+    
+        # TABELA DOS DADOS (aqui entra sua tabela original)
+        if sheets and 'Hot Money' in sheets:
+            df_hot_money = sheets['Hot Money']
+        
+            display_data_table(
+                df_hot_money,
+                "Hot Money",
+                column_names=['Assessor', 'Posição', 'Obj. Cap. Liq','Meta Campanha (70%)','Cap Liq', 'Necessário para Campanha'],
+                max_rows=50
+            )
+        else:
+            st.info("📌 Carregue o arquivo Excel com a sheet 'Campanha - Hot Money'")
+
+with tab9:
+    if tab9.open:
+        st.markdown("## 📅 Histórico")
+        st.markdown("---")
+
+        gravacao = st.session_state.get('historico_gravacao')
+        if sheets and gravacao and not gravacao[1].done():
+            with st.spinner("Gravando o arquivo atual no histórico..."):
+                wait([gravacao[1]])
+        # Só os uploads gravados desde a última consulta são lidos do SQLite
+        historico_assessores = get_history().advisor_history()
+        if historico_assessores.empty:
+            st.info("📌 O histórico começa no primeiro upload: cada arquivo novo enviado entra aqui.")
+        else:
+            periodo = st.radio("Período", list(PERIODS), horizontal=True, key="historico_periodo")
+            df_trend = trend(historico_assessores, PERIODS[periodo])
+            ultimo_periodo = df_trend[df_trend['periodo'] == df_trend['periodo'].max()]
+            assessores_selecionados = st.multiselect(
+                "Assessores",
+                sorted(df_trend['assessor'].unique()),
+                default=ultimo_periodo.nlargest(5, 'receita')['assessor'].tolist(),
+                key="historico_assessores"
+            )
+            st.caption(
+                f"{historico_assessores['upload_id'].nunique()} upload(s) de {historico_assessores['data'].min()} "
+                f"a {historico_assessores['data'].max()}; cada ponto é o último upload do período.")
+
+            df_sel = df_trend[df_trend['assessor'].isin(assessores_selecionados)]
+            for coluna, titulo in [('receita', "👤 Receita por Assessor"), ('captacao', "💰 Captação Líquida por Assessor")]:
+                st.subheader(titulo)
+                fig_hist = go.Figure()
+                for nome, grupo in df_sel.groupby('assessor'):
+                    fig_hist.add_trace(go.Scatter(
+                        x=grupo['periodo'],
+                        y=grupo[coluna],
+                        mode='lines+markers',
+                        name=nome,
+                        hovertemplate='<b>' + nome + '</b> %{x|%d/%m/%Y}: R$ %{y:,.2f}<extra></extra>'
+                    ))
+                fig_hist.update_layout(
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='#FFD700'),
+                    margin=dict(t=20, b=20, l=20, r=20),
+                    xaxis=dict(showgrid=False),
+                    yaxis=dict(gridcolor='rgba(255, 215, 0, 0.1)'),
+                    height=400
+                )
+                plotly_chart(fig_hist, use_container_width=True)
+
+
+
+diag.stop('tempo da aba')
+set_progress(None)
+if sheets and set(sheets.parsed) != lidas_antes:
+    status_arquivo.success(mensagem_arquivo)
+
+st.markdown(
+    "<p style='text-align: center; color: #FFD700; font-size: 12px;'>Dashboard Financeiro © 2026 | Vértiq Digital</p>",
+    unsafe_allow_html=True)
+
+# Tempo de leitura das abas já carregadas (as demais só são lidas quando abertas)
+if sheets:
+    for sheet, erro in sheets.errors.items():
+        st.sidebar.warning(f"⚠️ Erro ao carregar sheet '{sheet}': {erro}")
+    with st.sidebar.expander("⏱️ Tempo de leitura por aba"):
+        parse_times = {sheet: sheets.parse_times[sheet] for sheet in sheets.parsed}
+        st.dataframe(
+            pd.DataFrame({
+                'Aba': list(parse_times),
+                'Segundos': [round(t, 4) for t in parse_times.values()],
+                'Origem': [sheets.sources[sheet] for sheet in parse_times],
+            }),
+            use_container_width=True, hide_index=True
+        )
+        st.caption(f"{len(parse_times)} de {len(sheets)} abas lidas · Total: {sum(parse_times.values()):.3f} s")
+    # Células que não viraram número na leitura (ficam em branco nas tabelas)
+    nao_convertidas = [item for sheet in sheets.parsed for item in sheets.coercion_report.get(sheet, [])]
+    if nao_convertidas:
+        with st.sidebar.expander(f"🧹 Células não convertidas ({len(nao_convertidas)})"):
+            st.dataframe(pd.DataFrame(nao_convertidas), use_container_width=True, hide_index=True)
+
+# Relatório completo para baixar: gerado em segundo plano; enquanto não fica
+# pronto, só este trecho é atualizado (a cada 2 s)
+FORMATOS_RELATORIO = {"Excel (.xlsx)": "xlsx", "HTML": "html"}
+
+def exportar_relatorio(sheets, nome, pendente):
+    formato = FORMATOS_RELATORIO[st.radio("Formato", list(FORMATOS_RELATORIO), horizontal=True, key="relatorio_formato")]
+    jobs = get_export_jobs()
+    job = jobs.job(sheets.digest, formato, nome)
+    # A atualização automática liga e desliga com a página inteira
+    if pendente != (job is not None and not job.done()):
+        st.rerun()
+    if job is None:
+        if st.button("Gerar relatório", key="relatorio_gerar"):
+            jobs.submit(sheets, formato, nome)
+            st.rerun()
+    elif not job.done():
+        st.info("⏳ Gerando o relatório...")
+    elif job.exception() is not None:
+        st.error(f"❌ Erro ao gerar o relatório: {str(job.exception())}")
+        if st.button("Tentar de novo", key="relatorio_gerar"):
+            jobs.submit(sheets, formato, nome)
+            st.rerun()
+    else:
+        # O arquivo só é lido do disco quando o botão é clicado
+        st.download_button(
+            "📥 Baixar relatório", Path(job.result()).read_bytes,
+            file_name=f"{os.path.splitext(nome)[0]}.{formato}", mime=FORMATS[formato], key="relatorio_baixar"
+        )
+
+if sheets:
+    with st.sidebar.expander("📤 Exportar relatório"):
+        formato = FORMATOS_RELATORIO[st.session_state.get("relatorio_formato", next(iter(FORMATOS_RELATORIO)))]
+        nome = nome_arquivo or 'relatorio.xlsx'
+        job = get_export_jobs().job(sheets.digest, formato, nome)
+        pendente = job is not None and not job.done()
+        st.fragment(exportar_relatorio, run_every=2 if pendente else None)(sheets, nome, pendente)
+
+# Painel do modo diagnóstico (com histórico das últimas execuções desta sessão)
+if diagnostico:
+    historico = st.session_state.setdefault('diag_historico', new_history())
+    lidas_agora = [sheet for sheet in sheets.parsed if sheet not in lidas_antes] if sheets else []
+    leitura = sum(sheets.parse_times[sheet] for sheet in lidas_agora) if sheets else 0.0
+    outros = leitura + diag.categories['formatação'] + diag.categories['plotly']
+    historico.append(diag.record(
+        aba=st.session_state.get('aba_ativa') or 'Visão Geral',
+        leitura=round(leitura, 4),
+        **{'cálculo e tabelas': round(max(diag.sections.get('tempo da aba', 0.0) - outros, 0.0), 4)},
+        load_excel=cache_status,
+    ))
+    with st.sidebar.expander("🩺 Diagnóstico", expanded=True):
+        ultimo = historico[-1]
+        st.caption(f"Última execução ({ultimo['hora']}) · aba {ultimo['aba']} · load_excel: {ultimo['load_excel']}")
+        d1, d2 = st.columns(2)
+        d1.metric("Total", f"{ultimo['total']:.3f} s")
+        d2.metric("Aba", f"{ultimo.get('tempo da aba', 0):.3f} s")
+        d1.metric("Leitura", f"{ultimo['leitura']:.3f} s")
+        d2.metric("Formatação", f"{ultimo.get('formatação', 0):.3f} s")
+        d1.metric("Plotly", f"{ultimo.get('plotly', 0):.3f} s")
+        d2.metric("Cálculo e tabelas", f"{ultimo['cálculo e tabelas']:.3f} s")
+
+        workbook_cache = get_workbook_cache()
+        st.markdown("**Arquivos em memória (todas as sessões)**")
+        st.dataframe(workbook_cache.stats(), use_container_width=True, hide_index=True)
+        st.caption(f"{workbook_cache.nbytes / 1024 ** 2:.1f} MB de {workbook_cache.max_bytes / 1024 ** 2:.0f} MB")
+
+        if sheets:
+            st.markdown("**Abas em memória**")
+            df_abas = sheet_stats(sheets)
+            st.dataframe(df_abas, use_container_width=True, hide_index=True)
+            st.caption(f"Total: {df_abas['MB'].sum():.3f} MB (sem compactar: {df_abas['MB sem compactar'].sum():.3f} MB)")
+
+        st.markdown(f"**Histórico ({len(historico)} execuções)**")
+        df_historico = pd.DataFrame(list(historico))
+        st.line_chart(df_historico.pivot_table(index=df_historico.index, columns='aba', values='tempo da aba'))
+        st.dataframe(df_historico.iloc[::-1], use_container_width=True, hide_index=True)
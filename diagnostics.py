@@ -0,0 +1,90 @@
+"""Medições do modo diagnóstico do dashboard (sem dependência do Streamlit).
+
+Ligado pelo botão na barra lateral ou pela variável de ambiente
+``DASHVERTIQ_DIAGNOSTICS=1``. Cada execução do script tem um ``RunTimer``;
+o dashboard guarda os registros (``RunTimer.record``) num histórico por
+sessão para acompanhar qual aba piora conforme a planilha cresce.
+"""
+import functools
+import os
+import time
+from collections import defaultdict, deque
+
+import pandas as pd
+
+from schema import frame_nbytes
+
+ENV_VAR = 'DASHVERTIQ_DIAGNOSTICS'
+# Execuções guardadas no histórico de cada sessão
+HISTORY_SIZE = 50
+
+
+def enabled_from_env():
+    return os.environ.get(ENV_VAR, '').strip().lower() in ('1', 'true', 'sim', 'on', 'yes')
+
+
+def new_history():
+    return deque(maxlen=HISTORY_SIZE)
+
+
+class RunTimer:
+    """Tempos de uma execução do script.
+
+    ``start``/``stop`` medem trechos (ex.: a aba aberta); ``wrap`` devolve
+    a função embrulhada para acumular o tempo gasto nela numa categoria
+    (ex.: 'formatação', 'plotly').
+    """
+
+    def __init__(self):
+        self.created = time.time()
+        self._t0 = time.perf_counter()
+        self._open = {}
+        self.sections = {}
+        self.categories = defaultdict(float)
+
+    def start(self, name):
+        self._open[name] = time.perf_counter()
+
+    def stop(self, name):
+        start = self._open.pop(name, None)
+        if start is not None:
+            self.sections[name] = self.sections.get(name, 0.0) + time.perf_counter() - start
+
+    def wrap(self, category, fn):
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.categories[category] += time.perf_counter() - start
+        return timed
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self._t0
+
+    def record(self, **extra):
+        """Resumo da execução para o histórico (tempos em segundos)"""
+        row = {'hora': time.strftime('%H:%M:%S', time.localtime(self.created)), 'total': round(self.elapsed, 4)}
+        row.update({name: round(t, 4) for name, t in self.sections.items()})
+        row.update({name: round(t, 4) for name, t in self.categories.items()})
+        row.update(extra)
+        return row
+
+
+def sheet_stats(sheets):
+    """Abas já lidas: linhas, colunas, tamanho em memória (e antes da compactação), tempo e origem"""
+    rows = []
+    for name in sheets.parsed:
+        df = sheets[name]
+        rows.append({
+            'Aba': name,
+            'Linhas': len(df),
+            'Colunas': df.shape[1],
+            'MB': round(frame_nbytes(df) / 1024 ** 2, 3),
+            'MB sem compactar': round(sheets.memory[name][0] / 1024 ** 2, 3) if name in sheets.memory else None,
+            'Leitura (s)': round(sheets.parse_times.get(name, 0.0), 4),
+            'Origem': sheets.sources.get(name, ''),
+        })
+    return pd.DataFrame(rows, columns=['Aba', 'Linhas', 'Colunas', 'MB', 'MB sem compactar', 'Leitura (s)', 'Origem'])
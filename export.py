@@ -0,0 +1,411 @@
+"""Relatório exportado (XLSX formatado e HTML autocontido), sem Streamlit.
+
+O relatório traz os cards da Visão Geral e da Captação Líquida e todas as
+tabelas que o dashboard mostra com ``display_data_table``, inteiras (sem o
+limite de linhas da tela). ``ExportJobs`` gera os arquivos numa thread à
+parte e guarda o resultado em disco: exportar de novo o mesmo arquivo, com
+o mesmo nome e no mesmo formato, não gera nada.
+"""
+import hashlib
+import html
+import os
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+
+import openpyxl
+import pandas as pd
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill
+
+from advisors import build_captacao_index
+from columns import column_index, find_column
+from formatting import format_currency, format_currency_series
+from ingest import INGEST_VERSION
+from metrics import build_overview, captacao_columns, captacao_kpis, overview_kpis
+from schema import COUNT, MONEY, PERCENT
+from tables import column_kind, display_values
+from workbook_cache import CACHE_DIR
+
+# Versão do layout do relatório; arquivos gerados com outra versão são refeitos
+EXPORT_VERSION = 1
+EXPORT_DIR = os.path.join(CACHE_DIR, 'exports')
+# Relatórios guardados em disco (os mais antigos saem primeiro)
+EXPORTS_KEPT = 50
+# Porcentagem já multiplicada por 100 (cards: 71.0 = 71%)
+POINTS = 'points'
+
+FORMATS = {
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'html': 'text/html',
+}
+
+# Seções do relatório, na ordem das abas do dashboard
+SECTIONS = ['Visão Geral', 'Consórcios', 'Seguros', 'Advisor', 'Time Comercial', 'Comercial - Pipeline',
+            'Captação Liq', 'Campanha - Hot Money']
+
+# Tabelas do relatório:
+# (aba do dashboard, título, aba da planilha, coluna das linhas válidas, colunas)
+# A coluna das linhas válidas é a do safe_filter_by_column; colunas None = todas
+REPORT_TABLES = [
+    ('Consórcios', 'Assessores Consórcios', 'consórcios', 'Assessor', ['Assessor', 'Reuniões realizadas', 'Convertidos']),
+    ('Consórcios', 'Pipeline Consórcios', 'consórcios', 'Pipeline', ['Pipeline', 'Vendido', 'Receita Atual', 'Objetivo', 'Receita Projetada']),
+    ('Seguros', 'Assessores Seguros', 'seguros', 'Assessor', ['Assessor', 'Reuniões realizadas', 'Convertidos']),
+    ('Seguros', 'Pipeline Seguros', 'seguros', None, ['Whole life', 'Vida', 'Plano Saude', 'Receita Do Mês', 'Receita Acumulada']),
+    ('Advisor', 'Advisor Geral', 'advisor - geral', 'Assessor', ['Assessor', 'Reuniões realizadas', 'Convertidos', 'Produto', 'Valor Venda']),
+    ('Advisor', 'Pipeline Advisor', 'advisor - geral', 'Pipeline', ['Pipeline', 'Vendido', 'Receita Atual', 'Objetivo', 'Receita Projetada']),
+    ('Advisor', 'COE Ouro', 'COE - Ouro', None, None),
+    ('Advisor', 'PE Prata', 'PE - Prata', None, None),
+    ('Advisor', 'Missões', 'missões', 'Assessor', ['Assessor', 'Status', 'Cod Matriz', 'Nome Matriz', 'Núcleo', 'Elegivel RV', 'Elegivel Internacional', 'Elegivel COE', 'Premiação máxima']),
+    ('Advisor', 'Missões 2.0', 'missões 2.0', 'Assessor', ['Assessor', 'Status', 'Cod Matriz', 'Nome Matriz', 'Núcleo', 'Elegivel RV', 'Elegivel Fundos', 'Elegivel PJ', 'Prem Max']),
+    ('Advisor', 'Banco Master', 'banco master', 'Assessores', ['Assessore', 'Volume FGC', 'Volume Convertido']),
+    ('Time Comercial', 'Assessores', 'assessores', None, None),
+    ('Time Comercial', 'SDR - Parcial da Semana', 'SDR', 'SDR', ['SDR', 'Agendadas', 'Realizadas', 'Convertidas']),
+    ('Time Comercial', 'SDR - Convertidos no Mês', 'SDR - Semanal', 'SDR', ['SDR', 'Dez', 'S1', 'S2', 'S3', 'S4']),
+    ('Comercial - Pipeline', 'Pipeline por Assessor', 'Pipeline - Assessor', None, None),
+    ('Campanha - Hot Money', 'Hot Money', 'Hot Money', None, ['Assessor', 'Posição', 'Obj. Cap. Liq', 'Meta Campanha (70%)', 'Cap Liq', 'Necessário para Campanha']),
+]
+
+# Colunas da tabela de captação: chave de metrics.captacao_columns -> (nome na tela, tipo)
+_CAPTACAO_KINDS = {
+    'assessor': ('Assessor', None),
+    'objetivo': ('Obj. Captação', MONEY),
+    'captacao': ('Captação Líquida', MONEY),
+    'cap_obj': ('Cap. x Obj.', PERCENT),
+    'ativacoes': ('Ativações', COUNT),
+    'habilitacoes': ('Habilitações', COUNT),
+}
+
+
+class Report:
+    """Conteúdo do relatório: ``cards`` (aba, rótulo, valor, tipo) e ``tables`` (aba, título, DataFrame, tipos)"""
+
+    def __init__(self, name):
+        self.name = name
+        self.created = time.localtime()
+        self.cards = []
+        self.tables = []
+
+    def add_table(self, section, title, df, kinds=None):
+        """Guarda a tabela com os valores já limpos e o tipo de exibição de cada coluna.
+
+        ``kinds`` fixa o tipo de colunas (nome -> tipo); as demais seguem ``tables.column_kind``.
+        """
+        df = df.dropna(how='all').reset_index(drop=True)
+        if df.empty:
+            return
+        fixed, kinds = kinds or {}, {}
+        for col in df.columns:
+            kind = fixed.get(col) or column_kind(col, pd.api.types.is_numeric_dtype(df[col].dtype))
+            if kind is not None:
+                df[col] = display_values(df[col], kind)
+                kinds[col] = kind
+        self.tables.append((section, title, df, kinds))
+
+
+def _table_columns(df, column_names):
+    # Mesma busca do safe_get_columns do dashboard
+    index = column_index(df)
+    found = []
+    for col in column_names:
+        col = index.find(col)
+        if col and col not in found:
+            found.append(col)
+    return found
+
+
+def build_report(sheets, name='relatório'):
+    """Monta o ``Report`` de um ``ingest.LazyWorkbook`` (lê as abas usadas)"""
+    report = Report(name)
+
+    if 'visão geral' in sheets:
+        overview = sheets.derived('visão geral', build_overview)
+        if overview.products is not None:
+            kpis = overview_kpis(overview)
+            report.cards += [
+                ('Visão Geral', 'Receita Total Realizada', kpis['receita_total_realizada'], MONEY),
+                ('Visão Geral', 'Forecast', kpis['forecast'], MONEY),
+                ('Visão Geral', 'Pace', kpis['pace'], MONEY),
+                ('Visão Geral', '% da Meta Atingida', kpis['percent_meta'], POINTS),
+                ('Visão Geral', 'Meta Total', kpis['meta_total'], MONEY),
+            ]
+            report.add_table('Visão Geral', 'Receita por Produto', overview.products)
+
+    for section, title, sheet, required, columns in REPORT_TABLES:
+        if sheet not in sheets:
+            continue
+        df = sheets[sheet]
+        if required is not None:
+            col = find_column(df, required)
+            if col is None:
+                continue
+            df = df[(df[col].notna()) & (df[col] != '')]
+        columns = _table_columns(df, columns if columns is not None else df.columns.tolist())
+        if columns:
+            report.add_table(section, title, df[columns])
+
+    if 'captação liq' in sheets:
+        index = sheets.derived('captação liq', build_captacao_index)
+        if index.column is not None:
+            kpis = captacao_kpis(index)
+            report.cards += [
+                ('Captação Liq', 'Objetivo Total', kpis['objetivo_total'], MONEY),
+                ('Captação Liq', 'Captação Realizada', kpis['captacao_total'], MONEY),
+                ('Captação Liq', '% do Objetivo', kpis['percentual_objetivo'], POINTS),
+                ('Captação Liq', 'Total de Ativações', kpis['ativacoes_total'], COUNT),
+                ('Captação Liq', 'Total de Habilitações', kpis['habilitacoes_total'], COUNT),
+                ('Captação Liq', 'Assessores com Captação Positiva', kpis['assessores_positivos'], COUNT),
+                ('Captação Liq', 'Média de Captação', kpis['media_captacao'], MONEY),
+            ]
+            # Mesma tabela da aba (sem a linha de totais, com os nomes da tela)
+            cols = captacao_columns(index.df)
+            df = index.df[index.df[cols['assessor']].notna()]
+            df = df[~df[cols['assessor']].astype(str).str.strip().isin(['', 'nan'])]
+            df = df[[cols[key] for key in _CAPTACAO_KINDS if cols[key] is not None]]
+            names = {cols[key]: name for key, (name, _) in _CAPTACAO_KINDS.items() if cols[key] is not None}
+            kinds = {name: kind for name, kind in _CAPTACAO_KINDS.values()}
+            report.add_table('Captação Liq', 'Captação por Assessor', df.rename(columns=names), kinds)
+    report.tables.sort(key=lambda table: SECTIONS.index(table[0]))
+    return report
+
+
+# ---------- XLSX ----------
+
+_XLSX_FORMATS = {MONEY: '"R$" #,##0.00', PERCENT: '0.0%', COUNT: '0', POINTS: '0.0"%"'}
+_HEADER_FONT = Font(bold=True, color='0D0D0D')
+_HEADER_FILL = PatternFill('solid', fgColor='FFD700')
+_TITLE_FONT = Font(bold=True, size=14)
+
+
+def _sheet_title(title, used):
+    # Excel: até 31 caracteres, sem []:*?/\ e sem repetir
+    base = re.sub(r'[\[\]:*?/\\]', ' ', title)[:31]
+    name, i = base, 2
+    while name.casefold() in used:
+        suffix = f' ({i})'
+        name = base[:31 - len(suffix)] + suffix
+        i += 1
+    used.add(name.casefold())
+    return name
+
+
+def _cell(ws, value, kind=None, font=None, fill=None):
+    if value is not None and not isinstance(value, str) and pd.isna(value):
+        value = None
+    elif hasattr(value, 'item'):
+        value = value.item()
+    cell = WriteOnlyCell(ws, value=value)
+    if kind in _XLSX_FORMATS:
+        cell.number_format = _XLSX_FORMATS[kind]
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    return cell
+
+
+def write_xlsx(report, path):
+    """Grava o relatório em .xlsx (openpyxl em modo write-only: linha a linha)"""
+    wb = openpyxl.Workbook(write_only=True)
+    used = set()
+
+    ws = wb.create_sheet(_sheet_title('Indicadores', used))
+    ws.append([_cell(ws, f'{report.name} · {time.strftime("%d/%m/%Y %H:%M", report.created)}', font=_TITLE_FONT)])
+    ws.append([])
+    ws.append([_cell(ws, text, font=_HEADER_FONT, fill=_HEADER_FILL) for text in ('Aba', 'Indicador', 'Valor')])
+    for section, label, value, kind in report.cards:
+        ws.append([_cell(ws, section), _cell(ws, label), _cell(ws, value, kind)])
+
+    for section, title, df, kinds in report.tables:
+        ws = wb.create_sheet(_sheet_title(title, used))
+        ws.append([_cell(ws, f'{section} · {title}', font=_TITLE_FONT)])
+        ws.append([_cell(ws, str(col), font=_HEADER_FONT, fill=_HEADER_FILL) for col in df.columns])
+        col_kinds = [kinds.get(col) for col in df.columns]
+        for row in df.itertuples(index=False, name=None):
+            ws.append([_cell(ws, value, kind) for value, kind in zip(row, col_kinds)])
+    wb.save(path)
+
+
+# ---------- HTML ----------
+
+_HTML_STYLE = """
+body { background: #0d0d0d; color: #E0E0E0; font-family: 'Segoe UI', Arial, sans-serif; margin: 32px; }
+h1, h2, h3 { color: #FFD700; }
+h2 { border-bottom: 1px solid rgba(255, 215, 0, 0.3); padding-bottom: 6px; margin-top: 40px; }
+.cards { display: grid; grid-template-columns: repeat(auto-fit, minmax(220px, 1fr)); gap: 16px; }
+.card { background: linear-gradient(135deg, #383838 0%, #2b2b2b 100%); border: 1px solid rgba(255, 215, 0, 0.3);
+        border-radius: 12px; padding: 16px; }
+.card .label { color: #FFD700; font-size: 13px; font-weight: 600; }
+.card .value { color: #FFFFFF; font-size: 24px; font-weight: 700; margin-top: 6px; }
+table { border-collapse: collapse; width: 100%; margin: 8px 0 24px; font-size: 13px; }
+th { background: #FFD700; color: #0d0d0d; text-align: left; padding: 6px 8px; }
+td { border-bottom: 1px solid #333; padding: 5px 8px; }
+td.num { text-align: right; white-space: nowrap; }
+.rodape { color: #FFD700; font-size: 12px; text-align: center; margin-top: 40px; }
+"""
+
+
+def format_value(value, kind):
+    """Valor de um card ou célula como texto (R$ 1.234,56, 12.5%, ...); vazio vira '-'"""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return '-'
+    if kind == MONEY:
+        return format_currency(value)
+    if kind == PERCENT:
+        return f"{value:.1%}"
+    if kind == POINTS:
+        return f"{value:.1f}%"
+    if kind == COUNT:
+        return f"{int(value)}"
+    return str(value)
+
+
+def _format_column(values, kind):
+    if kind == MONEY:
+        return format_currency_series(values).tolist()
+    return [format_value(value, kind) for value in values]
+
+
+def table_html(df, kinds):
+    """``<table>`` com os valores formatados (colunas com tipo alinhadas à direita)"""
+    esc = html.escape
+    parts = ['<table><thead><tr>']
+    parts.extend(f'<th>{esc(str(col))}</th>' for col in df.columns)
+    parts.append('</tr></thead><tbody>')
+    columns = [(_format_column(df[col], kinds.get(col)), col in kinds) for col in df.columns]
+    for i in range(len(df)):
+        parts.append('<tr>')
+        parts.extend(f'<td class="num">{esc(text[i])}</td>' if numeric else f'<td>{esc(text[i])}</td>'
+                     for text, numeric in columns)
+        parts.append('</tr>')
+    parts.append('</tbody></table>')
+    return ''.join(parts)
+
+
+def report_html(report):
+    """Relatório em um único HTML (estilo embutido, sem arquivos externos)"""
+    esc = html.escape
+    parts = [
+        '<!DOCTYPE html><html lang="pt-BR"><head><meta charset="utf-8">',
+        f'<title>{esc(report.name)}</title><style>{_HTML_STYLE}</style></head><body>',
+        f'<h1>📊 {esc(report.name)}</h1>',
+        f'<p>Gerado em {time.strftime("%d/%m/%Y %H:%M", report.created)}</p>',
+    ]
+    for section in SECTIONS:
+        cards = [card for card in report.cards if card[0] == section]
+        tables = [table for table in report.tables if table[0] == section]
+        if not cards and not tables:
+            continue
+        parts.append(f'<h2>{esc(section)}</h2>')
+        if cards:
+            parts.append('<div class="cards">')
+            for _, label, value, kind in cards:
+                parts.append(f'<div class="card"><div class="label">{esc(label)}</div>'
+                             f'<div class="value">{esc(format_value(value, kind))}</div></div>')
+            parts.append('</div>')
+        for _, title, df, kinds in tables:
+            parts.append(f'<h3>{esc(title)}</h3>')
+            parts.append(table_html(df, kinds))
+    parts.append('<p class="rodape">Dashboard Financeiro © 2026 | Vértiq Digital</p></body></html>')
+    return ''.join(parts)
+
+
+def write_html(report, path):
+    with open(path, 'w', encoding='utf-8') as fh:
+        fh.write(report_html(report))
+
+
+WRITERS = {'xlsx': write_xlsx, 'html': write_html}
+
+# '<sha256 do arquivo>-<nome>-v...'; os sem o nome são da versão anterior
+_JOB_FILE = re.compile(r'[0-9a-f]{64}-(?:[0-9a-f]{12}-)?v')
+
+
+def _name_tag(name):
+    # O nome vai no título do relatório: o mesmo arquivo com outro nome é outro relatório
+    return hashlib.sha256(name.encode()).hexdigest()[:12]
+
+
+class ExportJobs:
+    """Exportações em segundo plano, com os arquivos prontos guardados em disco.
+
+    ``job`` devolve o ``Future`` da exportação (já concluído se o arquivo
+    existe, em andamento se alguém pediu) ou None se ninguém pediu ainda.
+    Pedidos repetidos do mesmo arquivo, nome e formato, de qualquer sessão,
+    usam o mesmo ``Future`` (o nome entra no título do relatório). Subclasses trocam ``write`` e ``version`` para gerar
+    outros arquivos por planilha (ex.: ``snapshot.SnapshotJobs``).
+    """
+
+    version = EXPORT_VERSION
+
+    def __init__(self, root=EXPORT_DIR, workers=1, keep=EXPORTS_KEPT):
+        self.root = root
+        self.keep = keep
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='export')
+        self._jobs = {}
+        os.makedirs(root, exist_ok=True)
+
+    def path(self, digest, fmt, name):
+        return os.path.join(self.root, f'{digest}-{_name_tag(name)}-v{INGEST_VERSION}.{self.version}.{fmt}')
+
+    def job(self, digest, fmt, name='relatório'):
+        with self._lock:
+            job = self._jobs.get((digest, name, fmt))
+            if job is not None:
+                return job
+        path = self.path(digest, fmt, name)
+        if os.path.exists(path):
+            os.utime(path)
+            done = Future()
+            done.set_result(path)
+            return done
+        return None
+
+    def submit(self, sheets, fmt, name='relatório'):
+        key = (sheets.digest, name, fmt)
+        with self._lock:
+            job = self._jobs.get(key)
+            new = job is None or (job.done() and job.exception() is not None)
+            if new:
+                job = self._jobs[key] = self._pool.submit(self._export, sheets, fmt, name)
+        if new:
+            # Fora do lock: se a exportação já terminou, o callback roda aqui mesmo
+            job.add_done_callback(partial(self._forget, key))
+        return job
+
+    def _forget(self, key, job):
+        # Exportações que deram certo passam a ser achadas pelo arquivo
+        with self._lock:
+            if self._jobs.get(key) is job and job.exception() is None:
+                del self._jobs[key]
+
+    def _export(self, sheets, fmt, name):
+        path = self.path(sheets.digest, fmt, name)
+        tmp = f'{path}.{threading.get_ident()}.tmp'
+        self.write(sheets, fmt, name, tmp)
+        os.replace(tmp, path)
+        self._evict()
+        return path
+
+    def write(self, sheets, fmt, name, path):
+        WRITERS[fmt](build_report(sheets, name), path)
+
+    def _evict(self):
+        files = []
+        for name in os.listdir(self.root):
+            # Só os arquivos gerados aqui ('<sha256>-v...'), sem os temporários
+            if not _JOB_FILE.match(name) or name.endswith('.tmp'):
+                continue
+            path = os.path.join(self.root, name)
+            try:
+                files.append((os.stat(path).st_mtime, path))
+            except OSError:
+                continue
+        for _, path in sorted(files)[:max(len(files) - self.keep, 0)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
@@ -0,0 +1,87 @@
+"""Formatação de valores no padrão brasileiro (sem dependência do Streamlit)."""
+import numpy as np
+import pandas as pd
+
+
+def format_currency(val):
+    """Formata valores para o padrão R$ 1.234,56"""
+    try:
+        if pd.isna(val) or val == '':
+            return "R$ 0,00"
+        return f"R$ {float(val):,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+    except:
+        return str(val)
+
+
+# Blocos de milhar e centavos já como texto: indexar é bem mais rápido que
+# converter cada número
+_BLOCKS = np.array([f'{i:03d}' for i in range(1000)])
+_CENTS = np.array([f'{i:02d}' for i in range(100)])
+
+
+def _group_thousands(numbers):
+    """'1.234.567' para cada inteiro não negativo do array"""
+    text = _BLOCKS[numbers % 1000]
+    rest = numbers // 1000
+    while rest.any():
+        block = _BLOCKS[rest % 1000]
+        text = np.where(rest > 0, np.strings.add(np.strings.add(block, '.'), text), text)
+        rest = rest // 1000
+    # Zeros à esquerda do primeiro bloco ('001.234' -> '1.234', '000' -> '0')
+    text = np.strings.lstrip(text, '0')
+    return np.where(text == '', '0', text)
+
+
+def _format_floats(values, index=None, name=None):
+    """Series com 'R$ 1.234,56' para cada float (sem NaN) do array"""
+    values = np.asarray(values, dtype=float)
+    scaled = np.abs(values) * 100
+    with np.errstate(invalid='ignore'):
+        fits = scaled < 2 ** 53
+    scaled = np.where(fits, scaled, 0.0)
+    cents = np.round(scaled)
+    # Perto do meio centavo, x * 100 pode cair do outro lado do arredondamento
+    # do f-string de format_currency; esses poucos vêm do texto de '%.2f'
+    near_half = np.abs(scaled - np.floor(scaled) - 0.5) <= np.spacing(scaled)
+    if near_half.any():
+        cents[near_half] = np.strings.replace(np.char.mod('%.2f', np.abs(values[near_half])), '.', '').astype(float)
+    cents = cents.astype(np.int64)
+
+    text = np.strings.add(_group_thousands(cents // 100), ',')
+    text = np.strings.add(text, _CENTS[cents % 100])
+    text = np.strings.add(np.where(np.signbit(values), 'R$ -', 'R$ '), text)
+    if not fits.all():
+        # Infinitos e valores enormes
+        text = text.astype(object)
+        text[~fits] = [format_currency(v) for v in values[~fits]]
+    return pd.Series(text, index=index, name=name, dtype=str)
+
+
+def format_currency_series(values):
+    """Formata uma coluna inteira no padrão R$ 1.234,56 de uma vez.
+
+    Dá exatamente o mesmo resultado que ``values.apply(format_currency)``,
+    inclusive para NaN, '' e negativos. Valores que não são números (textos
+    como '-' ou 'R$ 1.234') passam por ``format_currency`` um a um.
+    """
+    s = values if isinstance(values, pd.Series) else pd.Series(values)
+    if s.empty:
+        return s.astype(object)
+
+    if pd.api.types.is_numeric_dtype(s.dtype) or pd.api.types.is_bool_dtype(s.dtype):
+        # NaN vira 0, que já sai como "R$ 0,00"
+        numbers = pd.to_numeric(s, errors='coerce').to_numpy(dtype=float, na_value=0.0)
+        return _format_floats(np.where(np.isnan(numbers), 0.0, numbers), s.index, s.name)
+
+    result = np.full(len(s), "R$ 0,00", dtype=object)
+    raw = s.to_numpy(dtype=object)
+    blank = s.isna().to_numpy() | (raw == '')
+    is_number = np.fromiter(
+        (isinstance(v, (int, float, np.number)) for v in raw), dtype=bool, count=len(raw)
+    ) & ~blank
+    if is_number.any():
+        result[is_number] = _format_floats(raw[is_number].astype(float)).to_numpy(dtype=object)
+    other = ~(is_number | blank)
+    if other.any():
+        result[other] = [format_currency(v) for v in raw[other]]
+    return pd.Series(result.tolist(), index=s.index, name=s.name)
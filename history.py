@@ -0,0 +1,193 @@
+"""Histórico dos uploads em SQLite (sem dependência do Streamlit).
+
+Cada arquivo enviado vira um registro com a data do upload, os indicadores
+de ``metrics.compute_kpis`` e a receita e a captação de cada assessor. O
+histórico só cresce: um arquivo repetido (mesmo sha256) não é gravado de
+novo, e vários uploads no mesmo mês ou semana ficam todos guardados (as
+tendências usam o último de cada período).
+
+Os gráficos de tendência leem daqui, sem abrir os Excel antigos.
+"""
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from advisors import build_advisor_index, build_captacao_index
+from columns import find_column
+from metrics import compute_kpis
+from schema import MONEY, parse_numbers
+
+HISTORY_PATH = os.environ.get(
+    'DASHVERTIQ_HISTORY',
+    os.path.join(os.path.expanduser('~'), '.local', 'share', 'dashvertiq', 'historico.sqlite'))
+
+# Períodos das tendências: rótulo -> frequência do pandas
+PERIODS = {'Mensal': 'M', 'Semanal': 'W'}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS uploads (
+    id INTEGER PRIMARY KEY,
+    digest TEXT UNIQUE NOT NULL,
+    data TEXT NOT NULL,
+    criado REAL NOT NULL,
+    arquivo TEXT
+);
+CREATE TABLE IF NOT EXISTS indicadores (
+    upload_id INTEGER NOT NULL REFERENCES uploads(id),
+    nome TEXT NOT NULL,
+    valor REAL
+);
+CREATE TABLE IF NOT EXISTS assessores (
+    upload_id INTEGER NOT NULL REFERENCES uploads(id),
+    chave TEXT NOT NULL,
+    assessor TEXT NOT NULL,
+    receita REAL,
+    captacao REAL
+);
+CREATE INDEX IF NOT EXISTS assessores_upload ON assessores(upload_id);
+CREATE INDEX IF NOT EXISTS indicadores_upload ON indicadores(upload_id);
+"""
+
+_ADVISOR_COLUMNS = ['upload_id', 'data', 'chave', 'assessor', 'receita', 'captacao']
+
+
+def _advisor_totals(index, term):
+    """Soma da coluna ``term`` por assessor (Series indexada pela chave normalizada)"""
+    col = find_column(index.df, term) if index.column is not None else None
+    if col is None:
+        return pd.Series(dtype=float)
+    values = parse_numbers(index.df[col], MONEY)[0].to_numpy()
+    return pd.Series({key: np.nansum(values[pos]) for key, pos in index.groups().items()}, dtype=float)
+
+
+def advisor_snapshot(sheets):
+    """Receita ('assessores' · Total) e captação ('captação liq' · Captação Líquida) por assessor"""
+    receita = captacao = pd.Series(dtype=float)
+    names = {}
+    if 'assessores' in sheets:
+        index = sheets.derived('assessores', build_advisor_index, 'Assessores')
+        receita = _advisor_totals(index, 'Total')
+        names.update(zip(index.groups(), index.names))
+    if 'captação liq' in sheets:
+        index = sheets.derived('captação liq', build_captacao_index)
+        captacao = _advisor_totals(index, ['Captação Líquida'])
+        for key, name in zip(index.groups(), index.names):
+            names.setdefault(key, name)
+    df = pd.DataFrame({'receita': receita, 'captacao': captacao})
+    df.index.name = 'chave'
+    df = df.reset_index()
+    df.insert(1, 'assessor', df['chave'].map(names))
+    return df
+
+
+class HistoryStore:
+    """Histórico em SQLite, compartilhado pelas sessões do processo.
+
+    ``advisor_history`` guarda em memória o que já leu e, a cada chamada, só
+    busca os uploads gravados depois disso. ``submit`` grava numa thread à
+    parte: ler as abas do arquivo não atrasa quem pediu.
+    """
+
+    def __init__(self, path=HISTORY_PATH):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._advisors = pd.DataFrame(columns=_ADVISOR_COLUMNS)
+        self._last_id = 0
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='history')
+        self._jobs_lock = threading.Lock()
+        self._jobs = {}
+
+    def has(self, digest):
+        with self._lock:
+            return self._conn.execute('SELECT 1 FROM uploads WHERE digest = ?', (digest,)).fetchone() is not None
+
+    def record(self, sheets, arquivo=None, day=None):
+        """Grava o arquivo (``ingest.LazyWorkbook``); retorna False se ele já estava no histórico"""
+        if self.has(sheets.digest):
+            return False
+        kpis = compute_kpis(sheets)
+        advisors = advisor_snapshot(sheets)
+        day = (day or date.today()).isoformat()
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                'INSERT OR IGNORE INTO uploads (digest, data, criado, arquivo) VALUES (?, ?, ?, ?)',
+                (sheets.digest, day, time.time(), arquivo))
+            if cursor.rowcount == 0:
+                return False
+            upload_id = cursor.lastrowid
+            self._conn.executemany(
+                'INSERT INTO indicadores (upload_id, nome, valor) VALUES (?, ?, ?)',
+                [(upload_id, name, float(value)) for name, value in kpis.items()
+                 if isinstance(value, (int, float, np.number)) and not isinstance(value, bool)])
+            self._conn.executemany(
+                'INSERT INTO assessores (upload_id, chave, assessor, receita, captacao) VALUES (?, ?, ?, ?, ?)',
+                [(upload_id, row.chave, row.assessor, _or_none(row.receita), _or_none(row.captacao))
+                 for row in advisors.itertuples(index=False)])
+        return True
+
+    def submit(self, sheets, arquivo=None, day=None):
+        """``Future`` de ``record`` em segundo plano; pedidos repetidos do mesmo arquivo usam o mesmo"""
+        with self._jobs_lock:
+            job = self._jobs.get(sheets.digest)
+            new = job is None
+            if new:
+                job = self._jobs[sheets.digest] = self._pool.submit(self.record, sheets, arquivo, day)
+        if new:
+            job.add_done_callback(partial(self._forget, sheets.digest))
+        return job
+
+    def _forget(self, digest, job):
+        # Depois de gravado, ``record`` já recusa o arquivo repetido; se falhou, pode tentar de novo
+        with self._jobs_lock:
+            if self._jobs.get(digest) is job:
+                del self._jobs[digest]
+
+    def uploads(self):
+        with self._lock:
+            return pd.read_sql_query('SELECT id, data, arquivo, criado FROM uploads ORDER BY id', self._conn)
+
+    def advisor_history(self):
+        """Receita e captação de cada assessor em todos os uploads (colunas ``_ADVISOR_COLUMNS``)"""
+        with self._lock:
+            new = pd.read_sql_query(
+                'SELECT a.upload_id, u.data, a.chave, a.assessor, a.receita, a.captacao '
+                'FROM assessores a JOIN uploads u ON u.id = a.upload_id '
+                'WHERE a.upload_id > ? ORDER BY a.upload_id',
+                self._conn, params=(self._last_id,))
+            if len(new):
+                frames = [self._advisors, new] if len(self._advisors) else [new]
+                self._advisors = pd.concat(frames, ignore_index=True)
+                self._last_id = int(new['upload_id'].max())
+            return self._advisors
+
+
+def _or_none(value):
+    return None if pd.isna(value) else float(value)
+
+
+def trend(history, freq='M'):
+    """Último upload de cada período (``freq`` 'M' ou 'W') por assessor.
+
+    Os números da planilha são acumulados no mês, então cada período fica
+    com o último upload dentro dele. Colunas: periodo (início do período),
+    assessor, receita, captacao.
+    """
+    if history.empty:
+        return pd.DataFrame(columns=['periodo', 'assessor', 'receita', 'captacao'])
+    df = history.assign(periodo=pd.to_datetime(history['data']).dt.to_period(freq).dt.start_time)
+    df = df[df['upload_id'] == df.groupby('periodo')['upload_id'].transform('max')]
+    # O mesmo assessor com grafias diferentes entre uploads: vale o nome mais recente
+    names = history.drop_duplicates('chave', keep='last').set_index('chave')['assessor']
+    df = df.assign(assessor=df['chave'].map(names))
+    return df[['periodo', 'assessor', 'receita', 'captacao']].sort_values(['periodo', 'assessor'], ignore_index=True)
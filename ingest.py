@@ -0,0 +1,458 @@
+"""Leitura das planilhas Excel do dashboard (sem dependência do Streamlit)."""
+import hashlib
+import posixpath
+import re
+import threading
+import time
+import weakref
+import zipfile
+from collections.abc import Mapping
+from io import BytesIO
+from xml.etree import ElementTree
+
+import numpy as np
+import openpyxl
+import pandas as pd
+from openpyxl.cell.cell import ERROR_CODES
+from pandas.io.parsers import TextParser
+
+from schema import compact_sheet, frame_nbytes, normalize_sheet
+
+# Versão da lógica de leitura; entradas do cache em disco gravadas com outra
+# versão são descartadas. Aumente sempre que mudar o resultado da leitura.
+INGEST_VERSION = 8
+
+# Linhas convertidas de cada vez na leitura de uma aba
+CHUNK_ROWS = 20000
+# Bytes do XML da aba lidos de cada vez ao procurar a última célula com valor
+_SCAN_BYTES = 1 << 20
+
+_NS_MAIN = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_NS_REL = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_NS_PKG = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+# Abas lidas recentemente, pela chave de conteúdo: um novo upload reaproveita
+# os DataFrames das abas que não mudaram enquanto o upload anterior existir
+_recent_frames = weakref.WeakValueDictionary()
+_recent_meta = {}
+
+# Marca de "ainda não calculado" em derived: um resultado None também fica guardado
+_MISSING = object()
+
+# Quem recebe o progresso das leituras feitas em cada thread (ver set_progress)
+_progress = threading.local()
+
+# Célula com valor: <v> não vazio ou texto inline (fórmula sem valor calculado não conta)
+_VALUE_CELL = re.compile(rb'<c\b([^>]*)>\s*(?:<f\b[^>]*(?:/>|>[^<]*</f>)\s*)?(?:<v>[^<]|<is\b)')
+_CELL_REF = re.compile(rb'\br="([A-Z]+)([0-9]+)"')
+
+
+def file_bytes(file):
+    """Retorna o conteúdo do upload (UploadedFile, bytes ou caminho)"""
+    if isinstance(file, (bytes, bytearray)):
+        return bytes(file)
+    if hasattr(file, 'getvalue'):
+        return file.getvalue()
+    with open(file, 'rb') as fh:
+        return fh.read()
+
+
+def is_xlsx(data):
+    # .xlsx é um zip; .xls antigo não pode ser lido pelo openpyxl
+    return data[:4] == b'PK\x03\x04'
+
+
+def _convert_value(val):
+    # Mesmas regras do leitor openpyxl do pandas
+    if val is None:
+        return ''
+    if isinstance(val, str) and val in ERROR_CODES:
+        return np.nan
+    if isinstance(val, (int, float)) and not isinstance(val, bool):
+        as_int = int(val) if np.isfinite(val) else None
+        return as_int if as_int == val else float(val)
+    return val
+
+
+def set_progress(callback):
+    """Define quem recebe o progresso das leituras feitas nesta thread.
+
+    ``callback(aba, linhas lidas, total de linhas ou None)`` é chamado no
+    começo e no fim da leitura de cada aba e a cada ``CHUNK_ROWS`` linhas.
+    ``set_progress(None)`` desliga.
+    """
+    _progress.callback = callback
+
+
+def _report(name, done, total):
+    callback = getattr(_progress, 'callback', None)
+    if callback is not None:
+        callback(name, done, total)
+
+
+def rows_to_frame(rows, on_chunk=None, chunk_rows=CHUNK_ROWS):
+    """Converte as linhas lidas (values_only) em DataFrame, como o pd.read_excel faria.
+
+    As linhas são convertidas em blocos de ``chunk_rows`` (``on_chunk`` recebe
+    quantas linhas já foram lidas). Linhas vazias só entram se aparecer uma
+    linha com valor depois delas: as do fim da aba não ocupam memória.
+    """
+    frames, chunk = [], []
+    names = None
+    empty = done = 0
+
+    def flush():
+        nonlocal names
+        width = max(len(r) for r in chunk)
+        if names is None:
+            data = [r + [''] * (width - len(r)) for r in chunk]
+            df = TextParser(data, header=0, skip_blank_lines=False).read()
+            names = list(df.columns)
+        else:
+            # Colunas que só aparecem mais abaixo ficam sem nome, como no cabeçalho
+            names += [f'Unnamed: {i}' for i in range(len(names), width)]
+            data = [r + [''] * (len(names) - len(r)) for r in chunk]
+            df = TextParser(data, header=None, names=names, skip_blank_lines=False).read()
+        frames.append(df)
+        chunk.clear()
+
+    for row in rows:
+        done += 1
+        converted = [_convert_value(v) for v in row]
+        while converted and converted[-1] == '':
+            converted.pop()
+        if not converted:
+            empty += 1
+            continue
+        chunk.extend([] for _ in range(empty))
+        empty = 0
+        chunk.append(converted)
+        if len(chunk) >= chunk_rows:
+            flush()
+            if on_chunk is not None:
+                on_chunk(done)
+    if chunk:
+        flush()
+    if not frames:
+        return pd.DataFrame()
+
+    if len(frames) == 1:
+        df = frames[0]
+    else:
+        # Um bloco com a coluna toda vazia (float) junto de outro com texto
+        # sai 'object' do concat; a leitura inteira teria dado 'str'
+        df = pd.concat(frames, ignore_index=True).infer_objects()
+    df.columns = df.columns.astype(str).str.strip()
+    return df
+
+
+def _column_number(letters):
+    number = 0
+    for char in letters:
+        number = number * 26 + char - 64
+    return number
+
+
+def used_range(zf, part):
+    """(última linha, última coluna) com valor na aba, lendo o XML em pedaços.
+
+    Células só com formatação (às vezes até a linha 1.048.576) não contam.
+    Retorna None se o XML não estiver no formato esperado (prefixo de
+    namespace, células sem referência).
+    """
+    max_row = max_col = 0
+    found_sheet_data = False
+    tail = previous = b''
+    with zf.open(part) as fh:
+        while True:
+            chunk = fh.read(_SCAN_BYTES)
+            found_sheet_data = found_sheet_data or b'<sheetData' in previous[-16:] + chunk
+            previous = chunk
+            buf = tail + chunk
+            if chunk:
+                # A última célula pode estar pela metade: fica para o próximo pedaço
+                cut = buf.rfind(b'<c')
+                buf, tail = (buf[:cut], buf[cut:]) if cut >= 0 else (buf, b'')
+            for match in _VALUE_CELL.finditer(buf):
+                ref = _CELL_REF.search(match.group(1))
+                if ref is None:
+                    return None
+                max_row = max(max_row, int(ref.group(2)))
+                max_col = max(max_col, _column_number(ref.group(1)))
+            if not chunk:
+                break
+    return (max_row, max_col) if found_sheet_data else None
+
+
+def _sheet_parts(zf):
+    """Nome de cada aba -> caminho do XML dela dentro do .xlsx, na ordem do arquivo"""
+    workbook = ElementTree.fromstring(zf.read('xl/workbook.xml'))
+    rels = ElementTree.fromstring(zf.read('xl/_rels/workbook.xml.rels'))
+    targets = {rel.get('Id'): rel.get('Target') for rel in rels.iter(f'{_NS_PKG}Relationship')}
+    parts = {}
+    for sheet in workbook.iter(f'{_NS_MAIN}sheet'):
+        target = targets.get(sheet.get(f'{_NS_REL}id'), '')
+        if target.startswith('/'):
+            parts[sheet.get('name')] = target.lstrip('/')
+        else:
+            parts[sheet.get('name')] = posixpath.normpath(posixpath.join('xl', target))
+    return parts
+
+
+def sheet_hashes(data):
+    """Chave de conteúdo de cada aba de um .xlsx, sem ler as células.
+
+    A chave cobre o nome da aba (o schema e a compactação dependem dele), o
+    ``<sheetData>`` da aba, os textos compartilhados que ela usa, os estilos
+    (que decidem o que é data) e ``INGEST_VERSION``. Mudar a seleção ou a
+    largura de colunas não altera a chave; mudar um valor, sim.
+    """
+    with zipfile.ZipFile(BytesIO(data)) as zf:
+        parts = _sheet_parts(zf)
+        names = set(zf.namelist())
+        shared = []
+        if 'xl/sharedStrings.xml' in names:
+            shared = re.findall(rb'<si>.*?</si>|<si/>', zf.read('xl/sharedStrings.xml'), re.S)
+        common = hashlib.sha256(f'v{INGEST_VERSION}'.encode())
+        if 'xl/styles.xml' in names:
+            common.update(zf.read('xl/styles.xml'))
+        common.update(b'1904' if b'date1904="1"' in zf.read('xl/workbook.xml') else b'1900')
+
+        hashes = {}
+        for name, part in parts.items():
+            xml = zf.read(part)
+            h = common.copy()
+            h.update(name.encode() + b'\0')
+            start, end = xml.find(b'<sheetData'), xml.rfind(b'</sheetData>')
+            if start < 0:
+                # XML com prefixo de namespace: usa a aba e os textos inteiros
+                h.update(xml)
+                h.update(b''.join(shared))
+            else:
+                sheet_data = xml[start:end] if end > start else xml[start:]
+                # Linhas sem células não mudam os valores (só formatação)
+                sheet_data = re.sub(rb'<row\b[^>]*?(?:/>|>\s*</row>)', b'', sheet_data)
+                h.update(sheet_data)
+                for idx in re.findall(rb'<c\b[^>]*?\bt="s"[^>]*>\s*<v>(\d+)</v>', sheet_data):
+                    i = int(idx)
+                    h.update(shared[i] if i < len(shared) else b'')
+            hashes[name] = h.hexdigest()
+    return hashes
+
+
+class LazyWorkbook(Mapping):
+    """Planilha com leitura sob demanda.
+
+    Mantém o acesso ``sheets['aba']``: cada aba é lida no primeiro acesso e
+    guardada; abas que ninguém abre nunca são lidas. Pode ser compartilhada
+    entre sessões (a leitura é protegida por lock).
+
+    Cada aba é identificada pela sua chave de conteúdo (``sheet_hashes``): se
+    a mesma aba já foi lida em um upload anterior, o DataFrame é reaproveitado
+    da memória ou do ``cache`` em disco (``workbook_cache.DiskCache``) em vez
+    de ser lido de novo. Reenviar o arquivo com uma aba alterada custa só a
+    leitura dessa aba.
+
+    Na leitura, cada aba passa pelo schema de tipos (``schema.normalize_sheet``);
+    as células que não puderam ser convertidas ficam em ``coercion_report``.
+    Depois é compactada (``schema.compact_sheet``); ``memory`` guarda os bytes
+    de cada aba antes e depois.
+
+    Os DataFrames das abas são os mesmos para todas as sessões e não devem
+    ser alterados no lugar: quem precisa mudar colunas trabalha num recorte
+    (filtro, seleção de colunas), que com Copy-on-Write só copia as colunas
+    alteradas (sempre ligado a partir do pandas 3, a versão mínima).
+    """
+
+    def __init__(self, file, cache=None, digest=None):
+        self._data = file_bytes(file)
+        self.digest = digest or hashlib.sha256(self._data).hexdigest()
+        self._cache = cache
+        self._lock = threading.RLock()
+        self._book = None
+        self._parts = None
+        self._frames = {}
+        self._derived = {}
+        self._derived_bytes = 0
+        self.parse_times = {}
+        self.sources = {}
+        self.errors = {}
+        self.coercion_report = {}
+        self.memory = {}
+        manifest = cache.workbook(self.digest) if cache is not None else None
+        if manifest is not None:
+            names, keys = manifest['sheets'], manifest['keys']
+        elif is_xlsx(self._data):
+            keys = sheet_hashes(self._data)
+            names = list(keys)
+        else:
+            names = pd.ExcelFile(BytesIO(self._data)).sheet_names
+            keys = {name: hashlib.sha256(f'{self.digest}:{name}:v{INGEST_VERSION}'.encode()).hexdigest() for name in names}
+        if manifest is None and cache is not None:
+            cache.store_workbook(self.digest, names, keys)
+        self._names = list(names)
+        self.sheet_keys = keys
+
+    def _open_book(self):
+        if self._book is None:
+            self._book = openpyxl.load_workbook(BytesIO(self._data), read_only=True, data_only=True, keep_links=False)
+        return self._book
+
+    def close(self):
+        """Fecha o arquivo aberto pelo openpyxl; uma aba ainda não lida o abre de novo"""
+        with self._lock:
+            if self._book is not None:
+                self._book.close()
+                self._book = None
+
+    def __getitem__(self, name):
+        if name not in self._names:
+            raise KeyError(name)
+        frame = self._frames.get(name)
+        if frame is None:
+            with self._lock:
+                frame = self._frames.get(name)
+                if frame is None:
+                    frame = self._frames[name] = self._load(name)
+                    if len(self._frames) == len(self._names):
+                        # Todas as abas lidas: o openpyxl não é mais usado
+                        self.close()
+        return frame
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, name):
+        return name in self._names
+
+    def derived(self, name, build, *args):
+        """``build(sheets[name], *args)``, calculado uma vez por aba e guardado junto dela.
+
+        Para índices montados a partir de uma aba (ex.: ``metrics.build_overview``),
+        compartilhados por todas as sessões que usam este arquivo.
+        """
+        key = (name, build, args)
+        result = self._derived.get(key, _MISSING)
+        if result is _MISSING:
+            df = self[name]
+            with self._lock:
+                result = self._derived.get(key, _MISSING)
+                if result is _MISSING:
+                    result = self._derived[key] = build(df, *args)
+                    self._derived_bytes += self._result_nbytes(result)
+        return result
+
+    def derived_workbook(self, build, *args):
+        """``build(self, *args)``, calculado uma vez por arquivo (ex.: ``advisors.build_advisor_facts``)"""
+        key = (None, build, args)
+        result = self._derived.get(key, _MISSING)
+        if result is _MISSING:
+            with self._lock:
+                result = self._derived.get(key, _MISSING)
+                if result is _MISSING:
+                    result = self._derived[key] = build(self, *args)
+                    self._derived_bytes += self._result_nbytes(result)
+        return result
+
+    @property
+    def parsed(self):
+        """Nomes das abas já lidas"""
+        return [name for name in self._names if name in self._frames]
+
+    def _result_nbytes(self, result):
+        """Bytes aproximados de um resultado de ``derived``.
+
+        Contam os DataFrames e arrays dele (direto ou nos atributos, também
+        dentro de dicts), menos as próprias abas, que já entram em ``memory``.
+        Figuras e rótulos ficam de fora: são alguns KB.
+        """
+        parts = [result]
+        if not isinstance(result, (pd.DataFrame, np.ndarray)):
+            for attr in getattr(result, '__dict__', {}).values():
+                parts.extend(attr.values() if isinstance(attr, dict) else [attr])
+        sheets = {id(df) for df in self._frames.values()}
+        total = 0
+        for part in parts:
+            if isinstance(part, pd.DataFrame) and id(part) not in sheets:
+                total += frame_nbytes(part)
+            elif isinstance(part, np.ndarray):
+                total += part.nbytes
+        return total
+
+    @property
+    def nbytes(self):
+        """Memória ocupada: o arquivo, as abas já lidas (já compactadas) e os resultados de ``derived``"""
+        return len(self._data) + sum(after for _, after in self.memory.values()) + self._derived_bytes
+
+    def _load(self, name):
+        start = time.perf_counter()
+        key = self.sheet_keys[name]
+        cached = _recent_frames.get(key)
+        if cached is not None:
+            df, meta = cached, _recent_meta.get(key, {})
+            self.sources[name] = 'memória'
+        else:
+            df = self._cache.load_sheet(key) if self._cache is not None else None
+            if df is not None:
+                meta = self._cache.load_meta(key)
+                self.sources[name] = 'cache'
+            else:
+                df, report = normalize_sheet(name, self._parse(name))
+                df, before, after = compact_sheet(name, df)
+                meta = {'coercion_report': report, 'memory': [before, after]}
+                self.sources[name] = 'excel'
+                if self._cache is not None and name not in self.errors:
+                    self._cache.store_sheet(key, df)
+                    self._cache.store_meta(key, meta)
+            if name not in self.errors:
+                _recent_frames[key] = df
+                _recent_meta[key] = meta
+                for stale in [k for k in _recent_meta if k not in _recent_frames]:
+                    del _recent_meta[stale]
+        self.coercion_report[name] = meta.get('coercion_report', [])
+        if 'memory' in meta:
+            self.memory[name] = tuple(meta['memory'])
+        self.parse_times[name] = time.perf_counter() - start
+        return df
+
+    def _used_range(self, name):
+        try:
+            with zipfile.ZipFile(BytesIO(self._data)) as zf:
+                if self._parts is None:
+                    self._parts = _sheet_parts(zf)
+                part = self._parts.get(name)
+                return used_range(zf, part) if part in zf.namelist() else None
+        except (KeyError, zipfile.BadZipFile, ElementTree.ParseError):
+            # Sem a extensão da aba: lê todas as linhas
+            return None
+
+    def _parse(self, name):
+        try:
+            if is_xlsx(self._data):
+                ws = self._open_book()[name]
+                extent = self._used_range(name)
+                if extent is None:
+                    ws.reset_dimensions()
+                    rows, total = ws.iter_rows(values_only=True), None
+                elif extent[0] == 0:
+                    return pd.DataFrame()
+                else:
+                    # Só até a última célula com valor: a formatação que
+                    # sobra abaixo e à direita nem é lida
+                    total, width = extent
+                    rows = ws.iter_rows(max_row=total, max_col=width, values_only=True)
+                _report(name, 0, total)
+                df = rows_to_frame(rows, on_chunk=lambda done: _report(name, done, total))
+                _report(name, total or len(df), total)
+                return df
+            df = pd.read_excel(BytesIO(self._data), sheet_name=name)
+            df.columns = df.columns.astype(str).str.strip()
+            return df
+        except Exception as e:
+            # A aba continua acessível (vazia) e o erro fica registrado
+            self.errors[name] = str(e)
+            return pd.DataFrame()
+
@@ -0,0 +1,195 @@
+"""Indicadores do dashboard calculados sem Streamlit.
+
+Tudo aqui roda fora do navegador (ver ``batch.py``): as abas do dashboard
+só formatam e desenham o que estas funções devolvem.
+"""
+import pandas as pd
+
+from advisors import build_captacao_index
+from columns import find_column, normalize
+from schema import MONEY, parse_numbers
+
+# Rótulos da aba 'visão geral' usados pelos cards; o do período muda toda
+# semana ('Realizado de 12/01 até 16/01'), por isso é procurado pelo começo
+OVERVIEW_LABELS = {
+    'forecast': 'Forecast',
+    'meta dia util': 'Meta dia útil',
+    'meta': 'Meta',
+}
+OVERVIEW_PERIOD_PREFIX = 'Realizado de'
+# Linhas lidas abaixo do cabeçalho 'Produto'
+PRODUCT_ROWS = 11
+
+
+class OverviewIndex:
+    """Rótulos da aba 'visão geral' indexados, mais o bloco de produtos.
+
+    ``values`` leva o rótulo normalizado (``columns.normalize``) ao valor da
+    coluna ao lado. Rótulos repetidos ficam em ``duplicates`` (vale o
+    primeiro) e os esperados que não existem, em ``missing``.
+    """
+
+    def __init__(self, values, labels, products, duplicates):
+        self.values = values
+        self.labels = labels
+        self.products = products
+        self.duplicates = duplicates
+        self.missing = [label for key, label in OVERVIEW_LABELS.items() if key not in values]
+        if self.period_label is None:
+            self.missing.append(f'{OVERVIEW_PERIOD_PREFIX} ...')
+
+    def get(self, label, default=None):
+        return self.values.get(normalize(label), default)
+
+    @property
+    def period_label(self):
+        prefix = normalize(OVERVIEW_PERIOD_PREFIX)
+        return next((label for label in self.labels if normalize(label).startswith(prefix)), None)
+
+    @property
+    def period_value(self):
+        label = self.period_label
+        return None if label is None else self.get(label)
+
+
+def build_overview(df):
+    """Monta o ``OverviewIndex`` da aba 'visão geral' (uma passada pela coluna 0).
+
+    Acima da linha 'Produto' ficam os rótulos (rótulo | valor); abaixo dela,
+    o bloco Produto | Realizado | Meta.
+    """
+    values, labels, duplicates = {}, [], []
+    products = None
+    if df.shape[1] >= 2:
+        first, second = df.iloc[:, 0].tolist(), df.iloc[:, 1].tolist()
+        for pos, label in enumerate(first):
+            if isinstance(label, str) and label == 'Produto':
+                products = _product_block(df, pos)
+                break
+            if pd.isna(label) or str(label).strip() == '':
+                continue
+            key = normalize(str(label).strip())
+            if key in values:
+                duplicates.append(str(label).strip())
+                continue
+            values[key] = second[pos]
+            labels.append(str(label).strip())
+    return OverviewIndex(values, labels, products, duplicates)
+
+
+def _product_block(df, header_pos):
+    block = df.iloc[header_pos + 1:header_pos + 1 + PRODUCT_ROWS, 0:3].set_axis(['Produto', 'Realizado', 'Meta'], axis=1)
+    block = block.dropna(subset=['Produto'])
+    for col in ['Realizado', 'Meta']:
+        block[col] = parse_numbers(block[col], MONEY)[0].fillna(0)
+    return block
+
+
+def overview_kpis(overview):
+    """Cards da Visão Geral a partir do ``OverviewIndex``.
+
+    Valores ausentes na planilha ficam None (o card mostra '-').
+    """
+    products = overview.products
+    total_realizado = float(products['Realizado'].sum()) if products is not None else None
+    forecast = overview.get('Forecast')
+    forecast = float(forecast) if forecast is not None else None
+    meta_total = pd.to_numeric(overview.get('Meta'), errors='coerce')
+    meta_total = float(meta_total) if pd.notna(meta_total) else None
+    percent_meta = None
+    if total_realizado is not None and meta_total is not None and meta_total > 0:
+        percent_meta = total_realizado / meta_total * 100
+    realizado_periodo = overview.period_value or 0
+    return {
+        'receita_total_realizada': total_realizado,
+        'forecast': forecast,
+        'pace': overview.get('Meta dia útil'),
+        'meta_total': meta_total,
+        'percent_meta': percent_meta,
+        'realizado_periodo': realizado_periodo,
+        # Média diaria realizada (semana/7)
+        'media_dia': float(realizado_periodo) / 7 if realizado_periodo else 0,
+    }
+
+
+# Ranges de captação líquida e objetivos (valores fixos, não vêm da planilha)
+CAPTACAO_RANGES = [
+    {"titulo": "0 - 5 MM", "classificacao": "Sales Hunter", "objetivo": 1000000.0},
+    {"titulo": "10 - 40 MM", "classificacao": "AAI Pleno", "objetivo": 1500000.0},
+    {"titulo": "Acima de 40 MM", "classificacao": "AAI Senior", "objetivo": 2000000.0}
+]
+
+# Valores usados quando a linha de totais da captação está em branco
+CAPTACAO_DEFAULTS = {'objetivo_total': 16000000, 'captacao_total': 11314555, 'percentual_objetivo': 71}
+
+
+def captacao_columns(df):
+    """Colunas da aba 'captação liq' usadas pelo dashboard (None se não existir)"""
+    return {
+        'assessor': find_column(df, 'Assessor'),
+        'objetivo': find_column(df, ['Objetivo Cap Liq']),
+        'captacao': find_column(df, ['Captação Líquida']),
+        'cap_obj': find_column(df, ['Cap x Objetivo']),
+        'ativacoes': find_column(df, 'Ativações'),
+        'habilitacoes': find_column(df, 'Habilitações'),
+    }
+
+
+def captacao_kpis(index, advisor=None):
+    """Resumo da captação a partir do índice da aba preparada (``advisors.build_captacao_index``).
+
+    A média divide a captação total pelo número de assessores listados (só
+    o ``advisor`` escolhido, quando houver filtro). Colunas que faltam na aba
+    usam os valores padrão (totais) ou contam como 0 (somas).
+    """
+    df = index.df
+    cols = captacao_columns(df)
+    blank = df[cols['assessor']].astype(str).str.strip().isin(['', 'nan', 'NaN'])
+    # Linha de totais: a primeira sem assessor (ou a última da aba)
+    total_row = df[blank].iloc[0] if blank.any() else df.iloc[-1]
+
+    def total(key, scale=1):
+        if cols[key] is None:
+            return None
+        value = total_row[cols[key]]
+        return float(value) * scale if pd.notna(value) else None
+
+    def column_sum(key):
+        return int(df[cols[key]].sum()) if cols[key] is not None else 0
+
+    objetivo_total = total('objetivo')
+    captacao_total = total('captacao')
+    percentual_objetivo = total('cap_obj', 100)
+    objetivo_total = CAPTACAO_DEFAULTS['objetivo_total'] if objetivo_total is None else objetivo_total
+    captacao_total = CAPTACAO_DEFAULTS['captacao_total'] if captacao_total is None else captacao_total
+    if percentual_objetivo is None:
+        percentual_objetivo = CAPTACAO_DEFAULTS['percentual_objetivo']
+
+    listed = len(index.positions(advisor)) if advisor is not None else int((~blank).sum())
+    return {
+        'objetivo_total': objetivo_total,
+        'captacao_total': captacao_total,
+        'percentual_objetivo': percentual_objetivo,
+        'ativacoes_total': column_sum('ativacoes'),
+        'habilitacoes_total': column_sum('habilitacoes'),
+        'assessores_positivos': int((df[cols['captacao']] > 0).sum()) if cols['captacao'] is not None else 0,
+        'media_captacao': captacao_total / max(listed, 1),
+    }
+
+
+def compute_kpis(sheets):
+    """Todos os indicadores de um arquivo (``ingest.LazyWorkbook``), num dict plano.
+
+    Cada grupo só é calculado se a aba existir; as chaves levam o prefixo do
+    grupo ('visao_geral.', 'captacao.').
+    """
+    kpis = {}
+    if 'visão geral' in sheets:
+        overview = sheets.derived('visão geral', build_overview)
+        kpis.update({f'visao_geral.{k}': v for k, v in overview_kpis(overview).items()})
+        kpis['visao_geral.rotulos_ausentes'] = list(overview.missing)
+    if 'captação liq' in sheets:
+        index = sheets.derived('captação liq', build_captacao_index)
+        if index.column is not None:
+            kpis.update({f'captacao.{k}': v for k, v in captacao_kpis(index).items()})
+    return kpis
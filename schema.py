@@ -0,0 +1,269 @@
+"""Tipos das colunas de cada aba, aplicados uma única vez na leitura.
+
+Cada aba declara quais colunas são dinheiro, porcentagem ou contagem. Na
+leitura, os textos ('R$ 1.234,56', '71%', 'R$ -') viram números de verdade e
+as células que não puderam ser convertidas entram no relatório de conversão.
+As abas do dashboard passam a ler colunas numéricas prontas.
+"""
+import numpy as np
+import pandas as pd
+
+from columns import find_column
+
+MONEY = 'money'
+PERCENT = 'percent'
+COUNT = 'count'
+TEXT = 'text'
+
+# aba -> {coluna: tipo}; a coluna é encontrada pelo find_column (o primeiro
+# nome que contém o termo, sem diferenciar maiúsculas nem acentos)
+SHEET_SCHEMAS = {
+    'assessores': {
+        'Total': MONEY,
+        'Forecast': MONEY,
+        'Pace': PERCENT,
+    },
+    'consórcios': {
+        'Reuniões realizadas': COUNT,
+        'Convertidos': COUNT,
+        'Vendido': MONEY,
+        'Receita Atual': MONEY,
+        'Objetivo': MONEY,
+        'Receita Projetada': MONEY,
+    },
+    'seguros': {
+        'Reuniões realizadas': COUNT,
+        'Convertidos': COUNT,
+        'Whole life': MONEY,
+        'Plano Saude': MONEY,
+        'Receita Do Mês': MONEY,
+        'Receita Acumulada': MONEY,
+    },
+    'advisor - geral': {
+        'Reuniões realizadas': COUNT,
+        'Convertidos': COUNT,
+        'Valor Venda': MONEY,
+        'Vendido': MONEY,
+        'Receita Atual': MONEY,
+        'Objetivo': MONEY,
+        'Receita Projetada': MONEY,
+    },
+    'missões': {
+        'Elegivel RV': COUNT,
+        'Elegivel Internacional': COUNT,
+        'Elegivel COE': COUNT,
+        'Premiação máxima': MONEY,
+    },
+    'missões 2.0': {
+        'Elegivel RV': COUNT,
+        'Elegivel Fundos': COUNT,
+        'Elegivel PJ': COUNT,
+        'Prem Max': MONEY,
+    },
+    'banco master': {
+        'Volume FGC': MONEY,
+        'Volume Convertido': MONEY,
+    },
+    'captação liq': {
+        'Objetivo Cap Liq': MONEY,
+        'Captação Líquida': MONEY,
+        'Cap x Objetivo': PERCENT,
+        'Ativações': COUNT,
+        'Habilitações': COUNT,
+    },
+    'Hot Money': {
+        'Obj. Cap. Liq': MONEY,
+        'Meta Campanha (70%)': MONEY,
+        'Cap Liq': MONEY,
+        'Necessário para Campanha': MONEY,
+    },
+}
+
+# Textos que a planilha usa para "zero" em células de dinheiro
+_ZERO_TEXTS = {'-', 'R$-', 'R$ -'}
+
+
+def _parse_text(text, kind):
+    """Textos ('R$ 1.234,56', '(10,00)', '71%') já sem espaços nas pontas -> float (NaN se não for número)"""
+    percent = text.str.endswith('%')
+    cleaned = text.str.replace('R$', '', regex=False).str.replace('%', '', regex=False).str.replace(' ', '', regex=False)
+    negative = cleaned.str.startswith('(') & cleaned.str.endswith(')')
+    cleaned = cleaned.str.strip('()')
+    # pt-BR: com vírgula, o ponto é milhar; sem vírgula, mais de um ponto também
+    has_comma = cleaned.str.contains(',', regex=False)
+    thousands = has_comma | (cleaned.str.count(r'\.') > 1)
+    cleaned = cleaned.where(~thousands, cleaned.str.replace('.', '', regex=False))
+    cleaned = cleaned.str.replace(',', '.', regex=False)
+    parsed = pd.to_numeric(cleaned, errors='coerce')
+    parsed = parsed.where(~negative, -parsed)
+    if kind == PERCENT:
+        parsed = parsed.where(~percent, parsed / 100)
+    return parsed
+
+
+def parse_numbers(col, kind):
+    """Converte uma coluna para float conforme o tipo.
+
+    Retorna (valores, falhas): ``falhas`` é uma máscara das células que tinham
+    conteúdo mas não puderam ser convertidas (ficam NaN).
+    """
+    if pd.api.types.is_numeric_dtype(col.dtype) and not pd.api.types.is_bool_dtype(col.dtype):
+        return col.astype(float), pd.Series(False, index=col.index)
+
+    values = pd.Series(np.nan, index=col.index, dtype=float)
+    failed = pd.Series(False, index=col.index)
+
+    if isinstance(col.dtype, pd.StringDtype):
+        # Coluna de texto: tudo que não é vazio é str, sem conferir célula a célula
+        raw = col
+        is_number = pd.Series(False, index=col.index)
+        is_text = col.notna()
+    else:
+        raw = col.astype(object)
+        is_number = raw.map(lambda v: isinstance(v, (int, float, np.number)) and not isinstance(v, bool))
+        is_text = raw.map(lambda v: isinstance(v, str))
+        values[is_number] = raw[is_number].astype(float)
+
+    text = raw[is_text].astype(str).str.replace('\xa0', ' ').str.strip()
+    blank = text == ''
+    zero = text.isin(_ZERO_TEXTS) | (text.str.replace(' ', '') == 'R$-')
+    parsed = pd.Series(np.nan, index=text.index)
+    # Só textos com algum dígito podem ser números (numa coluna de nomes, nenhum)
+    has_digit = text.str.contains(r'[0-9]')
+    if has_digit.any():
+        parsed[has_digit] = _parse_text(text[has_digit], kind)
+    parsed = parsed.where(~zero, 0.0)
+    values[is_text] = parsed
+    failed[is_text] = parsed.isna() & ~blank
+
+    # Outros tipos (datas, booleanos) não são números
+    other = raw.notna() & ~is_number & ~is_text
+    failed |= other
+    return values, failed
+
+
+def normalize_sheet(name, df):
+    """Aplica o schema da aba. Retorna (df tipado, relatório de conversão).
+
+    O relatório é uma lista de dicts com aba, coluna, linha (como no Excel) e
+    o valor original de cada célula que não pôde ser convertida.
+    """
+    schema = SHEET_SCHEMAS.get(name)
+    report = []
+    if not schema or df.empty:
+        return df, report
+
+    # Cópia rasa: com Copy-on-Write só as colunas convertidas são copiadas
+    df = df.copy(deep=False)
+    for term, kind in schema.items():
+        col = find_column(df, term)
+        if col is None or kind == TEXT:
+            continue
+        original = df[col]
+        if pd.api.types.is_numeric_dtype(original.dtype) and not pd.api.types.is_bool_dtype(original.dtype):
+            # Já numérica (o Excel guardou números): nada a converter
+            continue
+        values, failed = parse_numbers(original, kind)
+        if kind == COUNT:
+            known = values.dropna()
+            if (known == known.round()).all():
+                values = values.astype('Int64')
+        df[col] = values
+        for idx in failed[failed].index:
+            report.append({
+                'aba': name,
+                'coluna': col,
+                'linha': int(idx) + 2,
+                'valor': str(original[idx]),
+                'tipo': kind,
+            })
+    return df, report
+
+
+# Abas lidas por posição (blocos abaixo de um rótulo): as linhas vazias do
+# meio marcam a estrutura e não são removidas
+POSITIONAL_SHEETS = {'visão geral'}
+# Texto vira categoria quando há no máximo uma categoria para cada duas linhas
+CATEGORY_MAX_RATIO = 0.5
+# Inteiros só viram int32 com folga para somar dois valores sem estourar
+_INT32_HEADROOM = 2 ** 30
+# Abas menores que isto mantêm os tipos: trocar o tipo de cada coluna custa
+# mais do que os poucos KB que economiza
+COMPACT_MIN_ROWS = 1000
+
+
+def _compact_column(col):
+    """A coluna em tipo menor, ou None se ela fica como está"""
+    dtype = col.dtype
+    if pd.api.types.is_bool_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype):
+        return None
+    if pd.api.types.is_integer_dtype(dtype):
+        if dtype.itemsize <= 4:
+            return None
+        low, high = col.min(), col.max()
+        if pd.isna(high) or (-_INT32_HEADROOM < low and high < _INT32_HEADROOM):
+            return col.astype('Int32' if pd.api.types.is_extension_array_dtype(dtype) else 'int32')
+        return None
+    if pd.api.types.is_float_dtype(dtype):
+        if dtype.itemsize <= 4:
+            return None
+        # float32 só quando não muda nenhum valor (dinheiro com centavos fica em float64)
+        values = col.to_numpy(dtype=np.float64)
+        small = values.astype(np.float32)
+        with np.errstate(over='ignore', invalid='ignore'):
+            if np.array_equal(small.astype(np.float64), values, equal_nan=True):
+                return pd.Series(small, index=col.index, name=col.name)
+        return None
+    if pd.api.types.infer_dtype(col, skipna=True) == 'string' and col.nunique() <= len(col) * CATEGORY_MAX_RATIO:
+        return col.astype('category')
+    return None
+
+
+def frame_nbytes(df):
+    """Bytes das colunas da aba, sem percorrer os objetos Python (exato para texto 'str' e categorias)"""
+    return int(df.memory_usage(index=False, deep=False).sum())
+
+
+def compact_sheet(name, df):
+    """Representação compacta da aba. Retorna (df, bytes antes, bytes depois).
+
+    Remove colunas sem nome e sem dados ('Unnamed: N') e linhas totalmente
+    vazias (só as do fim nas abas de ``POSITIONAL_SHEETS``), guarda texto
+    repetido como categoria e reduz inteiros para int32 e floats para float32
+    quando isso não altera nenhum valor (só a partir de ``COMPACT_MIN_ROWS``
+    linhas). O índice original é mantido, então a linha no Excel continua
+    sendo ``índice + 2``. Só as colunas que mudam de tipo são trocadas; os
+    bytes são os de ``frame_nbytes``.
+    """
+    before = frame_nbytes(df)
+    if df.empty:
+        return df, before, before
+    trimmed = False
+    empty_cols = [c for c in df.columns if str(c).startswith('Unnamed:') and df[c].isna().all()]
+    if empty_cols:
+        df = df.drop(columns=empty_cols)
+        trimmed = True
+    filled = df.notna().any(axis=1).to_numpy()
+    if name in POSITIONAL_SHEETS:
+        last = filled.nonzero()[0]
+        end = last[-1] + 1 if len(last) else 0
+        if end < len(df):
+            df = df.iloc[:end]
+            trimmed = True
+    elif not filled.all():
+        df = df[filled]
+        trimmed = True
+    changed = {}
+    if len(df) >= COMPACT_MIN_ROWS:
+        for col in df.columns:
+            compact = _compact_column(df[col])
+            if compact is not None:
+                changed[col] = compact
+    if not changed and not trimmed:
+        return df, before, before
+    if changed:
+        # Cópia rasa: as colunas que não mudam continuam as mesmas
+        df = df.copy(deep=False)
+        for col, values in changed.items():
+            df[col] = values
+    return df, before, frame_nbytes(df)
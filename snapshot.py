@@ -0,0 +1,255 @@
+"""Versão estática do dashboard, para quem só visualiza (sem Streamlit).
+
+Cada planilha vira uma página HTML com as abas do dashboard, o mesmo tema
+(``theme.STYLE``), os mesmos gráficos do Plotly (``charts.py``) e as tabelas
+e cards do relatório (``export.build_report``), todas com o filtro 'Todos'.
+A página é gerada uma única vez por arquivo e nome (``SnapshotJobs``); cada
+visitante depois custa só a leitura de um arquivo, não uma execução do
+script.
+
+Uso::
+
+    python snapshot.py planilha.xlsx          # gera a página em SNAPSHOT_DIR
+    python snapshot.py --serve --port 8502    # serve as páginas
+
+Com ``DASHVERTIQ_SNAPSHOT_PORT`` o dashboard sobe o servidor junto e gera a
+página de cada arquivo carregado; ``DASHVERTIQ_SNAPSHOT_URL`` troca o
+endereço mostrado no link (ex.: quando a pasta é servida por outro servidor).
+
+O servidor só atende no endereço local (``DASHVERTIQ_SNAPSHOT_HOST`` ou
+``--host`` para abrir para a rede) e não lista a pasta: cada página só é
+achada por quem recebeu o link, que leva o sha256 do arquivo.
+"""
+import argparse
+import html
+import os
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import plotly
+from plotly.offline import get_plotlyjs
+
+from charts import advisor_revenue_bar, product_pie
+from export import SECTIONS, ExportJobs, build_report, format_value, table_html
+from formatting import format_currency
+from ingest import LazyWorkbook
+from metrics import CAPTACAO_RANGES
+from theme import STYLE
+from workbook_cache import CACHE_DIR, DiskCache
+
+# Versão do layout da página; páginas geradas com outra versão são refeitas
+SNAPSHOT_VERSION = 1
+SNAPSHOT_DIR = os.environ.get('DASHVERTIQ_SNAPSHOT_DIR', os.path.join(CACHE_DIR, 'snapshots'))
+SNAPSHOT_PORT = int(os.environ.get('DASHVERTIQ_SNAPSHOT_PORT') or 0) or None
+SNAPSHOT_HOST = os.environ.get('DASHVERTIQ_SNAPSHOT_HOST') or '127.0.0.1'
+SNAPSHOT_URL = os.environ.get('DASHVERTIQ_SNAPSHOT_URL') or (
+    f'http://localhost:{SNAPSHOT_PORT}' if SNAPSHOT_PORT else None)
+# Assessores no gráfico de receita (o padrão do dashboard)
+TOP_ASSESSORES = 20
+# Um plotly.js para todas as páginas (o navegador baixa uma vez)
+PLOTLY_JS = f'plotly-{plotly.__version__}.min.js'
+# Páginas e plotly.js não mudam depois de gerados (o nome leva o sha256 e a versão)
+MAX_AGE = 86400
+
+# Abas em CSS puro: um rádio por aba, os rótulos numa linha e só o painel da
+# aba marcada aparece
+_PAGE_STYLE = """
+<style>
+    body { background-color: #0d0d0d; font-family: 'Source Sans Pro', 'Segoe UI', Arial, sans-serif; padding: 32px 48px; }
+    h1 { margin-bottom: 6px; }
+    h2 { margin: 28px 0 16px; }
+    h3 { margin: 28px 0 10px; }
+    .snapshot-info { font-size: 13px; margin-bottom: 24px; }
+    .abas { display: flex; flex-wrap: wrap; gap: 15px; }
+    .abas > input { display: none; }
+    .abas > label { background-color: #1a1a1a; color: #FFD700; border: 1px solid rgba(255, 215, 0, 0.3);
+                    border-radius: 8px 8px 0 0; padding: 10px 25px; font-weight: 600; cursor: pointer; }
+    .abas > input:checked + label { background-color: #FFD700; color: #0d0d0d; border-color: #FFD700; }
+    .painel { display: none; order: 1; width: 100%; border-top: 1px solid rgba(255, 215, 0, 0.3); }
+    .abas > input:checked + label + .painel { display: block; }
+    .tabela { max-height: 480px; overflow: auto; border: 1px solid #262626; border-radius: 8px; }
+    table { border-collapse: collapse; width: 100%; font-size: 14px; }
+    th { background-color: #1a1a1a; color: #FFD700; text-align: left; padding: 8px 10px; position: sticky; top: 0; }
+    td { border-bottom: 1px solid #262626; padding: 6px 10px; }
+    td.num { text-align: right; white-space: nowrap; }
+    .rodape { text-align: center; font-size: 12px; margin-top: 40px; }
+    .rodape, .rodape * { color: #FFD700 !important; }
+</style>
+"""
+
+# Gráficos em painel escondido nascem com a largura errada: ajusta ao trocar de aba
+_TAB_SCRIPT = """
+<script>
+document.querySelectorAll('.abas > input').forEach(function (aba) {
+    aba.addEventListener('change', function () { window.dispatchEvent(new Event('resize')); });
+});
+</script>
+"""
+
+_PLOTLY_CONFIG = {'displaylogo': False, 'responsive': True}
+
+
+def _figure_html(fig):
+    return fig.to_html(full_html=False, include_plotlyjs=False, config=_PLOTLY_CONFIG)
+
+
+def _cards_html(cards):
+    esc = html.escape
+    parts = ['<div class="metrics-container">']
+    for _, label, value, kind in cards:
+        parts.append(f'<div class="metric-card"><div class="metric-card-title">{esc(label)}</div>'
+                     f'<div class="metric-card-value">{esc(format_value(value, kind))}</div></div>')
+    parts.append('</div>')
+    return ''.join(parts)
+
+
+def _ranges_html():
+    parts = ['<div class="metrics-container">']
+    for item in CAPTACAO_RANGES:
+        parts.append(f"""<div class="range-card">
+            <div class="range-title">{html.escape(item['titulo'])}</div>
+            <div class="range-classification">{html.escape(item['classificacao'])}</div>
+            <div class="range-info"><span>Objetivo:</span>
+            <span style="font-weight: bold;">{format_currency(item['objetivo'])}</span></div>
+        </div>""")
+    parts.append('</div>')
+    return ''.join(parts)
+
+
+def render_snapshot(sheets, name='planilha'):
+    """Página HTML com todas as abas do dashboard para um ``ingest.LazyWorkbook``"""
+    esc = html.escape
+    report = build_report(sheets, name)
+    figures = {'Visão Geral': []}
+    if 'visão geral' in sheets:
+        figures['Visão Geral'].append(('🎯 Concentração de Receita por Produto', sheets.derived_workbook(product_pie)))
+    if 'assessores' in sheets:
+        figures['Visão Geral'].append(('👤 Receita por Assessor', sheets.derived_workbook(advisor_revenue_bar, TOP_ASSESSORES)))
+
+    parts = [
+        '<!DOCTYPE html><html lang="pt-BR"><head><meta charset="utf-8">',
+        '<meta name="viewport" content="width=device-width, initial-scale=1">',
+        f'<title>Dashboard Financeiro - Vértiq · {esc(name)}</title>',
+        STYLE, _PAGE_STYLE,
+        f'<script src="{PLOTLY_JS}"></script></head><body>',
+        '<h1>📊 Dashboard Financeiro</h1>',
+        f'<p class="snapshot-info">Versão estática de {esc(name)} · gerada em '
+        f'{time.strftime("%d/%m/%Y %H:%M", report.created)}</p>',
+        '<div class="abas">',
+    ]
+    for i, section in enumerate(SECTIONS):
+        parts.append(f'<input type="radio" name="aba" id="aba-{i}"{" checked" if i == 0 else ""}>'
+                     f'<label for="aba-{i}">{esc(section)}</label><div class="painel">')
+        parts.append(f'<h2>{esc(section)}</h2>')
+        if section == 'Captação Liq':
+            parts.append(_ranges_html())
+        cards = [card for card in report.cards if card[0] == section]
+        if cards:
+            parts.append(_cards_html(cards))
+        for title, fig in figures.get(section, []):
+            if fig is not None:
+                parts.append(f'<h3>{esc(title)}</h3>')
+                parts.append(_figure_html(fig))
+        tables = [table for table in report.tables if table[0] == section]
+        for _, title, df, kinds in tables:
+            parts.append(f'<h3>{esc(title)}</h3><div class="tabela">{table_html(df, kinds)}</div>')
+        if not cards and not tables:
+            parts.append('<p>ℹ️ Nenhum dado disponível nesta planilha.</p>')
+        parts.append('</div>')
+    parts.append('</div>')
+    parts.append('<p class="rodape">Dashboard Financeiro © 2026 | Vértiq Digital</p>')
+    parts.append(_TAB_SCRIPT)
+    parts.append('</body></html>')
+    return ''.join(parts)
+
+
+class SnapshotJobs(ExportJobs):
+    """Uma página estática por planilha, gerada em segundo plano (ver ``export.ExportJobs``)"""
+
+    version = SNAPSHOT_VERSION
+
+    def __init__(self, root=SNAPSHOT_DIR, **kwargs):
+        super().__init__(root, **kwargs)
+        path = os.path.join(root, PLOTLY_JS)
+        if not os.path.exists(path):
+            tmp = f'{path}.{threading.get_ident()}.tmp'
+            with open(tmp, 'w', encoding='utf-8') as fh:
+                fh.write(get_plotlyjs())
+            os.replace(tmp, path)
+
+    def write(self, sheets, fmt, name, path):
+        with open(path, 'w', encoding='utf-8') as fh:
+            fh.write(render_snapshot(sheets, name))
+
+    def publish(self, sheets, name='planilha'):
+        """``Future`` da página do arquivo; começa a gerar se ainda não existe"""
+        return self.job(sheets.digest, 'html', name) or self.submit(sheets, 'html', name)
+
+
+def snapshot_url(path, base=SNAPSHOT_URL):
+    return f'{base.rstrip("/")}/{os.path.basename(path)}'
+
+
+class SnapshotHandler(SimpleHTTPRequestHandler):
+    """Serve as páginas da pasta, sem listar o que há nela"""
+
+    def list_directory(self, path):
+        self.send_error(404)
+        return None
+
+    def send_response(self, code, message=None):
+        super().send_response(code, message)
+        if code == 200:
+            self.send_header('Cache-Control', f'public, max-age={MAX_AGE}')
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_server(root=SNAPSHOT_DIR, port=8502, host=SNAPSHOT_HOST):
+    os.makedirs(root, exist_ok=True)
+    return ThreadingHTTPServer((host, port), partial(SnapshotHandler, directory=root))
+
+
+def start_server(root=SNAPSHOT_DIR, port=8502, host=SNAPSHOT_HOST):
+    """Servidor das páginas numa thread à parte (usado pelo dashboard)"""
+    server = make_server(root, port, host)
+    threading.Thread(target=server.serve_forever, name='snapshot-server', daemon=True).start()
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Versão estática do dashboard (uma página por planilha)")
+    parser.add_argument('arquivos', nargs='*', help="planilhas .xlsx para gerar a página")
+    parser.add_argument('--dir', default=SNAPSHOT_DIR, help="pasta das páginas (padrão: SNAPSHOT_DIR)")
+    parser.add_argument('--serve', action='store_true', help="serve a pasta das páginas depois de gerar")
+    parser.add_argument('--port', type=int, default=SNAPSHOT_PORT or 8502, help="porta do servidor (padrão: 8502)")
+    parser.add_argument('--host', default=SNAPSHOT_HOST, help=f"endereço do servidor (padrão: {SNAPSHOT_HOST})")
+    parser.add_argument('--cache', action='store_true', help="usa o cache em disco do dashboard")
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help="pasta do cache em disco (padrão: a do dashboard)")
+    args = parser.parse_args(argv)
+    if not args.arquivos and not args.serve:
+        parser.error("informe as planilhas e/ou --serve")
+
+    jobs = SnapshotJobs(args.dir)
+    cache = DiskCache(args.cache_dir) if args.cache else None
+    for path in args.arquivos:
+        start = time.perf_counter()
+        sheets = LazyWorkbook(path, cache=cache)
+        page = jobs.publish(sheets, os.path.basename(path)).result()
+        print(f"{path} -> {page} ({time.perf_counter() - start:.1f} s)")
+
+    if args.serve:
+        server = make_server(args.dir, args.port, args.host)
+        print(f"Servindo {args.dir} em http://{args.host}:{args.port}/")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
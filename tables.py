@@ -0,0 +1,89 @@
+"""Paginação, ordenação e tipo de exibição das tabelas do dashboard (sem dependência do Streamlit).
+
+A ordenação usa os valores de verdade da coluna, antes da formatação: 'R$
+1.234,56' ordena como número, não como texto. Só a página pedida segue
+para a formatação e para o navegador.
+
+O tipo de exibição de cada coluna (dinheiro, contagem, porcentagem) vem do
+nome dela e vale para a tela (``display_data_table``) e para o relatório
+exportado (``export.py``).
+"""
+import math
+
+import pandas as pd
+
+from columns import normalize
+from schema import COUNT, MONEY, PERCENT, parse_numbers
+
+# COLUNAS QUE DEVEM SER FORMATADAS COMO R$
+MONEY_KEYWORDS = ['receita', 'vendido', 'objetivo', 'valor', 'parcela', 'realizado', 'meta', 'pipeline', 'whole life','pj 2', 'internacional', 'plano saude', 'câmbio', 'fundos', 'resultado', 'consorcios', 'seguros', 'maxima', 'prem', 'coe', 'pj2', 'rv', 'rf', 'objetivo', 'consórcio', 'total', 'Forecast', 'Volume','Cap Liq', 'necessário para campanha', 'obj. cap. liq', 'obj. cap', 'cap liq', 'consorcio', 'valor venda']
+
+# COLUNAS QUE DEVEM FICAR COMO NÚMEROS (NÃO MOEDA)
+NUMBER_KEYWORDS = ['convertidos', 'reuniões', 'boletas ', 'elegivel' ]
+
+# COLUNAS DE PORCENTAGEM (0.5 = 50%)
+PERCENT_KEYWORDS = ['pace', 'cap x objetivo']
+
+
+def column_kind(col, numeric):
+    """Tipo de exibição pelo nome da coluna: COUNT, PERCENT (só se ``numeric``), MONEY ou None"""
+    col_lower = str(col).lower().strip()
+    # Prioridade: Se é número puro, deixa como número
+    if any(key in col_lower for key in NUMBER_KEYWORDS):
+        return COUNT
+    if numeric and any(key in col_lower for key in PERCENT_KEYWORDS):
+        return PERCENT
+    if any(key.lower() in col_lower for key in MONEY_KEYWORDS):
+        return MONEY
+    return None
+
+
+def display_values(series, kind):
+    """Valores numéricos da coluna para exibir como ``kind`` (vazios viram 0).
+
+    Colunas já tipadas na leitura (schema.py) não precisam de limpeza; as
+    demais passam pela limpeza de texto de sempre.
+    """
+    typed = pd.api.types.is_numeric_dtype(series.dtype)
+    if kind == COUNT:
+        values = series if typed else pd.to_numeric(series.astype(str).str.replace('R$', '').str.strip(), errors='coerce')
+        return values.fillna(0).astype(int)  # 0, 2, 1 (sem decimais)
+    if kind == MONEY:
+        # parse_numbers: pt-BR ('1.234,56'), negativos e 'R$ -' (zero)
+        values = series if typed else parse_numbers(series, MONEY)[0]
+        return values.fillna(0).astype(float)
+    return series
+
+
+def sort_key(series):
+    """Valores usados para ordenar a coluna.
+
+    Colunas numéricas ordenam pelo número; textos que são todos valores
+    ('R$ 1.234,56', '12%') também. Os demais textos ordenam sem diferenciar
+    maiúsculas nem acentos. Vazios ficam por último.
+    """
+    if pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+        return series
+    values, failed = parse_numbers(series, MONEY)
+    if not failed.any() and values.notna().any():
+        return values
+    # Em object: o map de uma categoria devolveria outra categoria, que ordena
+    # pela ordem das categorias originais e não pelo texto normalizado
+    return series.astype(object).map(lambda v: None if not isinstance(v, str) and pd.isna(v) else normalize(str(v).strip()))
+
+
+def paginate(df, page, page_size, sort_by=None, ascending=True):
+    """Linhas da página ``page`` (a partir de 1), ordenadas por ``sort_by`` se houver.
+
+    Retorna (página, total de linhas, total de páginas); ``page`` fora do
+    intervalo vira a primeira ou a última página.
+    """
+    total = len(df)
+    pages = max(math.ceil(total / page_size), 1)
+    page = min(max(int(page), 1), pages)
+    start = (page - 1) * page_size
+    if sort_by is None or sort_by not in df.columns:
+        return df.iloc[start:start + page_size], total, pages
+    key = sort_key(df[sort_by]).reset_index(drop=True)
+    order = key.sort_values(ascending=ascending, na_position='last', kind='stable').index
+    return df.iloc[order[start:start + page_size]], total, pages
@@ -0,0 +1,33 @@
+import pandas as pd
+
+from advisors import AdvisorIndex, build_advisor_index
+
+DF = pd.DataFrame({
+    'Assessor': ['João ', 'Ana', None, 'joao', '', 'ANA', 'Bruno'],
+    'Receita': [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0],
+})
+
+
+def test_rows_by_normalized_name():
+    index = build_advisor_index(DF)
+    assert index.column == 'Assessor'
+    assert index.rows('João')['Receita'].tolist() == [1.0, 4.0]
+    assert index.rows(' JOAO ')['Receita'].tolist() == [1.0, 4.0]
+    assert index.rows('ana')['Receita'].tolist() == [2.0, 6.0]
+    assert index.positions('Ana').tolist() == [1, 5]
+
+
+def test_names_keep_first_spelling_and_sheet_order():
+    index = AdvisorIndex(DF, 'Assessor')
+    assert index.names == ['João', 'Ana', 'Bruno']
+    assert index.options == ['Ana', 'Bruno', 'João']
+    assert list(index.groups()) == ['joao', 'ana', 'bruno']
+
+
+def test_unknown_name_and_missing_column():
+    index = AdvisorIndex(DF, 'Assessor')
+    assert index.rows('Carla').empty
+    assert list(index.rows('Carla').columns) == ['Assessor', 'Receita']
+    index = build_advisor_index(DF, 'Consultor')
+    assert index.column is None
+    assert index.options == [] and index.rows('Ana').empty
@@ -0,0 +1,41 @@
+import pandas as pd
+
+import batch
+
+
+def test_parquet_output_with_mixed_types(tmp_path):
+    rows = [
+        {'arquivo': 'a.xlsx', 'visao_geral.pace': 0.25, 'captacao.ativacoes_total': 3,
+         'visao_geral.rotulos_ausentes': [], 'erro': None},
+        {'arquivo': 'b.xlsx', 'visao_geral.pace': 'a definir', 'captacao.ativacoes_total': 2.5,
+         'visao_geral.rotulos_ausentes': ['Forecast'], 'erro': None},
+        {'arquivo': 'c.xlsx', 'erro': 'arquivo corrompido'},
+    ]
+    output = str(tmp_path / 'kpis.parquet')
+    batch.write_output(rows, output)
+    df = pd.read_parquet(output)
+    assert df['visao_geral.pace'].tolist()[:2] == ['0.25', 'a definir']
+    assert df['captacao.ativacoes_total'].tolist()[:2] == [3.0, 2.5]
+    assert df['visao_geral.rotulos_ausentes'].tolist()[:2] == ['[]', '["Forecast"]']
+    assert df['erro'].isna().tolist() == [True, True, False]
+
+
+def test_cache_flag_does_not_swallow_the_folder(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(batch, 'ProcessPoolExecutor', lambda max_workers: _Inline())
+    monkeypatch.setattr(batch, 'process_file', lambda path, cache_dir: calls.append(cache_dir) or {'erro': None})
+    (tmp_path / 'a.xlsx').write_bytes(b'')
+    output = str(tmp_path / 'kpis.json')
+    assert batch.main(['--cache', str(tmp_path), '-o', output]) == 0
+    assert calls == [batch.CACHE_DIR]
+
+
+class _Inline:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def map(self, fn, *iterables):
+        return map(fn, *iterables)
@@ -0,0 +1,11 @@
+from charts import advisor_revenue_bar
+from ingest import LazyWorkbook
+from test_ingest import _xlsx
+
+
+def test_only_the_aggregate_bar_is_grey():
+    rows = [['Assessores', 'Total'], ['Outros Santos', 900.0], ['Ana', 800.0], ['Bruno', 100.0], ['Caio', 50.0]]
+    sheets = LazyWorkbook(_xlsx({'assessores': rows}))
+    bar = advisor_revenue_bar(sheets, 2).data[0]
+    colors = dict(zip(bar.y, bar.marker.color))
+    assert colors == {'Outros (2)': '#808080', 'Ana': '#FFD700', 'Outros Santos': '#FFD700'}
@@ -0,0 +1,52 @@
+import pandas as pd
+import pytest
+
+from columns import ColumnIndex, find_column, normalize
+
+COLUMNS = ['Assessor', 'Obj. Cap. Liq', 'Cap Liq', 'Captação  Líquida', 'Cap x Objetivo',
+           'Receita Atual', 'Receita', 'Consórcio', 'Total', 2024, 'Unnamed: 10']
+
+
+def _linear_scan(columns, search_terms):
+    """A varredura antiga, com os nomes normalizados"""
+    if isinstance(search_terms, str):
+        search_terms = [search_terms]
+    for term in search_terms:
+        matching = [c for c in columns if normalize(term) in normalize(c)]
+        if matching:
+            return matching[0]
+    return None
+
+
+@pytest.mark.parametrize('terms', [
+    'cap liq', 'CAP', 'captação líquida', 'captacao liquida', 'receita', 'Receita Atual',
+    'consorcio', 'objetivo', '2024', 'liq', 'q', 'nada', ['nada', 'total'], ['total', 'cap'],
+    'iq\x00', '',
+])
+def test_find_matches_the_linear_scan(terms):
+    assert ColumnIndex(COLUMNS).find_first(terms) == _linear_scan(COLUMNS, terms)
+
+
+def test_first_match_in_column_order():
+    index = ColumnIndex(COLUMNS)
+    # 'Obj. Cap. Liq' vem antes de 'Cap Liq' e também contém 'cap'
+    assert index.find('cap') == 'Obj. Cap. Liq'
+    assert index.find('cap liq') == 'Cap Liq'
+    # Um termo não atravessa a fronteira entre duas colunas
+    assert index.find('liq cap') is None
+    assert ColumnIndex([]).find('') is None
+
+
+def test_exact_and_prefix():
+    index = ColumnIndex(COLUMNS)
+    assert index.exact('receita') == 'Receita'
+    assert index.exact('receit') is None
+    assert index.prefix('receita') == 'Receita Atual'
+    assert index.prefix('cap') == 'Cap Liq'
+    assert index.prefix('liq') is None
+
+
+def test_find_column_accepts_dataframes_and_term_lists():
+    df = pd.DataFrame(columns=COLUMNS)
+    assert find_column(df, ['Forecast', 'Captação Líquida']) == 'Captação  Líquida'
+    assert find_column(df, 'Pace') is None
@@ -0,0 +1,53 @@
+import threading
+from concurrent.futures import Future
+
+from export import ExportJobs
+
+
+class ImmediateExecutor:
+    """Roda a tarefa já no submit: o Future volta pronto"""
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+class FakeWorkbook:
+    digest = 'a' * 64
+
+
+class InstantJobs(ExportJobs):
+    def write(self, sheets, fmt, name, path):
+        with open(path, 'w', encoding='utf-8') as fh:
+            fh.write(name)
+
+
+def test_submit_job_that_finishes_before_returning(tmp_path):
+    jobs = InstantJobs(str(tmp_path))
+    jobs._pool = ImmediateExecutor()
+    result = {}
+
+    def run():
+        result['job'] = jobs.submit(FakeWorkbook(), 'html', 'relatório')
+        result['again'] = jobs.job(FakeWorkbook.digest, 'html', 'relatório')
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+    assert not thread.is_alive(), "submit travou no lock"
+    assert result['job'].result() == jobs.path(FakeWorkbook.digest, 'html', 'relatório')
+    assert result['again'].result() == result['job'].result()
+    assert jobs._jobs == {}
+
+
+def test_same_file_under_another_name_gets_its_own_report(tmp_path):
+    jobs = InstantJobs(str(tmp_path))
+    jobs._pool = ImmediateExecutor()
+    first = jobs.submit(FakeWorkbook(), 'html', 'janeiro.xlsx').result()
+    assert jobs.job(FakeWorkbook.digest, 'html', 'fevereiro.xlsx') is None
+    second = jobs.submit(FakeWorkbook(), 'html', 'fevereiro.xlsx').result()
+    assert first != second
+    with open(second, encoding='utf-8') as fh:
+        assert fh.read() == 'fevereiro.xlsx'
+    assert jobs.job(FakeWorkbook.digest, 'html', 'janeiro.xlsx').result() == first
@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from formatting import format_currency, format_currency_series
+
+
+def _expected(values):
+    return [format_currency(v) for v in values]
+
+
+def _columns():
+    rng = np.random.default_rng(0)
+    edges = np.arange(-2000, 2000) / 100
+    return {
+        'negativos e NaN': pd.Series([0.0, -0.0, 1.0, -1.0, 1234.5, -1234567.891, np.nan, 999.995, 1e15, 1e20]),
+        'meio centavo': pd.Series(np.concatenate([edges + 0.005, edges - 0.005, [0.125, 2.675, 1.005]])),
+        'aleatórios': pd.Series(np.round(rng.normal(0, 1e6, 5000), 3)),
+        'infinitos': pd.Series([np.inf, -np.inf, 1.0]),
+        'Int64': pd.Series([1, None, -1234567, 0], dtype='Int64'),
+        'int64': pd.Series(rng.integers(-10 ** 12, 10 ** 12, 500)),
+        'bool': pd.Series([True, False]),
+        'category': pd.Series([1234.5, -2.0, 1234.5], dtype='category'),
+        'object': pd.Series([1234.5, '', '-', 'R$ 1.234', None, 7], dtype=object),
+    }
+
+
+@pytest.mark.parametrize('name', list(_columns()))
+def test_same_text_as_format_currency(name):
+    values = _columns()[name]
+    result = format_currency_series(values)
+    assert result.tolist() == _expected(values)
+    assert result.index.equals(values.index)
+
+
+def test_empty_and_list_input():
+    assert format_currency_series(pd.Series([], dtype=float)).tolist() == []
+    assert format_currency_series([1.5, -2]).tolist() == ['R$ 1,50', 'R$ -2,00']
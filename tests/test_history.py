@@ -0,0 +1,22 @@
+from history import HistoryStore
+from ingest import LazyWorkbook
+from test_ingest import _xlsx
+
+ASSESSORES = [
+    ['Assessores', 'Total'],
+    ['Ana', 1000.0],
+    ['ana ', 500.0],
+    ['Bruno', 250.0],
+]
+
+
+def test_submit_records_in_background_once(tmp_path):
+    store = HistoryStore(str(tmp_path / 'historico.sqlite'))
+    sheets = LazyWorkbook(_xlsx({'assessores': ASSESSORES}))
+    job = store.submit(sheets, arquivo='planilha.xlsx')
+    assert store.submit(sheets) is job or job.done()
+    assert job.result(timeout=10) is True
+    assert store.submit(sheets).result(timeout=10) is False
+
+    history = store.advisor_history()
+    assert dict(zip(history['assessor'], history['receita'])) == {'Ana': 1500.0, 'Bruno': 250.0}
@@ -0,0 +1,139 @@
+import re
+import zipfile
+from io import BytesIO
+
+import openpyxl
+import pandas as pd
+from openpyxl.styles import PatternFill
+
+from ingest import LazyWorkbook, rows_to_frame, sheet_hashes, used_range
+
+
+def _xlsx(sheets):
+    wb = openpyxl.Workbook()
+    wb.remove(wb.active)
+    for name, rows in sheets.items():
+        ws = wb.create_sheet(name)
+        for row in rows:
+            ws.append(row)
+    out = BytesIO()
+    wb.save(out)
+    return out.getvalue()
+
+
+HOT_MONEY = [
+    ['Assessor', 'Cap Liq', 'Necessário para Campanha'],
+    ['Ana', 'R$ 1.000,00', 'R$ 200,00'],
+    ['Bruno', 'R$ 2.500,50', '-'],
+]
+
+
+def test_same_content_under_another_name_gets_its_own_key():
+    data = _xlsx({'rascunho': HOT_MONEY, 'Hot Money': HOT_MONEY})
+    keys = sheet_hashes(data)
+    assert keys['rascunho'] != keys['Hot Money']
+
+    book = LazyWorkbook(data)
+    # A cópia sem schema é lida primeiro e não pode ser reaproveitada
+    assert book['rascunho']['Cap Liq'].tolist() == ['R$ 1.000,00', 'R$ 2.500,50']
+    hot_money = book['Hot Money']
+    assert pd.api.types.is_float_dtype(hot_money['Cap Liq'].dtype)
+    assert hot_money['Cap Liq'].tolist() == [1000.0, 2500.5]
+
+
+def test_book_is_closed_once_every_sheet_is_read():
+    book = LazyWorkbook(_xlsx({'um': HOT_MONEY, 'dois': HOT_MONEY}))
+    book['um']
+    assert book._book is not None
+    book['dois']
+    assert book._book is None
+
+    # Fechado à força (ex.: saiu do WorkbookCache), reabre para a aba que falta
+    book = LazyWorkbook(_xlsx({'um': HOT_MONEY, 'dois': HOT_MONEY}))
+    book['um']
+    book.close()
+    assert book['dois']['Assessor'].tolist() == ['Ana', 'Bruno']
+    assert book._book is None
+
+
+def test_chunked_parse_keeps_the_single_pass_dtypes():
+    rows = ([('Assessor', 'Observação', 'Valor')]
+            + [(f'A{i}', None, None) for i in range(5)]
+            + [(f'B{i}', 'ok', None) for i in range(5)]
+            + [(f'C{i}', None, 2) for i in range(2)])
+    whole = rows_to_frame(iter(rows))
+    chunked = rows_to_frame(iter(rows), chunk_rows=3)
+    assert pd.api.types.is_string_dtype(chunked['Observação'].dtype)
+    assert chunked.dtypes.to_dict() == whole.dtypes.to_dict()
+    pd.testing.assert_frame_equal(chunked, whole)
+
+
+def test_derived_none_is_cached():
+    book = LazyWorkbook(_xlsx({'um': HOT_MONEY}))
+    calls = []
+
+    def missing(df):
+        calls.append(len(df))
+        return None
+
+    def nothing(sheets, option):
+        calls.append(option)
+        return None
+
+    assert book.derived('um', missing) is None
+    assert book.derived('um', missing) is None
+    assert book.derived_workbook(nothing, 5) is None
+    assert book.derived_workbook(nothing, 5) is None
+    assert calls == [2, 5]
+
+
+def _formatted_tail_xlsx():
+    """Aba com valores até B3, uma fórmula sem valor calculado e formatação até AD5000"""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = 'Hot Money'
+    for row in HOT_MONEY:
+        ws.append(row[:2])
+    ws['E1'] = '=B2*2'
+    fill = PatternFill('solid', fgColor='FFFF00')
+    ws.cell(row=5000, column=1).fill = fill
+    ws.cell(row=2, column=30).fill = fill
+    out = BytesIO()
+    wb.save(out)
+    return out.getvalue()
+
+
+def _rewrite_sheet(data, change):
+    out = BytesIO()
+    with zipfile.ZipFile(BytesIO(data)) as src, zipfile.ZipFile(out, 'w') as dst:
+        for item in src.infolist():
+            content = src.read(item.filename)
+            if item.filename == 'xl/worksheets/sheet1.xml':
+                content = change(content)
+            dst.writestr(item, content)
+    return out.getvalue()
+
+
+def test_used_range_ignores_format_only_cells():
+    data = _formatted_tail_xlsx()
+    with zipfile.ZipFile(BytesIO(data)) as zf:
+        assert used_range(zf, 'xl/worksheets/sheet1.xml') == (3, 2)
+    df = LazyWorkbook(data)['Hot Money']
+    assert df.shape == (2, 2)
+    assert df['Cap Liq'].tolist() == [1000.0, 2500.5]
+
+
+def test_used_range_falls_back_to_a_full_read():
+    # Células sem referência (r="A1"): sem a extensão, a aba é lida inteira
+    data = _rewrite_sheet(_formatted_tail_xlsx(), lambda xml: re.sub(rb'(<c) r="[A-Z]+[0-9]+"', rb'\1', xml))
+    with zipfile.ZipFile(BytesIO(data)) as zf:
+        assert used_range(zf, 'xl/worksheets/sheet1.xml') is None
+    book = LazyWorkbook(data)
+    assert book['Hot Money']['Assessor'].tolist() == ['Ana', 'Bruno']
+    assert book.errors == {}
+
+    # Aba sem nenhum valor: extensão (0, 0) e DataFrame vazio
+    empty = _rewrite_sheet(_formatted_tail_xlsx(), lambda xml: re.sub(rb'<sheetData>.*</sheetData>', b'<sheetData/>', xml))
+    with zipfile.ZipFile(BytesIO(empty)) as zf:
+        assert used_range(zf, 'xl/worksheets/sheet1.xml') == (0, 0)
+    assert LazyWorkbook(empty)['Hot Money'].empty
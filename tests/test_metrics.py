@@ -0,0 +1,61 @@
+import pandas as pd
+
+from advisors import build_captacao_index
+from metrics import build_overview, captacao_kpis, overview_kpis
+
+# Aba 'visão geral': rótulo | valor, uma linha vazia e o bloco de produtos
+OVERVIEW = pd.DataFrame([
+    ['Forecast', 575980.5, None],
+    ['  Meta ', 500000.0, None],
+    ['Meta dia útil', 25000.0, None],
+    ['Realizado de 12/01 até 16/01', 42000.0, None],
+    ['META', 1.0, None],
+    ['forecast', 2.0, None],
+    [None, None, None],
+    ['Produto', 'Realizado', 'Meta'],
+    ['RV', 'R$ 17.611,00', 'R$ 100.000,00'],
+    ['RF', 74606.0, 'R$ -'],
+    [None, None, None],
+])
+
+
+def test_captacao_kpis_without_optional_columns():
+    df = pd.DataFrame({
+        'Assessor': ['Ana', 'Bruno', ''],
+        'Objetivo Cap Liq': [100.0, 200.0, 300.0],
+        'Captação Líquida': [50.0, -60.0, -10.0],
+    })
+    kpis = captacao_kpis(build_captacao_index(df))
+    assert kpis['ativacoes_total'] == 0
+    assert kpis['habilitacoes_total'] == 0
+    assert kpis['assessores_positivos'] == 1
+    assert kpis['objetivo_total'] == 300.0
+
+
+def test_overview_labels_ignore_case_accents_and_spaces():
+    overview = build_overview(OVERVIEW)
+    assert overview.get('Forecast') == 575980.5
+    assert overview.get('meta') == 500000.0
+    assert overview.get('META DIA UTIL') == 25000.0
+    assert overview.period_label == 'Realizado de 12/01 até 16/01'
+    assert overview.period_value == 42000.0
+    assert overview.get('Pace') is None
+    assert overview.missing == []
+
+
+def test_duplicate_labels_keep_the_first_value():
+    overview = build_overview(OVERVIEW)
+    assert overview.duplicates == ['META', 'forecast']
+    assert overview.products['Produto'].tolist() == ['RV', 'RF']
+    assert overview.products['Realizado'].tolist() == [17611.0, 74606.0]
+    assert overview.products['Meta'].tolist() == [100000.0, 0.0]
+    kpis = overview_kpis(overview)
+    assert kpis['receita_total_realizada'] == 17611.0 + 74606.0
+    assert kpis['forecast'] == 575980.5
+
+
+def test_missing_labels_are_reported():
+    overview = build_overview(pd.DataFrame([['Forecast', 1.0]]))
+    assert overview.missing == ['Meta dia útil', 'Meta', 'Realizado de ...']
+    assert overview.products is None
+    assert build_overview(pd.DataFrame({'só uma coluna': [1]})).values == {}
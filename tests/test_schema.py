@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+
+from schema import (COMPACT_MIN_ROWS, COUNT, MONEY, PERCENT, _compact_column, compact_sheet,
+                    normalize_sheet, parse_numbers)
+
+
+def test_pt_br_money_and_dash_zero():
+    values, failed = parse_numbers(pd.Series(['R$ 1.234,56', '-', 'R$ -', 'R$-', '(1.000,00)',
+                                              '1.234.567', '12.5', 3, '', None]), MONEY)
+    assert values[:8].tolist() == [1234.56, 0.0, 0.0, 0.0, -1000.0, 1234567.0, 12.5, 3.0]
+    # Vazios ficam NaN, mas não são falhas
+    assert values[8:].isna().all()
+    assert not failed.any()
+
+
+def test_percent_text_is_a_fraction():
+    values, failed = parse_numbers(pd.Series(['71%', '12,5%', '0,5']), PERCENT)
+    assert values.tolist() == [0.71, 0.125, 0.5]
+    assert not failed.any()
+
+
+def test_unparseable_cells_are_failures():
+    values, failed = parse_numbers(pd.Series(['abc', pd.Timestamp('2024-01-01'), True, 'R$ 1,00']), MONEY)
+    assert failed.tolist() == [True, True, True, False]
+    assert values[:3].isna().all()
+
+
+def test_coercion_report_lists_each_failed_cell():
+    df = pd.DataFrame({
+        'Assessor': ['A', 'B', 'C'],
+        'Reuniões realizadas': ['2', 'x', '3'],
+        'Convertidos': ['1', '1,5', None],
+        'Vendido': ['R$ 10,00', 'R$ -', '??'],
+        'Receita Atual': [1.0, 2.0, 3.0],
+    })
+    typed, report = normalize_sheet('consórcios', df)
+    assert report == [
+        {'aba': 'consórcios', 'coluna': 'Reuniões realizadas', 'linha': 3, 'valor': 'x', 'tipo': COUNT},
+        {'aba': 'consórcios', 'coluna': 'Vendido', 'linha': 4, 'valor': '??', 'tipo': MONEY},
+    ]
+    # Contagem inteira vira Int64; com fração fica float
+    assert typed['Reuniões realizadas'].dtype == 'Int64'
+    assert typed['Convertidos'].dtype == float
+    assert typed['Vendido'].tolist()[:2] == [10.0, 0.0]
+    # Já numérica: a mesma coluna, sem cópia; o original não muda
+    assert np.shares_memory(typed['Receita Atual'].to_numpy(), df['Receita Atual'].to_numpy())
+    assert df['Vendido'].tolist() == ['R$ 10,00', 'R$ -', '??']
+
+
+def test_sheet_without_schema_is_untouched():
+    df = pd.DataFrame({'Valor': ['R$ 1,00']})
+    typed, report = normalize_sheet('outra aba', df)
+    assert typed is df and report == []
+
+
+def test_integers_go_to_int32_only_with_headroom():
+    assert _compact_column(pd.Series([1, -5, 2 ** 30 - 1])).dtype == np.int32
+    assert _compact_column(pd.Series([1, 2 ** 30])) is None
+    assert _compact_column(pd.Series([1, -2 ** 30])) is None
+    assert _compact_column(pd.Series([1, None], dtype='Int64')).dtype == 'Int32'
+    assert _compact_column(pd.Series([None, None], dtype='Int64')).dtype == 'Int32'
+    assert _compact_column(pd.Series([1, 2], dtype='int32')) is None
+
+
+def test_float32_only_when_lossless():
+    compact = _compact_column(pd.Series([0.5, 1.25, np.nan, 1e6]))
+    assert compact.dtype == np.float32
+    assert compact.astype(float).equals(pd.Series([0.5, 1.25, np.nan, 1e6]))
+    # Centavos não cabem em float32 sem mudar o valor
+    assert _compact_column(pd.Series([0.1, 1234.56])) is None
+    assert _compact_column(pd.Series([2.0 ** 40 + 1])) is None
+
+
+def test_repeated_text_becomes_category():
+    repeated = pd.Series(['Ana', 'Bruno', None, 'Ana', 'Bruno', 'Ana'])
+    assert isinstance(_compact_column(repeated).dtype, pd.CategoricalDtype)
+    assert _compact_column(pd.Series(['Ana', 'Bruno', 'Caio', 'Davi'])) is None
+    # Texto misturado com números fica como está
+    assert _compact_column(pd.Series(['Ana', 1, 'Ana', 'Ana'], dtype=object)) is None
+    assert _compact_column(pd.Series([True, False, True])) is None
+
+
+def test_small_sheet_keeps_dtypes_but_drops_empty_rows_and_columns():
+    df = pd.DataFrame({'Assessor': ['Ana', None, 'Ana'], 'Total': [1, None, 2], 'Unnamed: 2': [None] * 3})
+    compact, before, after = compact_sheet('assessores', df)
+    assert list(compact.columns) == ['Assessor', 'Total']
+    assert compact.index.tolist() == [0, 2]
+    assert compact['Total'].dtype == np.float64
+    assert before > after > 0
+
+
+def test_large_sheet_is_compacted_in_place():
+    n = COMPACT_MIN_ROWS
+    df = pd.DataFrame({'Assessor': ['Ana', 'Bruno'] * (n // 2), 'Qtd': np.arange(n), 'Nota': [0.5] * n,
+                       'Valor': [0.1] * n})
+    compact, before, after = compact_sheet('assessores', df)
+    assert isinstance(compact['Assessor'].dtype, pd.CategoricalDtype)
+    assert compact['Qtd'].dtype == np.int32
+    assert compact['Nota'].dtype == np.float32
+    # Coluna que não muda de tipo é a mesma, sem cópia
+    assert compact['Valor'].dtype == np.float64
+    assert np.shares_memory(compact['Valor'].to_numpy(), df['Valor'].to_numpy())
+    assert after < before
+
+    same, before, after = compact_sheet('assessores', compact)
+    assert same is compact and before == after
@@ -0,0 +1,33 @@
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from snapshot import make_server
+
+
+@pytest.fixture
+def server(tmp_path):
+    (tmp_path / ('a' * 64 + '-v1.html')).write_text('<p>página</p>', encoding='utf-8')
+    server = make_server(str(tmp_path), port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_binds_to_localhost_by_default(server):
+    assert server.server_address[0] == '127.0.0.1'
+
+
+def test_root_does_not_reveal_pages(server):
+    base = f'http://127.0.0.1:{server.server_address[1]}'
+    for path in ('/', '/index.html'):
+        with pytest.raises(urllib.error.HTTPError) as err:
+            urllib.request.urlopen(base + path, timeout=5)
+        assert err.value.code == 404
+        assert 'max-age' not in err.value.headers.get('Cache-Control', '')
+    with urllib.request.urlopen(f'{base}/{"a" * 64}-v1.html', timeout=5) as resp:
+        assert resp.read().decode('utf-8') == '<p>página</p>'
+        assert 'max-age' in resp.headers['Cache-Control']
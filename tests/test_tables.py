@@ -0,0 +1,57 @@
+import pandas as pd
+
+from formatting import format_currency_series
+from schema import MONEY
+from tables import display_values, paginate, sort_key
+
+NAMES = ['bruno', 'Álvaro', None, 'ana', 'Carla']
+
+
+def test_text_sorts_ignoring_case_and_accents():
+    df = pd.DataFrame({'Assessor': NAMES, 'n': range(5)})
+    page, total, pages = paginate(df, 1, 10, 'Assessor')
+    assert page['Assessor'].tolist()[:4] == ['Álvaro', 'ana', 'bruno', 'Carla']
+    assert pd.isna(page['Assessor'].iloc[4])
+    page, _, _ = paginate(df, 1, 10, 'Assessor', ascending=False)
+    assert page['Assessor'].tolist()[:4] == ['Carla', 'bruno', 'ana', 'Álvaro']
+    assert (total, pages) == (5, 1)
+
+
+def test_categorical_text_sorts_like_plain_text():
+    categorical = pd.Series(NAMES, dtype='category')
+    assert sort_key(categorical).tolist() == sort_key(pd.Series(NAMES, dtype=object)).tolist()
+    df = pd.DataFrame({'Assessor': categorical})
+    page, _, _ = paginate(df, 1, 10, 'Assessor')
+    assert page['Assessor'].tolist()[:4] == ['Álvaro', 'ana', 'bruno', 'Carla']
+    # Sem vazios o map de uma categoria devolve outra categoria, na ordem antiga
+    df = pd.DataFrame({'Assessor': pd.Series(['bruno', 'Álvaro', 'ana', 'Carla'], dtype='category')})
+    page, _, _ = paginate(df, 1, 10, 'Assessor')
+    assert page['Assessor'].tolist() == ['Álvaro', 'ana', 'bruno', 'Carla']
+
+
+def test_money_text_sorts_as_numbers():
+    df = pd.DataFrame({'Receita': ['R$ 1.000,00', 'R$ 200,00', 'R$ -', 'R$ 30,50']})
+    page, _, _ = paginate(df, 1, 10, 'Receita')
+    assert page['Receita'].tolist() == ['R$ -', 'R$ 30,50', 'R$ 200,00', 'R$ 1.000,00']
+
+
+def test_page_is_clamped_when_rows_shrink():
+    df = pd.DataFrame({'n': range(25)})
+    page, total, pages = paginate(df, 3, 10)
+    assert page['n'].tolist() == list(range(20, 25)) and pages == 3
+    # O filtro deixou menos linhas: a página 3 pedida antes vira a última
+    page, total, pages = paginate(df.iloc[:12], 3, 10, 'n', ascending=False)
+    assert (total, pages) == (12, 2)
+    assert page['n'].tolist() == [1, 0]
+    page, _, _ = paginate(df.iloc[:0], 2, 10)
+    assert page.empty
+    page, _, _ = paginate(df, 0, 10)
+    assert page['n'].tolist() == list(range(10))
+
+
+def test_money_text_keeps_its_sign_and_pt_br_decimals():
+    raw = pd.Series(['-500', 'R$ 1.234,56', 'R$ -', '(10,50)', None, 'abc'])
+    assert display_values(raw, MONEY).tolist() == [-500.0, 1234.56, 0.0, -10.5, 0.0, 0.0]
+    typed = pd.Series([-500.0, None])
+    assert display_values(typed, MONEY).tolist() == [-500.0, 0.0]
+    assert format_currency_series(display_values(raw, MONEY))[0] == 'R$ -500,00'
@@ -0,0 +1,67 @@
+import os
+import time
+
+from test_ingest import HOT_MONEY, _xlsx
+from watcher import FolderWatcher
+from workbook_cache import WorkbookCache
+
+
+def _write(folder, name, data, age=0):
+    path = os.path.join(folder, name)
+    with open(path, 'wb') as fh:
+        fh.write(data)
+    mtime = time.time() - age
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_new_file_is_read_only_once_it_stops_changing(tmp_path):
+    watcher = FolderWatcher(str(tmp_path), WorkbookCache(), interval=60)
+    path = _write(tmp_path, 'base.xlsx', _xlsx({'Hot Money': HOT_MONEY}))
+    # Recém-gravado: pode estar pela metade, espera uma volta
+    assert not watcher.poll()
+    assert watcher.current is None
+    assert watcher.poll()
+    assert watcher.current.path == path
+    assert watcher.current.sheets['Hot Money']['Assessor'].tolist() == ['Ana', 'Bruno']
+    # Sem mudança: nada a publicar
+    assert not watcher.poll()
+
+
+def test_file_that_keeps_changing_waits_again(tmp_path):
+    watcher = FolderWatcher(str(tmp_path), WorkbookCache(), interval=60)
+    _write(tmp_path, 'base.xlsx', b'PK')
+    assert not watcher.poll()
+    _write(tmp_path, 'base.xlsx', _xlsx({'Hot Money': HOT_MONEY}))
+    assert not watcher.poll()
+    assert watcher.current is None and watcher.error is None
+    assert watcher.poll()
+
+
+def test_old_file_is_read_at_once(tmp_path):
+    watcher = FolderWatcher(str(tmp_path), WorkbookCache(), interval=60)
+    _write(tmp_path, 'base.xlsx', _xlsx({'Hot Money': HOT_MONEY}), age=120)
+    # Arquivo de trava do Excel não conta
+    _write(tmp_path, '~$base.xlsx', b'trava')
+    assert watcher.poll()
+    assert os.path.basename(watcher.current.path) == 'base.xlsx'
+
+
+def test_failed_read_keeps_the_previous_version(tmp_path):
+    watcher = FolderWatcher(str(tmp_path), WorkbookCache(), interval=60)
+    _write(tmp_path, 'base.xlsx', _xlsx({'Hot Money': HOT_MONEY}), age=120)
+    assert watcher.poll()
+    previous = watcher.current
+
+    _write(tmp_path, 'nova.xlsx', b'PK\x03\x04 corrompido', age=60)
+    assert not watcher.poll()
+    assert watcher.current is previous
+    assert watcher.error.startswith('nova.xlsx: ')
+    # O arquivo com erro não é lido de novo a cada volta
+    assert not watcher.poll()
+
+    # Uma versão boa publica de novo e limpa o erro
+    _write(tmp_path, 'nova.xlsx', _xlsx({'Hot Money': HOT_MONEY[:2]}), age=90)
+    assert watcher.poll()
+    assert watcher.error is None
+    assert watcher.current.sheets['Hot Money']['Assessor'].tolist() == ['Ana']
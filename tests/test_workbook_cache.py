@@ -0,0 +1,83 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+import workbook_cache
+from advisors import build_advisor_index
+from test_ingest import HOT_MONEY, _xlsx
+from workbook_cache import WorkbookCache
+
+
+class SlowWorkbook:
+    """LazyWorkbook falso: a leitura só termina quando ``release`` é liberado"""
+
+    release = threading.Event()
+    started = threading.Event()
+    built = []
+
+    def __init__(self, data, cache=None, digest=None):
+        self.built.append(data)
+        if data == b'lento':
+            self.started.set()
+            self.release.wait(5)
+        self.nbytes = len(data)
+
+
+def test_build_runs_outside_the_global_lock(monkeypatch):
+    monkeypatch.setattr(workbook_cache, 'LazyWorkbook', SlowWorkbook)
+    cache = WorkbookCache()
+    fast, _ = cache.get(b'rapido')
+    results = []
+
+    def slow_get():
+        results.append(cache.get(b'lento'))
+
+    threads = [threading.Thread(target=slow_get, daemon=True) for _ in range(2)]
+    threads[0].start()
+    assert SlowWorkbook.started.wait(5)
+    threads[1].start()
+
+    # Outro arquivo não espera a leitura em andamento
+    done = threading.Event()
+    other = threading.Thread(target=lambda: (cache.get(b'rapido'), done.set()), daemon=True)
+    other.start()
+    assert done.wait(2), "get de outro arquivo travou durante a leitura"
+
+    SlowWorkbook.release.set()
+    for thread in threads:
+        thread.join(5)
+    assert sorted(status for _, status in results) == ['hit', 'miss']
+    assert results[0][0] is results[1][0]
+    # O mesmo arquivo pedido duas vezes ao mesmo tempo é lido uma vez só
+    assert SlowWorkbook.built.count(b'lento') == 1
+    assert cache.get(b'rapido') == (fast, 'hit')
+
+
+def test_evicted_workbook_is_closed():
+    cache = WorkbookCache(max_bytes=1)
+    first, _ = cache.get(_xlsx({'um': HOT_MONEY, 'dois': HOT_MONEY}))
+    first['um']
+    assert first._book is not None
+    cache.get(_xlsx({'outra': HOT_MONEY}))
+    assert first._book is None
+    # Quem ainda usa a planilha que saiu continua lendo as abas
+    assert first['dois']['Assessor'].tolist() == ['Ana', 'Bruno']
+
+
+def test_derived_results_count_toward_the_budget():
+    first_data, second_data = _xlsx({'um': HOT_MONEY}), _xlsx({'outra': HOT_MONEY})
+    sizes = [len(first_data), len(second_data)]
+    cache = WorkbookCache(max_bytes=sum(sizes) + 100_000)
+    first, _ = cache.get(first_data)
+    first['um']
+    before = first.nbytes
+    # Índice sobre a própria aba: só as posições contam, a aba já foi contada
+    index = first.derived('um', build_advisor_index)
+    assert first.nbytes - before == sum(pos.nbytes for pos in index.groups().values())
+
+    big = first.derived_workbook(lambda sheets: pd.DataFrame({'n': np.zeros(20_000)}))
+    assert first.nbytes >= before + big.memory_usage(index=False).sum()
+    # O resultado guardado passa do orçamento: a outra entrada faz a primeira sair
+    cache.get(second_data)
+    assert cache.stats()['em memória'].tolist() == [False, True]
@@ -0,0 +1,352 @@
+"""Tema visual do dashboard (fundo preto e dourado).
+
+``STYLE`` é o bloco ``<style>`` que o dashboard injeta na página; a versão
+estática (``snapshot.py``) usa o mesmo bloco, então as classes dos cards
+(``metric-card``, ``range-card``...) valem nas duas.
+"""
+
+STYLE = """
+<style>
+    * {
+        margin: 0;
+        padding: 0;
+        box-sizing: border-box;
+    }
+
+    /* ===== FUNDO PRINCIPAL ===== */
+    [data-testid="stAppViewContainer"] {
+        background-color: #0d0d0d !important;
+        background-image: none !important;
+    }
+
+    [data-testid="stSidebar"] {
+        background-color: #0d0d0d !important;
+        background-image: none !important;
+    }
+
+    /* ===== SIDEBAR CONTENT ===== */
+    [data-testid="stSidebarContent"] {
+        background-color: #0d0d0d !important;
+    }
+
+    [data-testid="stSidebar"] label,
+    [data-testid="stSidebar"] p,
+    [data-testid="stSidebar"] span,
+    [data-testid="stSidebar"] div {
+        color: #FFD700 !important;
+    }
+
+    /* ===== HEADINGS - TUDO AMARELO ===== */
+    h1, h2, h3, h4, h5, h6 {
+        color: #FFD700 !important;
+    }
+
+    /* ===== TEXTO GERAL ===== */
+    body, p, span, div {
+        color: #E0E0E0 !important;
+    }
+
+    hr {
+        border-color: rgba(255, 215, 0, 0.3) !important;
+    }
+
+    /* ===== METRIC CONTAINER - CARDS PRINCIPAIS (Receita, Forecast, Pace, %, Meta) ===== */
+    [data-testid="metric-container"] {
+        /* MUDANÇA PRINCIPAL: Fundo cinza chumbo sólido e visível */
+        background-color: #2b2b2b !important; 
+        
+        /* Gradiente sutil para dar acabamento premium */
+        background-image: linear-gradient(135deg, #383838 0%, #2b2b2b 100%) !important;
+        
+        padding: 20px !important;
+        border-radius: 12px !important;
+        
+        /* Borda dourada para definir o limite do card */
+        border: 1px solid rgba(255, 215, 0, 0.3) !important;
+        
+        /* Sombra forte para destacar do fundo preto */
+        box-shadow: 0 6px 15px rgba(0, 0, 0, 0.7) !important;
+        
+        /* Garantir que a cor do texto herde corretamente */
+        color: #E0E0E0 !important;
+    }
+
+    [data-testid="metric-container"]:hover {
+        /* Efeito visual ao passar o mouse */
+        border-color: rgba(255, 215, 0, 0.8) !important;
+        box-shadow: 0 8px 25px rgba(0, 0, 0, 0.9) !important;
+        transform: translateY(-2px) !important;
+        background-color: #333333 !important;
+    }
+
+    /* Ajuste forçado para o título do card dentro do container */
+    [data-testid="metric-container"] > div:nth-child(1) {
+        font-size: 14px !important;
+        color: #FFD700 !important; /* Dourado */
+        font-weight: 600 !important;
+    }
+
+    /* Ajuste forçado para o valor do card */
+    [data-testid="metric-container"] > div:nth-child(2) {
+        color: #FFFFFF !important; /* Branco puro para contraste */
+    }
+
+    /* ===== DATAFRAME & TABLE ===== */
+    [data-testid="stDataFrame"],
+    [data-testid="stTable"] {
+        background-color: #1a1a1a !important;
+        color: #E0E0E0 !important;
+    }
+
+    /* ===== BUTTONS ===== */
+    .stButton > button {
+        background: linear-gradient(135deg, #FFD700 0%, #B8860B 100%) !important;
+        color: #0d0d0d !important;
+        border: none !important;
+        padding: 0.6rem 2rem !important;
+        border-radius: 50px !important;
+        font-weight: 700 !important;
+        text-transform: uppercase !important;
+        letter-spacing: 1px !important;
+        transition: all 0.3s ease !important;
+        box-shadow: 0 4px 15px rgba(255, 215, 0, 0.2) !important;
+        width: 100% !important;
+    }
+
+    .stButton > button:hover {
+        transform: translateY(-2px) !important;
+        box-shadow: 0 6px 20px rgba(255, 215, 0, 0.4) !important;
+        color: #000 !important;
+    }
+
+    /* ===== TABS ===== */
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 15px !important;
+        background-color: transparent !important;
+    }
+
+    .stTabs [data-baseweb="tab"] {
+        background-color: #1a1a1a !important;
+        color: #FFD700 !important;
+        border: 1px solid rgba(255, 215, 0, 0.3) !important;
+        border-radius: 8px 8px 0 0 !important;
+        padding: 10px 25px !important;
+        font-weight: 600 !important;
+    }
+
+    .stTabs [aria-selected="true"] {
+        background-color: #FFD700 !important;
+        color: #0d0d0d !important;
+        border: 1px solid #FFD700 !important;
+    }
+
+    /* ===== INFO CARDS (Missões) ===== */
+    .info-card {
+        background: linear-gradient(135deg, #0d0d0d 0%, #1a1a1a 100%) !important;
+        padding: 20px !important;
+        border-radius: 12px !important;
+        border: 1px solid rgba(255, 215, 0, 0.5) !important;
+        margin-bottom: 20px !important;
+        color: #E0E0E0 !important;
+        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.8) !important;
+        backdrop-filter: blur(10px) !important;
+    }
+
+    .info-card h3 {
+        color: #FFD700 !important;
+        margin-bottom: 15px !important;
+        border-bottom: 1px solid rgba(255, 215, 0, 0.3) !important;
+        padding-bottom: 10px !important;
+    }
+
+    .info-card ul {
+        list-style-type: none !important;
+        padding-left: 0 !important;
+    }
+
+    .info-card li {
+        margin-bottom: 10px !important;
+        padding-left: 20px !important;
+        position: relative !important;
+    }
+
+    /* ===== OBJETIVO CARD ===== */
+    .objetivo-card-dark {
+        background: linear-gradient(135deg, #1a3050 0%, #0d1f35 100%) !important;
+        padding: 25px !important;
+        border-radius: 12px !important;
+        color: white !important;
+        text-align: center !important;
+        margin-top: 30px !important;
+        border: 1px solid rgba(255, 215, 0, 0.4) !important;
+        box-shadow: 0 4px 15px rgba(0, 0, 0, 0.8) !important;
+        backdrop-filter: blur(10px) !important;
+    }
+
+    .objetivo-card-dark h3 {
+        color: #FFD700 !important;
+        margin-bottom: 15px !important;
+    }
+
+    /* ===== PROGRESS BAR ===== */
+    .progress-bar {
+        background: rgba(255, 255, 255, 0.1) !important;
+        height: 8px !important;
+        border-radius: 4px !important;
+        margin-top: 10px !important;
+        overflow: hidden !important;
+        border: 1px solid rgba(255, 215, 0, 0.2) !important;
+    }
+
+    .progress-fill {
+        height: 100% !important;
+        background: linear-gradient(90deg, #4a9dd4 0%, #2a7db3 100%) !important;
+        border-radius: 4px !important;
+        box-shadow: 0 0 10px rgba(74, 157, 212, 0.5) !important;
+    }
+
+    /* ===== RANGE CARDS ===== */
+    .range-card {
+        background: linear-gradient(135deg, #1a3050 0%, #0d1f35 100%) !important;
+        padding: 15px !important;
+        border-radius: 10px !important;
+        color: white !important;
+        margin: 5px 0 !important;
+        border-left: 4px solid rgba(255, 215, 0, 0.5) !important;
+        box-shadow: 0 2px 8px rgba(0, 0, 0, 0.8) !important;
+        backdrop-filter: blur(5px) !important;
+    }
+
+    .range-title {
+        font-weight: bold !important;
+        font-size: 14px !important;
+        margin-bottom: 5px !important;
+        color: #FFD700 !important;
+    }
+
+    .range-classification {
+        font-size: 12px !important;
+        opacity: 0.9 !important;
+        margin-bottom: 8px !important;
+        font-weight: 500 !important;
+        color: #E0E0E0 !important;
+    }
+
+    .range-info {
+        display: flex !important;
+        justify-content: space-between !important;
+        font-size: 12px !important;
+        color: #E0E0E0 !important;
+    }
+
+    /* ===== CONTAINER PARA CARDS ALINHADOS ===== */
+    .metrics-container {
+        display: grid !important;
+        grid-template-columns: repeat(auto-fit, minmax(280px, 1fr)) !important;
+        gap: 20px !important;
+        margin-bottom: 30px !important;
+        width: 100% !important;
+    }
+
+    /* ===== CARDS PRINCIPAIS ===== */
+    .metric-card {
+        background: linear-gradient(135deg, #0d0d0d 0%, #1a1a1a 100%) !important;
+        padding: 25px !important;
+        border-radius: 12px !important;
+        border: 1px solid rgba(255, 215, 0, 0.5) !important;
+        box-shadow: 0 4px 15px rgba(0, 0, 0, 0.8) !important;
+        color: #E0E0E0 !important;
+        backdrop-filter: blur(15px) !important;
+        transition: all 0.3s ease !important;
+    }
+
+    .metric-card-title {
+        font-size: 13px !important;
+        color: #FFD700 !important;
+        font-weight: 600 !important;
+        margin-bottom: 12px !important;
+        text-transform: uppercase !important;
+        letter-spacing: 0.5px !important;
+        opacity: 0.9 !important;
+    }
+
+    .metric-card-value {
+        font-size: 28px !important;
+        font-weight: 700 !important;
+        color: #E0E0E0 !important;
+        line-height: 1.3 !important;
+        margin-bottom: 5px !important;
+    }
+
+    .metric-card:hover {
+        border-color: rgba(255, 215, 0, 0.8) !important;
+        box-shadow: 0 6px 20px rgba(255, 215, 0, 0.2) !important;
+        transform: translateY(-2px) !important;
+    }
+
+    /* ===== CARDS SECUNDÁRIOS ===== */
+    .secondary-metrics-container {
+        display: grid !important;
+        grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)) !important;
+        gap: 20px !important;
+        margin-top: 20px !important;
+    }
+
+    .secondary-metric-card {
+        background: linear-gradient(135deg, #1a3050 0%, #0d1f35 100%) !important;
+        padding: 20px !important;
+        border-radius: 12px !important;
+        border: 1px solid rgba(255, 215, 0, 0.4) !important;
+        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.8) !important;
+        backdrop-filter: blur(10px) !important;
+        transition: all 0.3s ease !important;
+    }
+
+    .secondary-metric-card-title {
+        font-size: 12px !important;
+        color: #FFD700 !important;
+        font-weight: 600 !important;
+        margin-bottom: 10px !important;
+        text-transform: uppercase !important;
+        opacity: 0.9 !important;
+    }
+
+    .secondary-metric-card-value {
+        font-size: 26px !important;
+        font-weight: 700 !important;
+        color: #E0E0E0 !important;
+    }
+
+    .secondary-metric-card:hover {
+        border-color: rgba(255, 215, 0, 0.6) !important;
+        box-shadow: 0 5px 15px rgba(255, 215, 0, 0.15) !important;
+        transition: all 0.3s ease !important;
+    }
+
+    /* ===== RESPONSIVO PARA MOBILE ===== */
+    @media (max-width: 768px) {
+        [data-testid="metric-container"] > div:nth-child(2) {
+            font-size: 20px !important;
+        }
+
+        .metric-card-value {
+            font-size: 20px !important;
+        }
+
+        .secondary-metric-card-value {
+            font-size: 18px !important;
+        }
+
+        .metrics-container {
+            grid-template-columns: 1fr !important;
+        }
+    }
+
+    /* ===== RESPONSIVO PARA TABLET ===== */
+    @media (max-width: 1024px) {
+        .metrics-container {
+            grid-template-columns: repeat(2, 1fr) !important;
+        }
+    }
+</style>
+"""
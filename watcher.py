@@ -0,0 +1,107 @@
+"""Modo pasta monitorada: a planilha mais recente de uma pasta vale para todas as sessões.
+
+Ligado por ``DASHVERTIQ_WATCH_DIR``. Uma thread confere a pasta a cada
+``WATCH_INTERVAL`` segundos; quando aparece uma versão nova (outro arquivo,
+ou o mesmo com outra data ou tamanho), ela é lida inteira em segundo plano
+pelo ``WorkbookCache`` (abas iguais às da versão anterior vêm do cache) e só
+então substitui a anterior, de uma vez. As sessões pegam ``current`` no
+começo de cada execução: nunca veem uma versão pela metade nem esperam a
+leitura, e a versão nova aparece na próxima execução de cada uma.
+"""
+import glob
+import os
+import threading
+import time
+from collections import namedtuple
+
+WATCH_DIR = os.environ.get('DASHVERTIQ_WATCH_DIR') or None
+WATCH_PATTERN = os.environ.get('DASHVERTIQ_WATCH_PATTERN', '*.xls*')
+WATCH_INTERVAL = float(os.environ.get('DASHVERTIQ_WATCH_INTERVAL', 5))
+
+# Versão publicada: o ``ingest.LazyWorkbook`` já lido, o arquivo, a data do
+# arquivo e quando a leitura terminou
+Dataset = namedtuple('Dataset', ['sheets', 'path', 'mtime', 'loaded'])
+
+
+def latest_file(folder, pattern=WATCH_PATTERN):
+    """(caminho, data, tamanho) da planilha mais recente da pasta, ou None"""
+    newest = None
+    for path in glob.glob(os.path.join(folder, pattern)):
+        # '~$...' é o arquivo de trava do Excel aberto
+        if os.path.basename(path).startswith(('~$', '.')):
+            continue
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        if newest is None or stat.st_mtime > newest[1]:
+            newest = (path, stat.st_mtime, stat.st_size)
+    return newest
+
+
+class FolderWatcher:
+    """Confere a pasta e publica em ``current`` cada versão nova, já lida.
+
+    Um arquivo só é lido depois de passar uma volta sem mudar de data nem de
+    tamanho (ou se já era antigo quando foi visto), para não pegar uma cópia
+    pela metade. Se a leitura falha, a versão anterior continua publicada e
+    o erro fica em ``error``.
+    """
+
+    def __init__(self, folder, workbook_cache, pattern=WATCH_PATTERN, interval=WATCH_INTERVAL):
+        self.folder = folder
+        self.workbook_cache = workbook_cache
+        self.pattern = pattern
+        self.interval = interval
+        self.current = None
+        self.error = None
+        self._seen = None
+        self._pending = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='watch-folder', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                self.error = str(e)
+            self._stop.wait(self.interval)
+
+    def poll(self):
+        """Confere a pasta uma vez; retorna True se publicou uma versão nova"""
+        found = latest_file(self.folder, self.pattern)
+        if found is None or found == self._seen:
+            self._pending = None
+            return False
+        if found != self._pending and time.time() - found[1] < self.interval:
+            # Ainda pode estar sendo copiado: confere de novo na próxima volta
+            self._pending = found
+            return False
+        self._pending = None
+        self._seen = found
+        path, mtime, _ = found
+        try:
+            sheets, _ = self.workbook_cache.get(path)
+            # Lê todas as abas aqui, fora das sessões
+            for name in sheets:
+                sheets[name]
+        except Exception as e:
+            self.error = f"{os.path.basename(path)}: {e}"
+            return False
+        self.error = None
+        # Uma única atribuição: quem ler ``current`` pega a versão anterior ou a nova, inteira
+        self.current = Dataset(sheets, path, mtime, time.time())
+        return True
@@ -0,0 +1,273 @@
+"""Caches das planilhas já lidas: em disco (``DiskCache``) e em memória (``WorkbookCache``).
+
+O cache em disco tem duas áreas, ambas endereçadas por conteúdo:
+
+- ``workbooks/<sha256 do arquivo>.json``: versão da leitura, nomes das abas e
+  a chave de conteúdo de cada aba;
+- ``sheets/<chave da aba>.parquet``: o DataFrame da aba.
+
+Como as abas são guardadas pela chave do seu conteúdo (ver
+``ingest.sheet_hashes``), um novo upload em que só uma ou duas abas mudaram
+reaproveita todas as outras. Sobrevive a reinícios do servidor e é
+compartilhado por quem subir o mesmo arquivo.
+
+O cache em memória guarda os ``LazyWorkbook`` abertos pelo dashboard, um por
+conteúdo de arquivo, dentro de um orçamento de memória.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+import pandas as pd
+
+from ingest import INGEST_VERSION, LazyWorkbook, file_bytes
+
+CACHE_DIR = os.environ.get('DASHVERTIQ_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'dashvertiq'))
+CACHE_MAX_MB = float(os.environ.get('DASHVERTIQ_CACHE_MB', '512'))
+MEMORY_MAX_MB = float(os.environ.get('DASHVERTIQ_MEMORY_MB', '1024'))
+# Arquivos fora da memória cujas estatísticas ainda são guardadas
+STATS_SIZE = 200
+
+
+def _write_atomic(path, write):
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    write(tmp)
+    os.replace(tmp, path)
+
+
+def _touch(path):
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+class DiskCache:
+    """Abas lidas guardadas em disco, com limite de tamanho e carimbo de versão.
+
+    Manifestos gravados por outra versão da leitura (``INGEST_VERSION``) são
+    descartados; a versão também entra na chave de cada aba. Quando o total
+    passa de ``max_bytes``, os arquivos usados há mais tempo são removidos
+    primeiro.
+    """
+
+    def __init__(self, root=CACHE_DIR, max_bytes=CACHE_MAX_MB * 1024 * 1024, version=INGEST_VERSION):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.version = version
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(self.root, 'workbooks'), exist_ok=True)
+        os.makedirs(os.path.join(self.root, 'sheets'), exist_ok=True)
+
+    def _workbook_path(self, digest):
+        return os.path.join(self.root, 'workbooks', f'{digest}.json')
+
+    def _sheet_path(self, key):
+        return os.path.join(self.root, 'sheets', key)
+
+    def workbook(self, digest):
+        """Manifesto do arquivo ({'sheets': [...], 'keys': {...}}) ou None"""
+        path = self._workbook_path(digest)
+        try:
+            with open(path, encoding='utf-8') as fh:
+                manifest = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        if manifest.get('version') != self.version:
+            # Gravado por outra versão da leitura: não vale mais
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        _touch(path)
+        return manifest
+
+    def store_workbook(self, digest, names, keys):
+        manifest = {'version': self.version, 'sheets': list(names), 'keys': dict(keys), 'created': time.time()}
+
+        def write(tmp):
+            with open(tmp, 'w', encoding='utf-8') as fh:
+                json.dump(manifest, fh, ensure_ascii=False)
+        _write_atomic(self._workbook_path(digest), write)
+
+    def load_sheet(self, key):
+        base = self._sheet_path(key)
+        try:
+            if os.path.exists(base + '.parquet'):
+                df = pd.read_parquet(base + '.parquet')
+                _touch(base + '.parquet')
+            elif os.path.exists(base + '.pkl'):
+                df = pd.read_pickle(base + '.pkl')
+                _touch(base + '.pkl')
+            else:
+                return None
+        except Exception:
+            return None
+        return df
+
+    def store_sheet(self, key, df):
+        base = self._sheet_path(key)
+        try:
+            _write_atomic(base + '.parquet', lambda tmp: df.to_parquet(tmp, index=True))
+        except Exception:
+            # Colunas com tipos misturados (texto e número) não cabem no
+            # Parquet; essas abas ficam em pickle
+            _write_atomic(base + '.pkl', lambda tmp: df.to_pickle(tmp))
+        self.evict()
+
+    def load_meta(self, key):
+        """Informações extras gravadas junto com a aba (ex.: relatório de conversão)"""
+        try:
+            with open(self._sheet_path(key) + '.json', encoding='utf-8') as fh:
+                return json.load(fh)
+        except (OSError, ValueError):
+            return {}
+
+    def store_meta(self, key, meta):
+        def write(tmp):
+            with open(tmp, 'w', encoding='utf-8') as fh:
+                json.dump(meta, fh, ensure_ascii=False)
+        _write_atomic(self._sheet_path(key) + '.json', write)
+
+    def evict(self):
+        """Remove os arquivos menos usados até caber em ``max_bytes``"""
+        with self._lock:
+            files = []
+            for area in ('workbooks', 'sheets'):
+                folder = os.path.join(self.root, area)
+                for name in os.listdir(folder):
+                    path = os.path.join(folder, name)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    files.append((stat.st_mtime, stat.st_size, path))
+            total = sum(size for _, size, _ in files)
+            for _, size, path in sorted(files):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+
+
+class WorkbookCache:
+    """Planilhas abertas (``ingest.LazyWorkbook``) compartilhadas entre sessões.
+
+    A chave é o sha256 do arquivo: sessões que sobem arquivos idênticos usam a
+    mesma entrada. O tamanho de cada entrada (``LazyWorkbook.nbytes``: o
+    arquivo, as abas lidas e os índices e tabelas guardados por ``derived``)
+    cresce com o uso, por isso o total é conferido a cada ``get``;
+    passando de ``max_bytes``, saem as entradas usadas há mais tempo (a última
+    usada nunca sai). Quem já está com a planilha aberta continua com ela.
+    """
+
+    def __init__(self, max_bytes=MEMORY_MAX_MB * 1024 * 1024, disk_cache=None):
+        self.max_bytes = max_bytes
+        self.disk_cache = disk_cache
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        # Leituras em andamento: digest -> Future com o ``LazyWorkbook``
+        self._building = {}
+        # Estatísticas por arquivo, mantidas mesmo depois que a entrada sai
+        self._stats = {}
+
+    def _entry_stats(self, digest):
+        return self._stats.setdefault(digest, {'hits': 0, 'misses': 0, 'evictions': 0, 'last_used': None})
+
+    def get(self, file):
+        """Retorna (workbook, 'hit' ou 'miss') para o upload ``file``.
+
+        A leitura do arquivo (``LazyWorkbook``) roda fora da trava geral, para
+        quem pede outro arquivo não esperar; quem pede o mesmo arquivo durante
+        a leitura espera por ela em vez de ler de novo.
+        """
+        data = file_bytes(file)
+        digest = hashlib.sha256(data).hexdigest()
+        evicted = []
+        with self._lock:
+            stats = self._entry_stats(digest)
+            stats['last_used'] = time.time()
+            workbook = self._entries.get(digest)
+            if workbook is not None:
+                self._entries.move_to_end(digest)
+                stats['hits'] += 1
+                evicted = self._evict()
+            else:
+                building = self._building.get(digest)
+                owner = building is None
+                if owner:
+                    stats['misses'] += 1
+                    building = self._building[digest] = Future()
+                else:
+                    stats['hits'] += 1
+        if workbook is not None:
+            self._close(evicted)
+            return workbook, 'hit'
+        if not owner:
+            return building.result(), 'hit'
+        try:
+            workbook = LazyWorkbook(data, cache=self.disk_cache, digest=digest)
+        except BaseException as e:
+            with self._lock:
+                del self._building[digest]
+            building.set_exception(e)
+            raise
+        with self._lock:
+            self._entries[digest] = workbook
+            del self._building[digest]
+            evicted = self._evict()
+        building.set_result(workbook)
+        self._close(evicted)
+        return workbook, 'miss'
+
+    def _evict(self):
+        """Tira as entradas que passam do orçamento; retorna as que saíram"""
+        evicted = []
+        total = sum(workbook.nbytes for workbook in self._entries.values())
+        while total > self.max_bytes and len(self._entries) > 1:
+            digest, workbook = self._entries.popitem(last=False)
+            total -= workbook.nbytes
+            self._stats[digest]['evictions'] += 1
+            evicted.append(workbook)
+        gone = [digest for digest in self._stats if digest not in self._entries and digest not in self._building]
+        if len(gone) > STATS_SIZE:
+            gone.sort(key=lambda digest: self._stats[digest]['last_used'])
+            for digest in gone[:len(gone) - STATS_SIZE]:
+                del self._stats[digest]
+        return evicted
+
+    @staticmethod
+    def _close(evicted):
+        # Fora da trava geral: ``close`` espera a leitura de aba em andamento
+        for workbook in evicted:
+            workbook.close()
+
+    @property
+    def nbytes(self):
+        with self._lock:
+            return sum(workbook.nbytes for workbook in self._entries.values())
+
+    def stats(self):
+        """Uma linha por arquivo já pedido: acertos, leituras, remoções e tamanho atual"""
+        with self._lock:
+            rows = []
+            for digest, stats in self._stats.items():
+                workbook = self._entries.get(digest)
+                rows.append({
+                    'arquivo': digest[:12],
+                    'em memória': workbook is not None,
+                    'MB': round(workbook.nbytes / 1024 ** 2, 3) if workbook is not None else 0.0,
+                    'hits': stats['hits'],
+                    'misses': stats['misses'],
+                    'evictions': stats['evictions'],
+                    'último uso': time.strftime('%H:%M:%S', time.localtime(stats['last_used'])),
+                })
+        return pd.DataFrame(rows, columns=['arquivo', 'em memória', 'MB', 'hits', 'misses', 'evictions', 'último uso'])